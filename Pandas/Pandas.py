@@ -1,14 +1,153 @@
-
+# Waitlist analytics: long waitlist analysis, allocation of free seats and an overflow class, saved as an Excel report.
+# - Reads the courses and the waitlist straight from the database by default, or from an Excel workbook with --excel.
+# - Nothing runs on import; call `run_pipeline` or run the module.
+# - Inputs are cached as columnar snapshots (Feather) and reused while the source is unchanged.
+# Usage: python Pandas/Pandas.py [--excel Pandas/learning_center_project_data.xlsx] [--output Pandas/advanced_waitlist_report.xlsx]
+import argparse
+import bisect
+import hashlib
+import json
+import sys
+import time
+from itertools import islice
 import dotenv
 import pandas as pd
-from datetime import datetime
+from datetime import timedelta
 import os
 dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+import databaseManager.database_manager as database_manager
+from databaseManager.database_manager import DatabaseManager
+
+DEFAULT_CHUNKSIZE = 10_000
+
+# Directory for the columnar snapshots of the analytics inputs (see `load_snapshot`).
+SNAPSHOT_DIR = f"{os.environ['path']}/Pandas/.snapshots"
+
+# The columns the analysis needs from every source, with their dtypes; everything else is never read.
+# - Each database query returns exactly these columns, in this order, already named like the workbook columns.
+ANALYTICS_COLUMNS = {
+    "Courses": {
+        "CourseID": "int64",
+        "CourseName": "string",
+        "TeacherID": "Int64",
+        "Capacity": "int64",
+        "RegisteredStudents": "int64",
+    },
+    "Waitlist": {
+        "WaitlistID": "int64",
+        "CourseID": "int64",
+        "StudentID": "int64",
+        "RequestDate": "datetime64[ns]",
+    },
+    "Teachers": {
+        "TeacherID": "int64",
+        "Specialization": "string",
+    },
+    "ClassRooms": {
+        "ClassRoomID": "int64",
+        "ClassRoomName": "string",
+        "RoomCapacity": "Int64",
+    },
+    "Schedules": {
+        "ClassRoomID": "Int64",
+        "TeacherID": "Int64",
+        "Date": "string",
+        "Time": "string",
+    },
+}
+
+# Tables the report can do without: the overflow planner falls back to default sections when they are missing,
+# e.g. in workbooks that have no "ClassRooms" or "Schedules" sheet.
+OPTIONAL_TABLES = ("Teachers", "ClassRooms", "Schedules")
+
+# Workbook column names that differ from the names in ANALYTICS_COLUMNS.
+EXCEL_COLUMN_NAMES = {
+    "Teachers": {"Specialization": "Expertise"},
+}
+
+# Database queries for the analytics tables; the waitlist is read in FIFO order, which the allocation relies on.
+ANALYTICS_QUERIES = {
+    "Courses": """
+        SELECT c.id, c.name, c.teacher_id, c.max_capacity, COALESCE(e.enrolled, 0)
+        FROM courses c
+        LEFT JOIN (
+            SELECT course_id, COUNT(*) AS enrolled
+            FROM courseEnrollments
+            GROUP BY course_id
+        ) e ON e.course_id = c.id
+        ORDER BY c.id
+    """,
+    "Waitlist": """
+        SELECT id, course_id, student_id, registered_at
+        FROM queue
+        ORDER BY registered_at, id
+    """,
+    "Teachers": """
+        SELECT teacher_id, specialization
+        FROM teachers
+        ORDER BY teacher_id
+    """,
+    "ClassRooms": """
+        SELECT id, name, capacity
+        FROM classRooms
+        ORDER BY id
+    """,
+    "Schedules": """
+        SELECT class_room_id, teacher_id, DATE_FORMAT(date, '%Y-%m-%d'), TIME_FORMAT(time, '%H:%i')
+        FROM schedules
+        WHERE date >= CURDATE()
+    """,
+}
+
+
+
+# Reads one analytics table from the database in chunks of `chunksize` rows into a typed DataFrame.
+# - Rows are streamed with an unbuffered cursor (see `DatabaseManager._stream`); every chunk is converted to
+#   its final dtypes right away, so no untyped copy of the whole table is ever held.
+def read_table_chunks(db_manager, table_name, chunksize=DEFAULT_CHUNKSIZE):
+    columns = ANALYTICS_COLUMNS[table_name]
+    rows = db_manager._stream(ANALYTICS_QUERIES[table_name], batch_size=chunksize, dictionary=False)
+    chunks = []
+    while True:
+        chunk = list(islice(rows, chunksize))
+        if not chunk:
+            break
+        chunks.append(pd.DataFrame.from_records(chunk, columns=list(columns)).astype(columns))
+    if not chunks:
+        return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in columns.items()})
+    return pd.concat(chunks, ignore_index=True)
+
+
+
+# Loads the analytics tables (see ANALYTICS_COLUMNS) straight from the database.
+# - Returns a dictionary of DataFrames keyed like the workbook sheets, or None if the data could not be read.
+def load_database_data(db_manager, chunksize=DEFAULT_CHUNKSIZE):
+    try:
+        data = {table_name: read_table_chunks(db_manager, table_name, chunksize) for table_name in ANALYTICS_COLUMNS}
+        print("Data loaded successfully!")
+        for table_name, table in data.items():
+            print(f"- {table_name}: {len(table)} rows")
+        return data
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+
+
+
 # Step 1: Load Excel Data and Print Overview
+# - Only the sheets and columns in ANALYTICS_COLUMNS are read; the sheets in OPTIONAL_TABLES are skipped if missing.
 def load_excel_data(file_path):
     try:
-        # Load all sheets
-        all_sheets = pd.read_excel(file_path, sheet_name=None)
+        all_sheets = {}
+        with pd.ExcelFile(file_path) as workbook:
+            for sheet_name, columns in ANALYTICS_COLUMNS.items():
+                if sheet_name in OPTIONAL_TABLES and sheet_name not in workbook.sheet_names:
+                    continue
+                excel_names = EXCEL_COLUMN_NAMES.get(sheet_name, {})
+                sheet = pd.read_excel(workbook, sheet_name=sheet_name, usecols=[excel_names.get(column, column) for column in columns])
+                sheet = sheet.rename(columns={excel_name: column for column, excel_name in excel_names.items()})
+                all_sheets[sheet_name] = sheet[list(columns)].astype(columns)
         print("Data loaded successfully!")
         print("Sheets loaded:")
         for sheet_name in all_sheets.keys():
@@ -21,100 +160,546 @@ def load_excel_data(file_path):
         print(f"An error occurred: {e}")
         return None
 
+# Columnar snapshots of the analytics inputs.
+# - Every source (a workbook or a database) is stored once as one Feather file per table plus a JSON file with the
+#   fingerprint of the source it was taken from; later runs memory-map the Feather files instead of re-reading the source.
+# - A snapshot is only used while its fingerprint still matches the source and ANALYTICS_COLUMNS is unchanged.
+# - Needs pyarrow (pip install pyarrow); without it the sources are read directly every time.
+def snapshot_paths(snapshot_dir, source_key, table_names=ANALYTICS_COLUMNS):
+    metadata_path = os.path.join(snapshot_dir, f"{source_key}.json")
+    table_paths = {table_name: os.path.join(snapshot_dir, f"{source_key}.{table_name}.feather") for table_name in table_names}
+    return metadata_path, table_paths
+
+
+
+# Reads the snapshot metadata of a source, or None if there is no usable snapshot.
+def read_snapshot_metadata(snapshot_dir, source_key):
+    metadata_path, _ = snapshot_paths(snapshot_dir, source_key)
+    try:
+        with open(metadata_path, encoding="utf-8") as metadata_file:
+            metadata = json.load(metadata_file)
+    except (OSError, ValueError):
+        return None
+    _, table_paths = snapshot_paths(snapshot_dir, source_key, metadata.get("tables", []))
+    if metadata.get("columns") != ANALYTICS_COLUMNS or "tables" not in metadata or not all(os.path.exists(path) for path in table_paths.values()):
+        return None
+    return metadata
+
+
+
+# Loads the tables of a snapshot by memory-mapping its Feather files; returns None if pyarrow is missing.
+def load_snapshot(snapshot_dir, source_key, table_names):
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return None
+    _, table_paths = snapshot_paths(snapshot_dir, source_key, table_names)
+    return {
+        table_name: feather.read_table(path, memory_map=True).to_pandas()
+        for table_name, path in table_paths.items()
+    }
+
+
+
+# Saves the tables of a source as a snapshot with the given fingerprint.
+# - Files are written under temporary names and renamed into place, metadata last, so a crash never leaves
+#   a snapshot that looks valid but is incomplete.
+# - Does nothing if pyarrow is missing.
+def save_snapshot(snapshot_dir, source_key, data, fingerprint):
+    try:
+        from pyarrow import feather
+    except ImportError:
+        print("pyarrow is not installed; snapshots are disabled (pip install pyarrow).")
+        return
+    os.makedirs(snapshot_dir, exist_ok=True)
+    metadata_path, table_paths = snapshot_paths(snapshot_dir, source_key, data)
+    for table_name, path in table_paths.items():
+        feather.write_feather(data[table_name].reset_index(drop=True), path + ".tmp")
+        os.replace(path + ".tmp", path)
+    with open(metadata_path + ".tmp", "w", encoding="utf-8") as metadata_file:
+        json.dump({"fingerprint": fingerprint, "columns": ANALYTICS_COLUMNS, "tables": list(data)}, metadata_file)
+    os.replace(metadata_path + ".tmp", metadata_path)
+
+
+
+# Returns the SHA-256 checksum of a file, read in 1 MiB blocks.
+def file_checksum(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+
+# Loads the analytics tables of a workbook through its snapshot.
+# - The snapshot is used as is while the workbook's mtime and size are unchanged; if they changed, the workbook's
+#   checksum decides: same content refreshes the stored mtime, new content rebuilds the snapshot.
+# - `refresh` ignores any existing snapshot. Returns the same dictionary as `load_excel_data`, or None.
+def load_excel_data_cached(file_path, snapshot_dir=SNAPSHOT_DIR, refresh=False):
+    started = time.perf_counter()
+    file_path = os.path.abspath(file_path)
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        print(f"Error: File not found at '{file_path}'")
+        return None
+    source_key = "excel-" + hashlib.sha1(file_path.encode("utf-8")).hexdigest()[:12]
+    fingerprint = {"path": file_path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    metadata = None if refresh else read_snapshot_metadata(snapshot_dir, source_key)
+    if metadata is not None:
+        stored = metadata["fingerprint"]
+        if (stored["mtime_ns"], stored["size"]) != (stat.st_mtime_ns, stat.st_size):
+            fingerprint["sha256"] = file_checksum(file_path)
+            if stored.get("sha256") != fingerprint["sha256"]:
+                metadata = None
+        else:
+            fingerprint["sha256"] = stored.get("sha256")
+    data = load_snapshot(snapshot_dir, source_key, metadata["tables"]) if metadata is not None else None
+    if data is not None:
+        if fingerprint != metadata["fingerprint"]:
+            save_snapshot(snapshot_dir, source_key, data, fingerprint)
+        print(f"Data loaded from snapshot in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return data
+    data = load_excel_data(file_path)
+    if data is not None:
+        fingerprint["sha256"] = fingerprint.get("sha256") or file_checksum(file_path)
+        save_snapshot(snapshot_dir, source_key, data, fingerprint)
+    return data
+
+
+
+# Returns the checksums of the tables the analytics read, computed by the server with CHECKSUM TABLE.
+# - Much cheaper than transferring the rows, and any insert, update or delete changes it.
+def database_fingerprint(db_manager):
+    with db_manager._cursor() as cursor:
+        cursor.execute("CHECKSUM TABLE courses, courseEnrollments, queue, teachers, classRooms, schedules")
+        return {table.split(".")[-1]: checksum for table, checksum in cursor.fetchall()}
+
+
+
+# Loads the analytics tables of the database through its snapshot.
+# - The snapshot is used while the table checksums (see `database_fingerprint`) are unchanged; otherwise the
+#   tables are read again with `load_database_data` and the snapshot is rebuilt.
+# - `refresh` ignores any existing snapshot. Returns the same dictionary as `load_database_data`, or None.
+def load_database_data_cached(db_manager, snapshot_dir=SNAPSHOT_DIR, chunksize=DEFAULT_CHUNKSIZE, refresh=False):
+    started = time.perf_counter()
+    source_key = f"db-{database_manager.DATABASE_NAME}"
+    try:
+        fingerprint = database_fingerprint(db_manager)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        return None
+    metadata = None if refresh else read_snapshot_metadata(snapshot_dir, source_key)
+    if metadata is not None and metadata["fingerprint"] == fingerprint:
+        data = load_snapshot(snapshot_dir, source_key, metadata["tables"])
+        if data is not None:
+            print(f"Data loaded from snapshot in {(time.perf_counter() - started) * 1000:.1f} ms")
+            return data
+    data = load_database_data(db_manager, chunksize)
+    if data is not None:
+        save_snapshot(snapshot_dir, source_key, data, fingerprint)
+    return data
+
+
+
 # Step 2: Perform Long Waitlist Analysis
-def analyze_waitlist(waitlist_df, courses_df):
-    waitlist_analysis = (
-        waitlist_df.merge(courses_df, on="CourseID")
-        .groupby("CourseName")
-        .agg(
-            Number_of_Students=("StudentID", "count"),
-            Average_Wait_Time=("RequestDate", lambda x: (pd.to_datetime("today") - pd.to_datetime(x)).dt.days.mean()),
-        )
-        .reset_index()
-    )
+# - Parses the request dates once and computes every wait (in whole days until `today`, default now) as one column.
+# - Aggregates per course with built-in groupby reducers: number of students, and the mean, median (p50),
+#   90th percentile and longest wait, since the mean alone hides the worst waits.
+# - Prints the analysis per course when `verbose` is True and returns it as a DataFrame.
+def analyze_waitlist(waitlist_df, courses_df, today=None, verbose=True):
+    today = pd.Timestamp.today() if today is None else pd.Timestamp(today)
+    waits = waitlist_df[["CourseID", "StudentID"]].assign(
+        WaitDays=(today - pd.to_datetime(waitlist_df["RequestDate"])).dt.days
+    ).merge(courses_df[["CourseID", "CourseName"]], on="CourseID")
+    by_course = waits.groupby("CourseName")
+    wait_days = by_course["WaitDays"]
+    waitlist_analysis = pd.DataFrame({
+        "Number_of_Students": by_course["StudentID"].count(),
+        "Average_Wait_Time": wait_days.mean(),
+        "P50_Wait_Time": wait_days.quantile(0.5),
+        "P90_Wait_Time": wait_days.quantile(0.9),
+        "Max_Wait_Time": wait_days.max(),
+    }).reset_index()
 
-    print("--- Long Waitlist Analysis ---")
-    for _, row in waitlist_analysis.iterrows():
-        print(f"Course: {row['CourseName']}")
-        print(f"Number of Students in Waitlist: {int(row['Number_of_Students'])}")
-        print(f"Average Wait Time: {int(row['Average_Wait_Time'])} days")
+    if verbose:
+        print("--- Long Waitlist Analysis ---")
+        for course_name, students, average, p50, p90, longest in zip(
+            waitlist_analysis["CourseName"], waitlist_analysis["Number_of_Students"],
+            waitlist_analysis["Average_Wait_Time"], waitlist_analysis["P50_Wait_Time"],
+            waitlist_analysis["P90_Wait_Time"], waitlist_analysis["Max_Wait_Time"],
+        ):
+            print(f"Course: {course_name}")
+            print(f"Number of Students in Waitlist: {int(students)}")
+            print(f"Average Wait Time: {int(average)} days")
+            print(f"Wait Time p50 / p90 / max: {int(p50)} / {int(p90)} / {int(longest)} days")
     return waitlist_analysis
 
 # Step 3: Allocation Algorithm
-def allocate_students(students_df, courses_df, waitlist_df, teachers_df):
-    allocations = []
-    new_classes = []
-    overflow_students = []
-
-    for _, course_row in courses_df.iterrows():
-        course_name = course_row["CourseName"]
-        course_id = course_row["CourseID"]
-        capacity = course_row["Capacity"]
-        registered_students = course_row["RegisteredStudents"]
-
-        print(f"Processing Course: {course_name}")
-
-        # Students in waitlist for this course
-        course_waitlist = waitlist_df[waitlist_df["CourseID"] == course_id]
-
-        if not course_waitlist.empty:
-            if registered_students < capacity:
-                available_spots = capacity - registered_students
-                students_to_add = min(len(course_waitlist), available_spots)
-                allocations.extend(course_waitlist.head(students_to_add)["StudentID"].tolist())
-                registered_students += students_to_add
-                remaining_waitlist = len(course_waitlist) - students_to_add
-
-                print(f"- Successfully added {students_to_add} students from waitlist.")
-                print(f"- Remaining students in waitlist: {remaining_waitlist}")
-            else:
-                print(f"- Course is full. Transferred {len(course_waitlist)} students to Chemistry Basics.")
-                overflow_students.extend(course_waitlist["StudentID"].tolist())
+# Overflow sections: cost model and planning grid used by `plan_overflow_sections`.
+# - 'section': Fixed cost of opening a section (the former flat cost of the overflow class).
+# - 'seat': Cost per seat of the class room the section is given.
+OVERFLOW_COSTS = {
+    "section": 500,
+    "seat": 5,
+}
+# Section size used when the source has no class rooms, and for class rooms without a capacity
+# (the former overflow threshold and the default of classRooms.capacity).
+DEFAULT_SECTION_CAPACITY = 30
+# Weekday start times and number of upcoming weekdays in which overflow sections can be scheduled.
+SECTION_TIMES = ("09:00", "11:00", "13:00", "15:00")
+PLANNING_DAYS = 10
+
+
+
+# Ranks the waitlisted students of every course in waitlist order with one groupby/cumcount and compares the rank
+# with the free seats (Capacity - RegisteredStudents) of their course, instead of filtering the waitlist per course.
+# - Returns the waitlist entries of known courses, ordered by course (in courses_df order) and then by waitlist order,
+#   with 'Allocated' set for the students that fit in the free seats.
+def ranked_waitlist(courses_df, waitlist_df):
+    course_order = pd.Series(range(len(courses_df)), index=courses_df["CourseID"].to_numpy())
+    course_order = course_order[~course_order.index.duplicated()]
+    free_seats = (courses_df["Capacity"] - courses_df["RegisteredStudents"]).set_axis(courses_df["CourseID"].to_numpy())
+    free_seats = free_seats[~free_seats.index.duplicated()]
+
+    waitlist = waitlist_df.loc[waitlist_df["CourseID"].isin(course_order.index), ["CourseID", "StudentID"]]
+    waitlist = waitlist.assign(
+        CourseOrder=waitlist["CourseID"].map(course_order).to_numpy(),
+        Rank=waitlist.groupby("CourseID", sort=False).cumcount().to_numpy(),
+        FreeSeats=waitlist["CourseID"].map(free_seats).to_numpy(),
+    ).sort_values("CourseOrder", kind="stable")
+    return waitlist.assign(Allocated=waitlist["Rank"] < waitlist["FreeSeats"])
+
+
+
+# Returns the (date, time) slots of the next `days` weekdays after `today`, in chronological order.
+def planning_slots(today=None, days=PLANNING_DAYS, times=SECTION_TIMES):
+    day = (pd.Timestamp.today() if today is None else pd.Timestamp(today)).date()
+    slots = []
+    while len(slots) < days * len(times):
+        day += timedelta(days=1)
+        if day.weekday() < 5:
+            slots.extend((day.isoformat(), start) for start in times)
+    return slots
+
+
+
+# Packs the students left without a seat into the minimum number of new sections of their course.
+# - Every section needs a free (class room, slot) pair and a teacher who is free in that slot and has the
+#   specialization of the course's own teacher (the course's teacher is preferred; any teacher if it has none).
+#   Rooms and teachers are free in a slot unless a schedule from "Schedules" already uses them.
+# - Greedy with an index, courses with the most students first: while a course has more students than the largest
+#   available room, it takes the largest one; the rest goes into the smallest room that still fits them (best fit),
+#   which keeps the big rooms for the courses that need them. The free rooms of every slot are kept sorted by capacity
+#   and searched with bisect, so a section costs O(slots x log rooms).
+# - Without class rooms, every slot gets as many virtual rooms of DEFAULT_SECTION_CAPACITY seats as the unplaced
+#   students need, so only the teachers limit the sections; without teachers, the teacher is left empty.
+# - `unplaced` holds 'CourseID' and 'StudentID' in waitlist order.
+# - Returns (sections, unassigned): one dictionary per section (course, slot, room, teacher, students, cost) and the
+#   IDs of the students for whom no room, slot or teacher was left.
+def plan_overflow_sections(unplaced, courses_df, teachers_df=None, class_rooms_df=None, schedules_df=None, slots=None):
+    slots = planning_slots() if slots is None else slots
+    teachers = {} if teachers_df is None else dict(zip(teachers_df["TeacherID"], teachers_df["Specialization"].fillna("")))
+    schedules = schedules_df if schedules_df is not None else pd.DataFrame(columns=["ClassRoomID", "TeacherID", "Date", "Time"])
+    busy_rooms = set(zip(schedules["ClassRoomID"], schedules["Date"], schedules["Time"]))
+    busy_teachers = set(zip(schedules["TeacherID"], schedules["Date"], schedules["Time"]))
+
+    if class_rooms_df is None or class_rooms_df.empty:
+        virtual_rooms = -(-len(unplaced) // DEFAULT_SECTION_CAPACITY)
+        rooms = [(DEFAULT_SECTION_CAPACITY, None, f"New class room {number}") for number in range(1, virtual_rooms + 1)]
+    else:
+        rooms = list(zip(
+            class_rooms_df["RoomCapacity"].fillna(DEFAULT_SECTION_CAPACITY).astype(int),
+            class_rooms_df["ClassRoomID"],
+            class_rooms_df["ClassRoomName"],
+        ))
+    free_rooms = {}
+    free_teachers = {}
+    for slot in slots:
+        free_rooms[slot] = sorted(
+            (capacity, index) for index, (capacity, room_id, _) in enumerate(rooms)
+            if capacity > 0 and (room_id, *slot) not in busy_rooms
+        )
+        by_specialization = free_teachers[slot] = {}
+        for teacher_id, specialization in teachers.items():
+            if (teacher_id, *slot) not in busy_teachers:
+                by_specialization.setdefault(specialization, []).append(teacher_id)
+
+    def find_teacher(slot, teacher_id, specialization):
+        if not teachers:
+            return True, None
+        if specialization is None:
+            candidates = [teacher for free in free_teachers[slot].values() for teacher in free]
         else:
-            print(f"- No students in waitlist.")
+            candidates = free_teachers[slot].get(specialization, [])
+        if not candidates:
+            return False, None
+        return True, teacher_id if teacher_id in candidates else candidates[0]
+
+    def take_teacher(slot, teacher_id):
+        if teacher_id is not None:
+            free_teachers[slot][teachers[teacher_id]].remove(teacher_id)
+
+    course_info = courses_df.drop_duplicates("CourseID").set_index("CourseID")
+    students_by_course = unplaced.groupby("CourseID", sort=False)["StudentID"].agg(list)
+    sections = []
+    unassigned = []
+    for course_id in students_by_course.map(len).sort_values(ascending=False, kind="stable").index:
+        students = students_by_course[course_id]
+        course_teacher = course_info.at[course_id, "TeacherID"]
+        course_teacher = None if pd.isna(course_teacher) else int(course_teacher)
+        specialization = teachers.get(course_teacher) or None
+        section_number = 0
+        while students:
+            best = None
+            for slot in slots:
+                slot_rooms = free_rooms[slot]
+                if not slot_rooms:
+                    continue
+                if len(students) >= slot_rooms[-1][0]:
+                    position = len(slot_rooms) - 1
+                else:
+                    position = bisect.bisect_left(slot_rooms, (len(students), -1))
+                capacity = slot_rooms[position][0]
+                # Prefer a room that fits everyone left, then the tightest fit, else the largest room
+                key = (capacity < len(students), capacity if capacity >= len(students) else -capacity)
+                if best is not None and key >= best[0]:
+                    continue
+                has_teacher, teacher_id = find_teacher(slot, course_teacher, specialization)
+                if has_teacher:
+                    best = (key, slot, position, teacher_id)
+            if best is None:
+                unassigned.extend(students)
+                break
+            _, slot, position, teacher_id = best
+            capacity, room_index = free_rooms[slot].pop(position)
+            take_teacher(slot, teacher_id)
+            section_number += 1
+            section_students, students = students[:capacity], students[capacity:]
+            _, room_id, room_name = rooms[room_index]
+            sections.append({
+                "CourseID": int(course_id),
+                "CourseName": f"{course_info.at[course_id, 'CourseName']} (overflow {section_number})",
+                "Date": slot[0],
+                "Time": slot[1],
+                "ClassRoomID": room_id,
+                "ClassRoom": room_name,
+                "TeacherID": teacher_id,
+                "Capacity": int(capacity),
+                "RegisteredStudents": len(section_students),
+                "Cost": OVERFLOW_COSTS["section"] + OVERFLOW_COSTS["seat"] * int(capacity),
+                "StudentIDs": section_students,
+            })
+    return sections, unassigned
+
+
+
+# Allocates waitlisted students to free seats and plans overflow sections for everyone left on a waitlist.
+# - See `ranked_waitlist` for how the students are chosen and `plan_overflow_sections` for the new sections;
+#   `data` may hold the "Teachers", "ClassRooms" and "Schedules" tables the planner uses.
+# - Prints the outcome for every course and every new section when `verbose` is True.
+# - Returns (allocations, new_classes): the allocated student IDs and one dictionary per new section.
+def allocate_students(courses_df, waitlist_df, teachers_df=None, verbose=True, data=None, slots=None):
+    data = data or {}
+    waitlist = ranked_waitlist(courses_df, waitlist_df)
+    allocations = waitlist.loc[waitlist["Allocated"], "StudentID"].tolist()
+    unplaced = waitlist.loc[~waitlist["Allocated"], ["CourseID", "StudentID"]]
+
+    if verbose:
+        summary = pd.DataFrame({
+            "Waitlisted": waitlist.groupby("CourseID", sort=False).size(),
+            "Added": waitlist["Allocated"].groupby(waitlist["CourseID"], sort=False).sum(),
+        }).to_dict("index")
+        for course in courses_df[["CourseID", "CourseName", "Capacity", "RegisteredStudents"]].itertuples(index=False):
+            print(f"Processing Course: {course.CourseName}")
+            course_waitlist = summary.get(course.CourseID)
+            if course_waitlist is None:
+                print(f"- No students in waitlist.")
+            elif course.RegisteredStudents < course.Capacity:
+                print(f"- Successfully added {course_waitlist['Added']} students from waitlist.")
+                print(f"- Remaining students in waitlist: {course_waitlist['Waitlisted'] - course_waitlist['Added']}")
+            else:
+                print(f"- Course is full. {course_waitlist['Waitlisted']} students need an overflow section.")
 
     # Handle overflow students
-    if len(overflow_students) > 30:
-        new_class_name = "Class Overflow"
-        print(f"Opening New Class: \"{new_class_name}\"")
-        print(f"- Added {len(overflow_students)} students from remaining waitlists.")
-        print(f"Total Cost: $500")
-        new_classes.append({
-            "CourseName": new_class_name,
-            "Capacity": len(overflow_students),
-            "RegisteredStudents": len(overflow_students),
-        })
+    sections, unassigned = plan_overflow_sections(
+        unplaced, courses_df,
+        teachers_df if teachers_df is not None else data.get("Teachers"),
+        data.get("ClassRooms"), data.get("Schedules"), slots,
+    )
+    new_classes = [{key: value for key, value in section.items() if key != "StudentIDs"} for section in sections]
+    if verbose:
+        for section in new_classes:
+            print(f"Opening New Class: \"{section['CourseName']}\" on {section['Date']} {section['Time']}"
+                  f" in {section['ClassRoom']} ({section['Capacity']} seats), teacher {section['TeacherID']}")
+            print(f"- Added {section['RegisteredStudents']} students from the waitlist. Cost: ${section['Cost']:,}")
+        if new_classes:
+            total_cost = sum(section['Cost'] for section in new_classes)
+            seated = sum(section['RegisteredStudents'] for section in new_classes)
+            print(f"Total Cost: ${total_cost:,} for {len(new_classes)} sections (${total_cost / seated:,.2f} per student)")
+        if unassigned:
+            print(f"{len(unassigned)} students could not be placed: no free class room, slot or teacher left.")
 
     return allocations, new_classes
 
-# Step 4: Save Results to Excel
+# Step 4: Save Results
+# The report sheets in order, with the file name suffix used by the CSV and Parquet outputs.
+REPORT_SHEETS = {
+    "Long Waitlist Analysis": "long_waitlist_analysis",
+    "Transferred Students": "transferred_students",
+    "New Classes Opened": "new_classes_opened",
+}
+REPORT_FORMATS = ("xlsx", "csv", "parquet")
+
+
+
+# Yields the header and then every row of a report sheet as plain Python values (None for missing values).
+# - The allocations are streamed straight from the list of student IDs, without building a DataFrame.
+def report_rows(sheet_name, waitlist_analysis, allocations, new_classes):
+    if sheet_name == "Long Waitlist Analysis":
+        yield list(waitlist_analysis.columns)
+        for row in waitlist_analysis.astype(object).itertuples(index=False):
+            yield [None if pd.isna(value) else value for value in row]
+    elif sheet_name == "Transferred Students":
+        yield ["StudentID"]
+        for student_id in allocations:
+            yield [student_id]
+    else:
+        columns = list(new_classes[0]) if new_classes else ["CourseID", "CourseName", "Date", "Time", "ClassRoomID",
+                                                             "ClassRoom", "TeacherID", "Capacity", "RegisteredStudents", "Cost"]
+        yield columns
+        for new_class in new_classes:
+            yield [new_class.get(column) for column in columns]
+
+
+
+# Writes the three report sheets into one workbook with openpyxl's write-only mode.
+# - Rows are appended one at a time and flushed to disk as they go, so memory stays flat however many students
+#   were allocated. Returns the seconds spent per sheet; saving the workbook is reported as "Save".
 def save_results_to_excel(waitlist_analysis, allocations, new_classes, output_file):
-    with pd.ExcelWriter(output_file) as writer:
-        # Sheet 1: Long Waitlist Analysis
-        waitlist_analysis.to_excel(writer, sheet_name="Long Waitlist Analysis", index=False)
+    from openpyxl import Workbook
+
+    timings = {}
+    workbook = Workbook(write_only=True)
+    for sheet_name in REPORT_SHEETS:
+        started = time.perf_counter()
+        sheet = workbook.create_sheet(sheet_name)
+        for row in report_rows(sheet_name, waitlist_analysis, allocations, new_classes):
+            sheet.append(row)
+        timings[sheet_name] = time.perf_counter() - started
+    started = time.perf_counter()
+    workbook.save(output_file)
+    timings["Save"] = time.perf_counter() - started
+    return timings
+
+
+
+# Writes every report sheet to its own CSV file next to `output_file` (e.g. report.transferred_students.csv).
+# - Rows are streamed to the files; returns the seconds spent per sheet.
+def save_results_to_csv(waitlist_analysis, allocations, new_classes, output_file):
+    import csv
+
+    timings = {}
+    base_path = os.path.splitext(output_file)[0]
+    for sheet_name, suffix in REPORT_SHEETS.items():
+        started = time.perf_counter()
+        with open(f"{base_path}.{suffix}.csv", "w", newline="", encoding="utf-8") as sheet_file:
+            csv.writer(sheet_file).writerows(report_rows(sheet_name, waitlist_analysis, allocations, new_classes))
+        timings[sheet_name] = time.perf_counter() - started
+    return timings
+
+
 
-        # Sheet 2: Transferred Students
-        pd.DataFrame(allocations, columns=["StudentID"]).to_excel(writer, sheet_name="Transferred Students", index=False)
+# Writes every report sheet to its own Parquet file next to `output_file` (needs pyarrow).
+# - The allocations are converted to a single Arrow column without going through a DataFrame;
+#   returns the seconds spent per sheet.
+def save_results_to_parquet(waitlist_analysis, allocations, new_classes, output_file):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-        # Sheet 3: New Classes Opened
-        pd.DataFrame(new_classes).to_excel(writer, sheet_name="New Classes Opened", index=False)
+    tables = {
+        "Long Waitlist Analysis": lambda: pa.Table.from_pandas(waitlist_analysis, preserve_index=False),
+        "Transferred Students": lambda: pa.table({"StudentID": pa.array(allocations, type=pa.int64())}),
+        "New Classes Opened": lambda: pa.Table.from_pylist(new_classes) if new_classes else pa.table({
+            "CourseID": pa.array([], pa.int64()), "CourseName": pa.array([], pa.string()),
+            "Date": pa.array([], pa.string()), "Time": pa.array([], pa.string()),
+            "ClassRoomID": pa.array([], pa.int64()), "ClassRoom": pa.array([], pa.string()),
+            "TeacherID": pa.array([], pa.int64()), "Capacity": pa.array([], pa.int64()),
+            "RegisteredStudents": pa.array([], pa.int64()), "Cost": pa.array([], pa.int64()),
+        }),
+    }
+    timings = {}
+    base_path = os.path.splitext(output_file)[0]
+    for sheet_name, suffix in REPORT_SHEETS.items():
+        started = time.perf_counter()
+        pq.write_table(tables[sheet_name](), f"{base_path}.{suffix}.parquet")
+        timings[sheet_name] = time.perf_counter() - started
+    return timings
+
+
+
+# Saves the report in the chosen format ("xlsx", "csv" or "parquet") and prints how long every sheet took.
+# - Returns the seconds spent per sheet.
+def save_results(waitlist_analysis, allocations, new_classes, output_file, output_format="xlsx"):
+    writers = {
+        "xlsx": save_results_to_excel,
+        "csv": save_results_to_csv,
+        "parquet": save_results_to_parquet,
+    }
+    timings = writers[output_format](waitlist_analysis, allocations, new_classes, output_file)
 
     print("Reports saved successfully!")
     print("Contents:")
-    print("- Sheet 1: Long Waitlist Analysis")
-    print("- Sheet 2: Transferred Students")
-    print("- Sheet 3: New Classes Opened")
-# Main Execution5
-file_path = f"{os.environ['path']}/Pandas/learning_center_project_data.xlsx"
-data = load_excel_data(file_path)
-print(data)
-if data:
-    students_df = data["Students"]
-    courses_df = data["Courses"]
-    waitlist_df = data["Waitlist"]
-    teachers_df = data["Teachers"]
-waitlist_analysis = analyze_waitlist(waitlist_df, courses_df)    
-allocations, new_classes = allocate_students(students_df, courses_df, waitlist_df, teachers_df)
-output_file = "Pandas/advanced_waitlist_report.xlsx"
-save_results_to_excel(waitlist_analysis, allocations, new_classes, output_file)
+    for number, sheet_name in enumerate(REPORT_SHEETS, start=1):
+        print(f"- Sheet {number}: {sheet_name} ({timings[sheet_name]:.3f}s)")
+    if "Save" in timings:
+        print(f"- Workbook saved in {timings['Save']:.3f}s")
+    return timings
+
+
+
+# Runs the whole analysis on the loaded tables and saves the report in `output_format` (see `save_results`).
+# - Returns (waitlist_analysis, allocations, new_classes).
+def run_pipeline(data, output_file, today=None, output_format="xlsx"):
+    waitlist_analysis = analyze_waitlist(data["Waitlist"], data["Courses"], today)
+    allocations, new_classes = allocate_students(data["Courses"], data["Waitlist"], data=data, slots=planning_slots(today))
+    save_results(waitlist_analysis, allocations, new_classes, output_file, output_format)
+    return waitlist_analysis, allocations, new_classes
+
+
+
+# Main Execution
+# - Loads the data from the database (or the workbook given with --excel) and runs the pipeline.
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Waitlist analytics report.")
+    parser.add_argument("--excel", help="Read the data from this workbook instead of the database")
+    parser.add_argument("--output", default=f"{os.environ['path']}/Pandas/advanced_waitlist_report.xlsx")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="xlsx",
+                        help="xlsx writes one workbook; csv and parquet write one file per sheet next to --output")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per database read")
+    parser.add_argument("--database", default=database_manager.DATABASE_NAME)
+    parser.add_argument("--snapshot-dir", default=SNAPSHOT_DIR, help="Where the columnar snapshots of the inputs are kept")
+    parser.add_argument("--no-snapshot", action="store_true", help="Always read the source directly")
+    parser.add_argument("--refresh-snapshot", action="store_true", help="Rebuild the snapshot even if it is up to date")
+    args = parser.parse_args(argv)
+
+    if args.excel:
+        if args.no_snapshot:
+            data = load_excel_data(args.excel)
+        else:
+            data = load_excel_data_cached(args.excel, args.snapshot_dir, args.refresh_snapshot)
+    else:
+        database_manager.DATABASE_NAME = args.database
+        with DatabaseManager() as db_manager:
+            if args.no_snapshot:
+                data = load_database_data(db_manager, args.chunksize)
+            else:
+                data = load_database_data_cached(db_manager, args.snapshot_dir, args.chunksize, args.refresh_snapshot)
+    if data is None:
+        sys.exit(1)
+    run_pipeline(data, args.output, output_format=args.format)
+
 
+if __name__ == "__main__":
+    main()
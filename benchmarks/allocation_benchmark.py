@@ -0,0 +1,151 @@
+# Benchmark for the vectorized waitlist allocation in Pandas/Pandas.py.
+# - Builds synthetic courses and waitlists (100k waitlist rows by default) with a fixed seed; no database is needed.
+# - "before" runs the old loop that filters the waitlist once per course and opens one overflow class.
+# - "after" runs `allocate_students`, which ranks the whole waitlist with one groupby/cumcount and plans the overflow
+#   sections with `plan_overflow_sections`, on synthetic class rooms, teachers and schedules.
+# - Checks before timing that both allocate the same students, that every student of a full course is left for an
+#   overflow section, and that the sections seat unplaced students at most once within the room capacities.
+# - "planner" is the part of "after" spent in `plan_overflow_sections`.
+# Usage: python benchmarks/allocation_benchmark.py [--waitlist 100000] [--courses 500 5000] [--repeat 3]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import dotenv
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+
+import numpy as np
+import pandas as pd
+
+from Pandas.Pandas import allocate_students, plan_overflow_sections, planning_slots, ranked_waitlist
+
+
+# The allocation loop as it was before vectorization, without the progress output.
+# - Returns (allocations, overflow_students, new_classes).
+def legacy_allocate_students(courses_df, waitlist_df):
+    allocations = []
+    new_classes = []
+    overflow_students = []
+    for _, course_row in courses_df.iterrows():
+        course_waitlist = waitlist_df[waitlist_df["CourseID"] == course_row["CourseID"]]
+        if course_waitlist.empty:
+            continue
+        if course_row["RegisteredStudents"] < course_row["Capacity"]:
+            available_spots = course_row["Capacity"] - course_row["RegisteredStudents"]
+            students_to_add = min(len(course_waitlist), available_spots)
+            allocations.extend(course_waitlist.head(students_to_add)["StudentID"].tolist())
+        else:
+            overflow_students.extend(course_waitlist["StudentID"].tolist())
+    if len(overflow_students) > 30:
+        new_classes.append({
+            "CourseName": "Class Overflow",
+            "Capacity": len(overflow_students),
+            "RegisteredStudents": len(overflow_students),
+        })
+    return allocations, overflow_students, new_classes
+
+
+# Generates `courses` courses, about a third of them full, and `waitlist` waitlist entries spread over them,
+# plus the teachers, class rooms and existing schedules the overflow planner works with.
+def synthetic_data(courses, waitlist, seed):
+    rng = np.random.default_rng(seed)
+    capacity = rng.integers(15, 40, courses)
+    courses_df = pd.DataFrame({
+        "CourseID": np.arange(1, courses + 1),
+        "CourseName": [f"Course {course_id}" for course_id in range(1, courses + 1)],
+        "TeacherID": rng.integers(1, 50, courses),
+        "Capacity": capacity,
+        "RegisteredStudents": capacity - rng.integers(-10, 20, courses),
+    })
+    waitlist_df = pd.DataFrame({
+        "WaitlistID": np.arange(1, waitlist + 1),
+        "CourseID": rng.integers(1, courses + 1, waitlist),
+        "StudentID": rng.integers(1, waitlist * 2, waitlist),
+        "RequestDate": pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, 120, waitlist), unit="D"),
+    })
+    teachers_df = pd.DataFrame({
+        "TeacherID": np.arange(1, 50),
+        "Specialization": [f"Subject {teacher_id % 8}" for teacher_id in range(1, 50)],
+    })
+    class_rooms_df = pd.DataFrame({
+        "ClassRoomID": np.arange(1, 41),
+        "ClassRoomName": [f"Room {room_id}" for room_id in range(1, 41)],
+        "RoomCapacity": rng.choice([20, 25, 30, 40, 60], 40),
+    })
+    slots = planning_slots("2025-01-01")
+    busy = rng.choice(len(slots), 200)
+    schedules_df = pd.DataFrame({
+        "ClassRoomID": rng.integers(1, 41, 200),
+        "TeacherID": rng.integers(1, 50, 200),
+        "Date": [slots[index][0] for index in busy],
+        "Time": [slots[index][1] for index in busy],
+    })
+    data = {"Teachers": teachers_df, "ClassRooms": class_rooms_df, "Schedules": schedules_df}
+    return courses_df, waitlist_df, data, slots
+
+
+
+# Checks that the planned sections fit their rooms, never share a room or teacher in a slot and seat only
+# unplaced students of their own course, each at most once.
+def check_sections(courses_df, waitlist_df, data, new_classes):
+    waitlist = ranked_waitlist(courses_df, waitlist_df)
+    unplaced = waitlist.loc[~waitlist["Allocated"]].groupby("CourseID")["StudentID"].size().to_dict()
+    capacities = dict(zip(data["ClassRooms"]["ClassRoomID"], data["ClassRooms"]["RoomCapacity"]))
+    seated = {}
+    rooms, teachers = set(), set()
+    for section in new_classes:
+        slot = (section["Date"], section["Time"])
+        if section["RegisteredStudents"] > capacities[section["ClassRoomID"]]:
+            return False
+        if (section["ClassRoomID"], *slot) in rooms or (section["TeacherID"], *slot) in teachers:
+            return False
+        rooms.add((section["ClassRoomID"], *slot))
+        teachers.add((section["TeacherID"], *slot))
+        seated[section["CourseID"]] = seated.get(section["CourseID"], 0) + section["RegisteredStudents"]
+    return all(count <= unplaced.get(course_id, 0) for course_id, count in seated.items())
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), statistics.median(timings)
+
+
+def run_benchmark(waitlist, course_counts, repeat, seed):
+    print(f"{'courses':>8}{'waitlist':>10}{'before s':>11}{'after s':>10}{'speedup':>9}")
+    for courses in course_counts:
+        courses_df, waitlist_df, data, slots = synthetic_data(courses, waitlist, seed)
+        expected_allocations, expected_overflow, _ = legacy_allocate_students(courses_df, waitlist_df)
+        allocations, new_classes = allocate_students(courses_df, waitlist_df, verbose=False, data=data, slots=slots)
+        ranked = ranked_waitlist(courses_df, waitlist_df)
+        unplaced = ranked.loc[~ranked["Allocated"], ["CourseID", "StudentID"]]
+        if allocations != expected_allocations or not set(expected_overflow) <= set(unplaced["StudentID"]):
+            sys.exit(f"Allocation mismatch with {courses} courses")
+        if not check_sections(courses_df, waitlist_df, data, new_classes):
+            sys.exit(f"Invalid overflow sections with {courses} courses")
+        before, _ = best_of(repeat, lambda: legacy_allocate_students(courses_df, waitlist_df))
+        after, _ = best_of(repeat, lambda: allocate_students(
+            courses_df, waitlist_df, verbose=False, data=data, slots=slots))
+        print(f"{courses:>8}{waitlist:>10}{before:>11.3f}{after:>10.3f}{before / after:>8.1f}x")
+
+        planner, _ = best_of(repeat, lambda: plan_overflow_sections(
+            unplaced, courses_df, data["Teachers"], data["ClassRooms"], data["Schedules"], slots))
+        cost = sum(section["Cost"] for section in new_classes)
+        print(f"{'planner':>8}{len(unplaced):>10}{'':>11}{planner:>10.3f}"
+              f"   {len(new_classes)} sections, ${cost:,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Loop vs vectorized waitlist allocation.")
+    parser.add_argument("--waitlist", type=lambda value: int(float(value)), default=100_000)
+    parser.add_argument("--courses", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    run_benchmark(args.waitlist, args.courses, args.repeat, args.seed)
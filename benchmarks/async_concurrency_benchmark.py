@@ -0,0 +1,160 @@
+# Concurrency benchmark for AsyncDatabaseManager.
+# - Simulates 1, 10 and 100 concurrent users (configurable), each running parent sessions back to back for a fixed time:
+#   login lookup, children list, progress report, a waitlist read, a schedule fetch and a registration.
+# - "async" runs every user as a coroutine sharing one AsyncDatabaseManager and its aiomysql pool.
+# - "sync" (with --sync-baseline) runs the same sessions with one thread and one DatabaseManager per user.
+# - Reports sessions/s, operations/s and the p50/p95 session latency for every concurrency level.
+# - Expects a benchmark database seeded by benchmarks/benchmark_suite.py, or pass --seed-users to seed one first.
+# Usage: python benchmarks/async_concurrency_benchmark.py [--concurrency 1 10 100] [--duration 10] [--sync-baseline]
+import argparse
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+import dotenv
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+
+import databaseManager.database_manager as database_manager
+from databaseManager.database_manager import DatabaseManager, DB_CONFIG, POOL_CONFIG, close_connection_pool
+from databaseManager.async_database_manager import AsyncDatabaseManager, ASYNC_POOL_CONFIG, close_async_pool
+from benchmarks.benchmark_suite import sample_ids, seed_database, percentile
+
+
+# One simulated parent session: (method name, callable(sample, rng, state) returning the arguments).
+# - `state` carries the parent's children between steps, just like the parent menu does.
+SESSION_STEPS = [
+    ("get_user", lambda sample, rng, state: (rng.choice(sample["emails"])[0],)),
+    ("get_students_by_parent_id", lambda sample, rng, state: (state["parent_id"],)),
+    ("get_course_enrollments", lambda sample, rng, state: (state["student_ids"],)),
+    ("get_waitlist_status", lambda sample, rng, state: (state["student_ids"],)),
+    ("get_waitlist", lambda sample, rng, state: (rng.choice(sample["waitlisted"])[1],)),
+    ("fetch_courses_for_student", lambda sample, rng, state: (state["student_ids"][0],)),
+    ("register_or_enqueue", lambda sample, rng, state: (state["student_ids"][0], rng.choice(sample["courses"])[0])),
+]
+
+
+def new_session_state(sample, rng):
+    parent_id, student_ids = rng.choice(sample["families"])
+    return {"parent_id": parent_id, "student_ids": [int(student_id) for student_id in student_ids.split(",")]}
+
+
+
+# Runs `concurrency` coroutines that share one AsyncDatabaseManager until the deadline; returns the session latencies.
+async def run_async_level(concurrency, duration, sample, seed):
+    latencies = []
+
+    async def simulated_user(user_index, db, deadline):
+        rng = random.Random(seed + user_index)
+        while time.perf_counter() < deadline:
+            state = new_session_state(sample, rng)
+            started = time.perf_counter()
+            for method_name, arguments in SESSION_STEPS:
+                await getattr(db, method_name)(*arguments(sample, rng, state))
+            latencies.append(time.perf_counter() - started)
+
+    async with AsyncDatabaseManager() as db:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(simulated_user(index, db, deadline) for index in range(concurrency)))
+    await close_async_pool()
+    return latencies
+
+
+
+# Runs `concurrency` threads, each with its own DatabaseManager, until the deadline; returns the session latencies.
+def run_sync_level(concurrency, duration, sample, seed):
+    latencies = []
+    lock = threading.Lock()
+
+    def simulated_user(user_index, deadline):
+        rng = random.Random(seed + user_index)
+        with DatabaseManager() as db:
+            while time.perf_counter() < deadline:
+                state = new_session_state(sample, rng)
+                started = time.perf_counter()
+                for method_name, arguments in SESSION_STEPS:
+                    getattr(db, method_name)(*arguments(sample, rng, state))
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+
+    close_connection_pool()
+    POOL_CONFIG["pool_size"] = concurrency
+    deadline = time.perf_counter() + duration
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in [executor.submit(simulated_user, index, deadline) for index in range(concurrency)]:
+            future.result()
+    close_connection_pool()
+    return latencies
+
+
+
+# Turns the session latencies of one run into sessions/s, operations/s and latency percentiles (ms).
+def summarize(latencies, duration):
+    latencies = sorted(latency * 1000 for latency in latencies)
+    if not latencies:
+        return None
+    return {
+        "sessions": len(latencies),
+        "sessions_per_second": len(latencies) / duration,
+        "ops_per_second": len(latencies) * len(SESSION_STEPS) / duration,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+    }
+
+
+def print_row(mode, concurrency, stats):
+    if stats is None:
+        print(f"{mode:<7}{concurrency:>8}  no session finished")
+        return
+    print(f"{mode:<7}{concurrency:>8}{stats['sessions_per_second']:>14,.1f}{stats['ops_per_second']:>12,.1f}"
+          f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}")
+
+
+def run_benchmark(levels, duration, seed, sync_baseline, pool_size):
+    with DatabaseManager() as db_manager:
+        sample = sample_ids(db_manager, seed)
+    if not sample["families"] or not sample["waitlisted"]:
+        sys.exit("The benchmark database has no families or no waitlist; seed it first (see --seed-users).")
+    print(f"{'mode':<7}{'users':>8}{'sessions/s':>14}{'ops/s':>12}{'p50 ms':>10}{'p95 ms':>10}")
+    with open(os.devnull, "w") as devnull:
+        for concurrency in levels:
+            ASYNC_POOL_CONFIG["maxsize"] = max(ASYNC_POOL_CONFIG["minsize"], min(concurrency, pool_size))
+            with redirect_stdout(devnull):
+                stats = summarize(asyncio.run(run_async_level(concurrency, duration, sample, seed)), duration)
+            print_row("async", concurrency, stats)
+            if sync_baseline:
+                with redirect_stdout(devnull):
+                    stats = summarize(run_sync_level(concurrency, duration, sample, seed), duration)
+                print_row("sync", concurrency, stats)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput of AsyncDatabaseManager at several concurrency levels.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per concurrency level")
+    parser.add_argument("--pool-size", type=int, default=ASYNC_POOL_CONFIG["maxsize"],
+                        help="Maximum number of pooled connections for the async run")
+    parser.add_argument("--sync-baseline", action="store_true", help="Also run the sessions with threaded DatabaseManagers")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--seed-users", type=lambda value: int(float(value)),
+                        help="Recreate and seed the benchmark database with this many users first")
+    parser.add_argument("--host", default=DB_CONFIG["host"])
+    parser.add_argument("--port", type=int, default=DB_CONFIG["port"])
+    parser.add_argument("--user", default=DB_CONFIG["user"])
+    parser.add_argument("--password", default=DB_CONFIG["password"])
+    parser.add_argument("--database", default="academy_of_tomorrow_bench")
+    args = parser.parse_args()
+
+    application_database = database_manager.DATABASE_NAME
+    DB_CONFIG.update(host=args.host, port=args.port, user=args.user, password=args.password)
+    database_manager.DATABASE_NAME = args.database
+    if args.seed_users:
+        if args.database == application_database:
+            parser.error("refusing to reseed the application database; pick another --database")
+        seed_database(args.seed_users, max(1, args.seed_users // 20), args.seed)
+    run_benchmark(args.concurrency, args.duration, args.seed, args.sync_baseline, args.pool_size)
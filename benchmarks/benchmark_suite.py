@@ -0,0 +1,379 @@
+# End-to-end benchmark suite for the DatabaseManager operations.
+# - For every scale, (re)creates a dedicated benchmark database, seeds it with initiation/data_generator.py
+#   and calls each public DatabaseManager method directly (no menus, no input()) with sampled IDs.
+# - Covers login lookups, registration, waitlist reads, schedule fetches, grade entry, financial reports,
+#   task management and the administrative writes.
+# - Reports p50/p95/p99 latency and throughput per operation and writes everything to a JSON file;
+#   pass --compare with the JSON of an earlier commit to print the p50 change per operation.
+# - Runs the EXPLAIN check of initiation/migrations.py on every seeded database and exits with status 1
+#   if a hot query needs a full table scan, so an index regression fails the benchmark run.
+# - Runs against any MySQL 8 compatible server (a local MySQL, a MariaDB 10.2+ or a throwaway container)
+#   selected with --host/--port/--user/--password. The benchmark database is dropped and recreated.
+# Usage: python benchmarks/benchmark_suite.py [--scales 2000 20000 100000] [--iterations 200] [--output results.json]
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import types
+from contextlib import redirect_stdout
+from datetime import date, datetime
+
+import dotenv
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+
+import databaseManager.database_manager as database_manager
+from databaseManager.database_manager import DatabaseManager, DB_CONFIG, close_connection_pool, get_reference_cache
+from initiation.data_generator import generate_tables
+from initiation.insertData import bulk_load
+from initiation.migrations import explain_hot_queries
+from initiation.tables_structure import tables, views, procedures
+from services.grade_service import MAX_GRADE
+from classes.class_room import ClassRoom
+from classes.course import Course
+from classes.courses_enrollments import CourseEnrollment
+from classes.payment import Payment
+from classes.queue import Queue
+from classes.schedule import Schedule
+from classes.student import Student
+from classes.task import Task
+
+# Number of rows sampled from the seeded database to pick the IDs passed to the operations.
+SAMPLE_SIZE = 500
+
+# Operations that read whole tables run this many times fewer iterations than the others.
+HEAVY_DIVISOR = 10
+
+# Queries used to sample IDs after seeding; RAND(seed) keeps the samples reproducible.
+SAMPLE_QUERIES = {
+    "emails": "SELECT email FROM users",
+    "users": "SELECT id FROM users",
+    "students": "SELECT student_id FROM students",
+    "parents": "SELECT parent_id FROM parents",
+    "families": "SELECT parent_id, GROUP_CONCAT(student_id) FROM students GROUP BY parent_id",
+    "employees": "SELECT employee_id FROM employees",
+    "teachers": "SELECT teacher_id FROM teachers",
+    "courses": "SELECT id, teacher_id FROM courses",
+    "class_rooms": "SELECT id FROM classRooms",
+    "enrollments": "SELECT student_id, course_id FROM courseEnrollments",
+    "waitlisted": "SELECT student_id, course_id FROM queue",
+    "tasks": "SELECT id, assigned_to FROM tasks WHERE assigned_to IS NOT NULL",
+}
+
+
+
+# Builds the list of benchmarked operations: (name, group, heavy, callable(db_manager, sample, rng)).
+# - Read-only operations come first so they measure the freshly seeded data; writes follow.
+# - `heavy` marks operations that read a whole table and therefore run fewer iterations.
+def build_operations():
+    counter = iter(range(1, 1 << 62))
+
+    def enrollment(sample, rng):
+        student_id, course_id = rng.choice(sample["enrollments"])
+        return CourseEnrollment(course_id=course_id, student_id=student_id)
+
+    def waitlisted(sample, rng):
+        return rng.choice(sample["waitlisted"])
+
+    # A full grade sheet for a random course; the enrollments are grouped by course once per sample.
+    students_by_course = {}
+
+    def grade_sheet(sample, rng):
+        if id(sample) not in students_by_course:
+            students_by_course.clear()
+            courses = students_by_course[id(sample)] = {}
+            for student_id, course_id in sample["enrollments"]:
+                courses.setdefault(course_id, []).append(student_id)
+        course_id, student_ids = rng.choice(list(students_by_course[id(sample)].items()))
+        return course_id, {student_id: round(rng.uniform(55, MAX_GRADE), 2) for student_id in student_ids}
+
+    def family_ids(sample, rng):
+        return [int(student_id) for student_id in rng.choice(sample["families"])[1].split(",")]
+
+    # Time to first row of a streaming query: read one row and return the stream still open; `measure` closes it
+    # (discarding the unread rows) after stopping the timer.
+    def first_row(rows):
+        next(rows, None)
+        return rows
+
+    def drain(rows):
+        return sum(1 for _ in rows)
+
+    def new_student(sample, rng):
+        n = next(counter)
+        return Student(name=f"Bench Student {n}", email=f"bench.student.{n}.{time.time_ns()}@example.com",
+                       age=rng.randint(10, 18), grade_level="8th Grade", parent_id=rng.choice(sample["parents"])[0])
+
+    def new_schedule(sample, rng, course_id=None, teacher_id=None):
+        return Schedule(course_id=course_id, teacher_id=teacher_id, date=date(2025, rng.randint(1, 12), rng.randint(1, 28)),
+                        time=f"{rng.randint(8, 17):02}:00:00", class_room_id=rng.choice(sample["class_rooms"])[0])
+
+    def new_course(sample, rng):
+        return Course(name=f"Bench Course {next(counter)}", description="Benchmark course",
+                      teacher_id=rng.choice(sample["teachers"])[0], max_capacity=rng.choice([15, 20, 25, 30]))
+
+    def create_course(db, sample, rng):
+        course = new_course(sample, rng)
+        return db.create_course(course, new_schedule(sample, rng, teacher_id=course.teacher_id))
+
+    def insert_into_schedule(db, sample, rng):
+        course_id, teacher_id = rng.choice(sample["courses"])
+        return db.insert_into_schedule(new_schedule(sample, rng, course_id, teacher_id))
+
+    return [
+        # Login
+        ("get_user", "login", False, lambda db, sample, rng: db.get_user(rng.choice(sample["emails"])[0])),
+        # Registration
+        ("get_course", "registration", False, lambda db, sample, rng: db.get_course(rng.choice(sample["courses"])[0])),
+        ("fetch_enrollment_count_for_course", "registration", False,
+         lambda db, sample, rng: db.fetch_enrollment_count_for_course(enrollment(sample, rng))),
+        ("is_child_registered", "registration", False, lambda db, sample, rng: db.is_child_registered(enrollment(sample, rng))),
+        ("is_child_in_waitlist", "registration", False, lambda db, sample, rng: db.is_child_in_waitlist(enrollment(sample, rng))),
+        ("get_students_by_parent_id", "registration", False,
+         lambda db, sample, rng: db.get_students_by_parent_id(rng.choice(sample["parents"])[0])),
+        ("get_course_enrollments", "registration", False, lambda db, sample, rng: db.get_course_enrollments(family_ids(sample, rng))),
+        ("iter_family_progress", "registration", True, lambda db, sample, rng: drain(db.iter_family_progress())),
+        # Waitlist reads
+        ("get_waitlist", "waitlist", False, lambda db, sample, rng: db.get_waitlist(waitlisted(sample, rng)[1])),
+        ("get_child_position_in_waitlist", "waitlist", False,
+         lambda db, sample, rng: db.get_child_position_in_waitlist(*waitlisted(sample, rng))),
+        ("get_waitlist_status", "waitlist", False, lambda db, sample, rng: db.get_waitlist_status(family_ids(sample, rng))),
+        ("get_waitlist_page", "waitlist", False,
+         lambda db, sample, rng: db.get_waitlist_page(waitlisted(sample, rng)[1], page_size=100)),
+        ("iter_waitlist", "waitlist", False, lambda db, sample, rng: drain(db.iter_waitlist(waitlisted(sample, rng)[1]))),
+        ("waitlist_course_status", "waitlist", True, lambda db, sample, rng: db.waitlist_course_status()),
+        ("iter_waitlist_course_status", "waitlist", True, lambda db, sample, rng: drain(db.iter_waitlist_course_status())),
+        # Schedules and grades
+        ("fetch_courses_for_student", "schedule", False,
+         lambda db, sample, rng: db.fetch_courses_for_student(rng.choice(sample["students"])[0])),
+        ("fetch_courses_for_teacher", "schedule", False,
+         lambda db, sample, rng: db.fetch_courses_for_teacher(rng.choice(sample["teachers"])[0])),
+        ("fetch_grades", "grades", False, lambda db, sample, rng: db.fetch_grades(rng.choice(sample["students"])[0])),
+        ("fetch_students_in_course", "grades", False,
+         lambda db, sample, rng: db.fetch_students_in_course(*rng.choice(sample["courses"]))),
+        # Financial reports
+        ("get_total_income", "financial", True, lambda db, sample, rng: db.get_total_income()),
+        ("get_teachers_salary", "financial", True, lambda db, sample, rng: db.get_teachers_salary()),
+        ("get_employees_salary", "financial", True, lambda db, sample, rng: db.get_employees_salary()),
+        ("get_financial_summary", "financial", True, lambda db, sample, rng: db.get_financial_summary()),
+        ("get_payments_page", "financial", False, lambda db, sample, rng: db.get_payments_page(rng.randint(0, 10_000), 100)),
+        ("iter_total_income", "financial", True, lambda db, sample, rng: drain(db.iter_total_income())),
+        ("iter_total_income:first_row", "financial", False, lambda db, sample, rng: first_row(db.iter_total_income())),
+        # Tasks and class rooms
+        ("get_class_rooms", "admin", True, lambda db, sample, rng: db.get_class_rooms()),
+        ("get_all_tasks", "tasks", True, lambda db, sample, rng: db.get_all_tasks()),
+        ("get_tasks_page", "tasks", False, lambda db, sample, rng: db.get_tasks_page(rng.randint(0, 1_000), 100)),
+        ("iter_tasks", "tasks", True, lambda db, sample, rng: drain(db.iter_tasks())),
+        ("fetch_all_employee_tasks", "tasks", False,
+         lambda db, sample, rng: db.fetch_all_employee_tasks(rng.choice(sample["employees"])[0])),
+        ("check_task_assignee", "tasks", False, lambda db, sample, rng: db.check_task_assignee(*rng.choice(sample["tasks"]))),
+        # Writes
+        ("register_or_enqueue", "registration", False,
+         lambda db, sample, rng: db.register_or_enqueue(rng.choice(sample["students"])[0], rng.choice(sample["courses"])[0])),
+        ("insert_child_to_course", "registration", False,
+         lambda db, sample, rng: db.insert_child_to_course(
+             CourseEnrollment(course_id=rng.choice(sample["courses"])[0], student_id=rng.choice(sample["students"])[0]))),
+        ("add_child_to_waitlist", "registration", False,
+         lambda db, sample, rng: db.add_child_to_waitlist(
+             Queue(course_id=rng.choice(sample["courses"])[0], student_id=rng.choice(sample["students"])[0]))),
+        ("remove_student_from_waitlist", "waitlist", False,
+         lambda db, sample, rng: db.remove_student_from_waitlist(*waitlisted(sample, rng))),
+        ("set_student_grade", "grades", False,
+         lambda db, sample, rng: db.set_student_grade(*rng.choice(sample["enrollments"]), round(rng.uniform(55, MAX_GRADE), 2))),
+        ("promote_waitlisted", "waitlist", True, lambda db, sample, rng: db.promote_waitlisted()),
+        ("set_student_grades", "grades", False, lambda db, sample, rng: db.set_student_grades(*grade_sheet(sample, rng))),
+        ("add_payment", "financial", False,
+         lambda db, sample, rng: db.add_payment(Payment(parent_id=rng.choice(sample["parents"])[0], amount=round(rng.uniform(50, 500), 2),
+                                                        payment_date=date(2025, rng.randint(1, 12), rng.randint(1, 28)),
+                                                        description="Benchmark payment"))),
+        ("create_task_issue", "tasks", False,
+         lambda db, sample, rng: db.create_task_issue(Task(description="Benchmark task", class_room_id=rng.choice(sample["class_rooms"])[0]))),
+        ("assign_task_to_employee", "tasks", False,
+         lambda db, sample, rng: db.assign_task_to_employee(rng.choice(sample["employees"])[0], rng.choice(sample["tasks"])[0])),
+        ("update_task_status", "tasks", False,
+         lambda db, sample, rng: db.update_task_status(rng.choice(sample["tasks"])[0], rng.choice(["Pending", "In Progress", "Completed"]))),
+        ("update_user_password", "login", False,
+         lambda db, sample, rng: db.update_user_password(rng.choice(sample["users"])[0], f"pw{next(counter)}")),
+        ("create_user", "admin", False, lambda db, sample, rng: db.create_user(new_student(sample, rng))),
+        ("create_classroom", "admin", False,
+         lambda db, sample, rng: db.create_classroom(ClassRoom(name=f"Bench Room {next(counter)}", capacity=30, location="Bench"))),
+        ("create_course", "admin", False, create_course),
+        ("insert_into_schedule", "admin", False, insert_into_schedule),
+    ]
+
+
+
+# Drops and recreates the benchmark database, creates the schema and loads a generated data set.
+# - Clears the reference cache so no entry of the previous data set survives.
+# - Returns the scale plan counts reported by the loader: {table: rows}.
+def seed_database(users, courses, seed):
+    with DatabaseManager(to_use_database=False) as db_manager:
+        with db_manager._cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS {database_manager.DATABASE_NAME}")
+        db_manager.initialize_database()
+        db_manager.create_tables(tables)
+        db_manager.create_views(views)
+        db_manager.create_procedures(procedures)
+        with db_manager._cursor() as cursor:
+            cursor.execute(f"USE {database_manager.DATABASE_NAME}")
+        stats = bulk_load(db_manager, generate_tables(users, courses, seed))
+    get_reference_cache().clear()
+    return {table_name: rows for table_name, (rows, _) in stats.items()}
+
+
+
+# Samples the IDs used by the operations from the seeded database.
+def sample_ids(db_manager, seed):
+    sample = {}
+    with db_manager._cursor() as cursor:
+        for name, query in SAMPLE_QUERIES.items():
+            cursor.execute(f"SELECT * FROM ({query}) sampled ORDER BY RAND(%s) LIMIT {SAMPLE_SIZE}", (seed,))
+            sample[name] = cursor.fetchall()
+    return sample
+
+
+
+# Returns the value at the given percentile (0-100) of an already sorted list, using the nearest-rank method.
+def percentile(sorted_samples, pct):
+    rank = max(1, -(-len(sorted_samples) * pct // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+
+# Runs one operation `iterations` times and summarizes the latencies (in milliseconds) and throughput.
+# - Messages the DatabaseManager prints while running are discarded so they do not skew the timings.
+# - A generator returned by the operation (an open stream) is closed after its timing is taken.
+def measure(db_manager, operation, sample, rng, iterations):
+    samples = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(iterations):
+            started = time.perf_counter()
+            result = operation(db_manager, sample, rng)
+            samples.append((time.perf_counter() - started) * 1000)
+            # Close a returned stream outside the timed section, so discarding its unread rows is not measured
+            if isinstance(result, types.GeneratorType):
+                result.close()
+    samples.sort()
+    total_seconds = sum(samples) / 1000
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p95_ms": round(percentile(samples, 95), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+        "mean_ms": round(sum(samples) / iterations, 4),
+        "throughput_ops": round(iterations / total_seconds, 2) if total_seconds > 0 else None,
+    }
+
+
+
+# Seeds the database at every scale and benchmarks every operation.
+# - Returns the list of result rows, the reference cache counters of every scale ({users: stats}) and the hot
+#   queries that needed a full table scan ({users: [(query name, table)]}, only scales with a full scan).
+def run_suite(scales, iterations, seed, only=None):
+    results = []
+    cache_stats = {}
+    full_scans = {}
+    operations = [operation for operation in build_operations() if not only or operation[0] in only]
+    for users in scales:
+        courses = max(1, users // 20)
+        print(f"\n=== Scale: {users} users, {courses} courses ===")
+        row_counts = seed_database(users, courses, seed)
+        rng = random.Random(seed)
+        with DatabaseManager() as db_manager:
+            scans = explain_hot_queries(db_manager)
+            for query_name, table in scans:
+                print(f"Full table scan on `{table}` in {query_name}")
+            if scans:
+                full_scans[users] = scans
+            sample = sample_ids(db_manager, seed)
+            print(f"{'operation':<36}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>12}")
+            for name, group, heavy, operation in operations:
+                required = [key for key, rows in sample.items() if not rows]
+                runs = max(1, iterations // HEAVY_DIVISOR) if heavy else iterations
+                try:
+                    stats = measure(db_manager, operation, sample, rng, runs)
+                except IndexError:
+                    print(f"{name:<36}skipped (no sample rows for: {', '.join(required)})")
+                    continue
+                results.append({"scale_users": users, "scale_courses": courses, "rows": row_counts,
+                                "operation": name, "group": group, **stats})
+                print(f"{name:<36}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+                      f"{stats['throughput_ops'] or 0:>12,.0f}")
+            cache_stats[users] = db_manager.cache_stats()
+            print(f"Reference cache: {cache_stats[users]['hits']} hits, {cache_stats[users]['misses']} misses")
+    close_connection_pool()
+    return results, cache_stats, full_scans
+
+
+
+# Returns the short hash of the checked-out commit, or None when git is not available.
+def current_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except Exception:
+        return None
+
+
+
+# Prints the p50 change of every operation against an earlier results file.
+def compare_results(previous_path, results):
+    with open(previous_path, "r", encoding="utf-8") as file:
+        previous = json.load(file)
+    baseline = {(row["scale_users"], row["operation"]): row for row in previous["results"]}
+    print(f"\n=== Compared with {previous_path} (commit {previous['meta'].get('commit')}) ===")
+    print(f"{'scale':>8}  {'operation':<36}{'before p50':>12}{'after p50':>12}{'change':>10}")
+    for row in results:
+        before = baseline.get((row["scale_users"], row["operation"]))
+        if before is None:
+            continue
+        change = (row["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100 if before["p50_ms"] else 0.0
+        print(f"{row['scale_users']:>8}  {row['operation']:<36}{before['p50_ms']:>12.3f}{row['p50_ms']:>12.3f}{change:>+9.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every DatabaseManager operation on seeded data sets.")
+    parser.add_argument("--scales", type=lambda value: int(float(value)), nargs="+", default=[2000, 20000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--operations", nargs="+", help="Only run these operations")
+    parser.add_argument("--host", default=DB_CONFIG["host"])
+    parser.add_argument("--port", type=int, default=DB_CONFIG["port"])
+    parser.add_argument("--user", default=DB_CONFIG["user"])
+    parser.add_argument("--password", default=DB_CONFIG["password"])
+    parser.add_argument("--database", default="academy_of_tomorrow_bench",
+                        help="Benchmark database; it is dropped and recreated for every scale")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="Results JSON of an earlier run to compare against")
+    args = parser.parse_args()
+    if args.database == database_manager.DATABASE_NAME:
+        parser.error(f"refusing to drop the application database `{args.database}`; pick another --database")
+
+    DB_CONFIG.update(host=args.host, port=args.port, user=args.user, password=args.password)
+    database_manager.DATABASE_NAME = args.database
+
+    results, cache_stats, full_scans = run_suite(args.scales, args.iterations, args.seed, args.operations)
+    report = {
+        "meta": {
+            "commit": current_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "host": f"{args.host}:{args.port}",
+            "iterations": args.iterations,
+            "seed": args.seed,
+        },
+        "results": results,
+        "reference_cache": cache_stats,
+        "full_scans": full_scans,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare_results(args.compare, results)
+    if full_scans:
+        sys.exit("Hot queries needed a full table scan; see the EXPLAIN check above.")
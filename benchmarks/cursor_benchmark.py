@@ -0,0 +1,89 @@
+# Microbenchmark for the hot read queries of DatabaseManager.
+# - "before" runs each query the old way: a new, never-closed client-side cursor per call, re-parsing the SQL text every time.
+# - "after" runs the same query through the DatabaseManager method, which reuses a cached server-side prepared statement.
+#   get_course is served from the reference cache, so its "after" calls the uncached loader (`_load_course`) instead.
+# - Expects the database to be seeded with initiation/dummy-data.json (run main.py and answer 'y' to seeding first).
+# Usage: python benchmarks/cursor_benchmark.py [--iterations 2000]
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import dotenv
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+
+from databaseManager.database_manager import DatabaseManager
+from classes.courses_enrollments import CourseEnrollment
+
+
+# Each entry: (label, legacy SQL, legacy params, callable running the same lookup through DatabaseManager)
+def hot_queries(db_manager):
+    enrollment = CourseEnrollment(course_id=1, student_id=3)
+    return [
+        ("get_user",
+         "SELECT * FROM Users WHERE email = %s", ("john.doe@example.com",),
+         lambda: db_manager.get_user("john.doe@example.com")),
+        ("get_course",
+         "SELECT * FROM Courses WHERE id = %s", (1,),
+         lambda: db_manager._load_course(1)),
+        ("fetch_enrollment_count_for_course",
+         "SELECT COUNT(*) FROM CourseEnrollments WHERE course_id = %s", (1,),
+         lambda: db_manager.fetch_enrollment_count_for_course(enrollment)),
+        ("is_child_registered",
+         "SELECT COUNT(*) as count FROM CourseEnrollments WHERE course_id = %s AND student_id = %s", (1, 3),
+         lambda: db_manager.is_child_registered(enrollment)),
+        ("get_waitlist",
+         """SELECT Queue.student_id, Users.name AS student_name, Queue.registered_at
+            FROM Queue JOIN users ON Queue.student_id = Users.id
+            WHERE Queue.course_id = %s ORDER BY Queue.registered_at ASC""", (1,),
+         lambda: db_manager.get_waitlist(1)),
+        ("fetch_courses_for_student",
+         """SELECT ce.course_id, c.name AS course_name, s.date AS course_date, s.time AS course_time, cr.name AS class_room_name
+            FROM CourseEnrollments ce
+            JOIN Schedules s ON ce.course_id = s.course_id
+            JOIN Courses c ON ce.course_id = c.id
+            JOIN classRooms cr ON s.class_room_id = cr.id
+            WHERE ce.student_id = %s ORDER BY s.date, s.time""", (3,),
+         lambda: db_manager.fetch_courses_for_student(3)),
+        ("fetch_grades",
+         """SELECT ce.course_id, c.name AS course_name, ce.grade
+            FROM CourseEnrollments ce JOIN Courses c ON ce.course_id = c.id
+            WHERE ce.student_id = %s""", (3,),
+         lambda: db_manager.fetch_grades(3)),
+    ]
+
+
+# Times `iterations` calls of `func` and returns the per-call latencies in microseconds.
+def time_calls(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def run_benchmark(iterations):
+    with DatabaseManager() as db_manager:
+        print(f"{'query':<36}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+        for label, query, params, prepared_call in hot_queries(db_manager):
+            def legacy_call():
+                cursor = db_manager.conn.cursor(dictionary=True)
+                cursor.execute(query, params)
+                return cursor.fetchall()
+
+            # Warm up both paths so the prepared statement is already cached
+            legacy_call()
+            prepared_call()
+            before = statistics.median(time_calls(legacy_call, iterations))
+            after = statistics.median(time_calls(prepared_call, iterations))
+            print(f"{label:<36}{before:>14.1f}{after:>14.1f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-call latency of hot DatabaseManager reads, before/after prepared statements.")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    run_benchmark(args.iterations)
@@ -0,0 +1,103 @@
+# Benchmark for DatabaseManager.get_child_position_in_waitlist on long waitlists.
+# - Seeds one temporary course with N waitlisted students inside a transaction and rolls it back afterwards,
+#   so the database is left untouched.
+# - "before" runs the old correlated COUNT(*) subquery plus the separate name lookup.
+# - "after" runs the single query over the queue_positions view.
+# - Positions are sampled at the front, middle and back of the waitlist.
+# Usage: python benchmarks/waitlist_position_benchmark.py [--sizes 10000 50000] [--iterations 200]
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import dotenv
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+
+from databaseManager.database_manager import DatabaseManager
+
+LEGACY_POSITION_QUERY = """
+    SELECT COUNT(*) + 1 AS position
+    FROM Queue
+    WHERE course_id = %s
+    AND registered_at < (
+        SELECT registered_at
+        FROM Queue
+        WHERE course_id = %s AND student_id = %s
+    )
+"""
+LEGACY_NAME_QUERY = "SELECT name FROM users WHERE id = %s"
+
+
+# Inserts a throwaway course and `size` students waiting for it; returns the course ID and the student IDs in queue order.
+# - Everything is written inside the caller's open transaction.
+def seed_waitlist(cursor, size, batch_size=5000):
+    cursor.execute("INSERT INTO Courses (name, description, max_capacity) VALUES (%s, %s, %s)",
+                   ("Benchmark Course", "Temporary course for the waitlist benchmark", 0))
+    course_id = cursor.lastrowid
+    run_id = uuid.uuid4().hex[:8]
+    started = datetime(2025, 1, 1, 8, 0, 0)
+    student_ids = []
+    for offset in range(0, size, batch_size):
+        count = min(batch_size, size - offset)
+        cursor.executemany("INSERT INTO Users (name, email, role) VALUES (%s, %s, 'student')",
+                           [(f"Bench Student {offset + i}", f"bench.{run_id}.{offset + i}@example.com") for i in range(count)])
+        first_id = cursor.lastrowid
+        cursor.execute("SELECT id FROM Users WHERE email LIKE %s AND id >= %s ORDER BY id",
+                       (f"bench.{run_id}.%", first_id))
+        batch_ids = [row[0] for row in cursor.fetchall()]
+        cursor.executemany("INSERT INTO Students (student_id, age) VALUES (%s, %s)",
+                           [(student_id, 12) for student_id in batch_ids])
+        cursor.executemany("INSERT INTO Queue (course_id, student_id, registered_at) VALUES (%s, %s, %s)",
+                           [(course_id, student_id, started + timedelta(seconds=offset + i))
+                            for i, student_id in enumerate(batch_ids)])
+        student_ids.extend(batch_ids)
+    return course_id, student_ids
+
+
+# Times `iterations` calls of `func` and returns the median latency in microseconds.
+def median_latency(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def run_benchmark(sizes, iterations):
+    with DatabaseManager() as db_manager:
+        conn = db_manager.conn
+        print(f"{'waitlist size':>14}{'rank':>8}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+        for size in sizes:
+            conn.start_transaction()
+            try:
+                with db_manager._cursor() as cursor:
+                    course_id, student_ids = seed_waitlist(cursor, size)
+
+                    def legacy_lookup(student_id):
+                        cursor.execute(LEGACY_POSITION_QUERY, (course_id, course_id, student_id))
+                        cursor.fetchone()
+                        cursor.execute(LEGACY_NAME_QUERY, (student_id,))
+                        cursor.fetchone()
+
+                    for rank in (1, size // 2, size):
+                        student_id = student_ids[rank - 1]
+                        expected = db_manager.get_child_position_in_waitlist(student_id, course_id)
+                        assert expected["position"] == rank, expected
+                        before = median_latency(lambda: legacy_lookup(student_id), iterations)
+                        after = median_latency(lambda: db_manager.get_child_position_in_waitlist(student_id, course_id), iterations)
+                        print(f"{size:>14}{rank:>8}{before:>14.1f}{after:>14.1f}{before / after:>9.2f}x")
+            finally:
+                conn.rollback()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Waitlist position lookup latency on long waitlists.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.iterations)
@@ -1,17 +1,14 @@
 # Imports necessary classes and modules:
-# - Classes: Course, CourseEnrollment, Parent, Student, Task, Teacher, Employee, User, Schedule.
-# - Modules: date and datetime from the datetime library for handling dates and timestamps.
-from classes.class_room import ClassRoom
-from classes.course import Course
-from classes.courses_enrollments import CourseEnrollment
+# - Classes: Parent, Student, Teacher, Employee, User.
+# - Services: the course, registration, task, finance and user service functions the menu options call.
+# - Modules: date from the datetime library for handling dates.
 from classes.parent import Parent
 from classes.student import Student
-from classes.task import Task
 from classes.teacher import Teacher
 from classes.employee import Employee
 from classes.user import User
-from classes.schedule import Schedule
-from datetime import date,datetime
+from services import course_service, finance_service, registration_service, task_service, user_service
+from datetime import date
 
 
 
@@ -68,8 +65,8 @@ class Manager(User):
             print(f"Invalid role '{role}' entered.")
             return
 
-        # Use the DatabaseManager to add the user
-        user_id = db_manager.create_user(user)
+        # Use the user service to add the user
+        user_id = user_service.add_user(db_manager, user)
         if user_id:
             print(f"User '{full_name}' with role '{role}' added successfully! User ID: {user_id}")
         else:
@@ -82,7 +79,7 @@ class Manager(User):
 # - Validates the date and time inputs using the correct format (YYYY-MM-DD for date and HH:MM for time).
 # - Retrieves available classrooms from the database and displays options for selection.
 # - Creates a new Course and Schedule object with the provided details.
-# - Saves the course and schedule to the database using the database manager.
+# - Saves the course and its schedule through the course service.
 # - Prints a success message upon successful creation of the course.
     def create_new_course(self,db_manager):
 
@@ -90,44 +87,34 @@ class Manager(User):
         course_name = input("Enter course name: ").strip()
         course_description = input("Enter course description: ").strip()
         teacher_id = input("Enter teacher ID: ").strip()
-        class_rooms = db_manager.get_class_rooms()
-        for room in class_rooms:
+        for room in course_service.list_class_rooms(db_manager):
             print(f"{room['id']}. {room['name']} - ({room['capacity']}) - classroom id =  {room['id']}")
         class_room_id = input("Enter classroom id from the above options: : ").strip()
         course_capacity = input("Enter Course capacity: ").strip()
 
     # Validate and parse course date
         while True:
-            course_date = input("Enter Course Scheduled date (YYYY-MM-DD): ").strip()
+            course_date = input("Enter Course Scheduled date (YYYY-MM-DD): ")
             try:
-                parsed_date = datetime.strptime(course_date, '%Y-%m-%d').date()
+                parsed_date = course_service.parse_course_date(course_date)
                 break
             except ValueError:
                 print("Invalid date format. Please enter the date in YYYY-MM-DD format.")
 
         # Validate and parse course time
         while True:
-            course_time = input("Enter Course Scheduled time (HH:MM, 24-hour format): ").strip()
+            course_time = input("Enter Course Scheduled time (HH:MM, 24-hour format): ")
             try:
-                parsed_time = datetime.strptime(course_time, '%H:%M').time()
+                parsed_time = course_service.parse_course_time(course_time)
                 break
             except ValueError:
                 print("Invalid time format. Please enter the time in HH:MM format.")
-        new_course = Course(
-            name = course_name,
-            description = course_description,
-            teacher_id = teacher_id,
-            max_capacity = course_capacity,
-            class_room_id = class_room_id
-        )
-        schedule = Schedule(
-            teacher_id = teacher_id,
-            date = parsed_date,
-            time = parsed_time,
-            class_room_id = class_room_id
-        )
-        db_manager.create_course(new_course,schedule)
-        print(f'Course {course_name} created successfully!')
+        course_id = course_service.create_course(db_manager, course_name, course_description, teacher_id,
+                                                 class_room_id, course_capacity, parsed_date, parsed_time)
+        if course_id:
+            print(f'Course {course_name} created successfully!')
+        else:
+            print(f'Failed to create course {course_name}.')
     
 
 
@@ -138,43 +125,41 @@ class Manager(User):
 #   1. Assign the first student in the waitlist to the course.
 #   2. Remove the first student from the waitlist.
 #   3. Exit the waitlist management menu.
-# - Uses the database manager to update the waitlist or course enrollments based on the selected option.
+# - Uses the registration service to update the waitlist or course enrollments based on the selected option.
 # - Prints appropriate messages for each action taken and returns the success status of the operation.
     def manage_waitlists(self,db_manager):
         self.wait_list_courses_status(db_manager)
         course_id = input("Enter course ID: ")
-        course = db_manager.get_course(course_id)
+        course, waitlists = registration_service.course_waitlist(db_manager, course_id)
         if not course:
             print("Course not found. Check the course ID and try again.")
             return
         print(f"--- Waitlist for Course: {course['name']} ---")
         print('\n')
-        waitlists = db_manager.get_waitlist(course_id)
-        if not waitlists:
+        waitlisted = 0
+        for waitlisted, student in enumerate(waitlists, start=1):
+            print(f"{waitlisted}. {student['student_name']} | Registered: {student['registered_at']}")
+        if not waitlisted:
             print("No students in the waitlist.")
         else:
-            for i, student in enumerate(waitlists, start=1):
-                        print(f"{i}. {student['student_name']} | Registered: {student['registered_at']}")
             print('\n')
         option = view_manage_waitlist_options()
         print('\n')
-        student = Student(
-            id = waitlists[0]['student_id'],
-            name = waitlists[0]['student_name'],
-        )
         if option == '1':
-            course_enrollment = CourseEnrollment(
-                student_id = student.id,
-                course_id = course_id
-            )
-            db_manager.insert_child_to_course(course_enrollment)
-            db_manager.remove_student_from_waitlist(student.id,course_id)
-            print("Student assigned to the course successfully.")
+            try:
+                if registration_service.assign_first_from_waitlist(db_manager, course_id):
+                    print("Student assigned to the course successfully.")
+                else:
+                    print("No students in the waitlist.")
+            except Exception as e:
+                print(f"An error occurred while assigning the student to the course: {e}")
             print('\n')
             return True
         elif option == '2':
-            db_manager.remove_student_from_waitlist(student.id,course_id)
-            print("Student removed from the waitlist.")
+            if registration_service.remove_first_from_waitlist(db_manager, course_id):
+                print("Student removed from the waitlist.")
+            else:
+                print("No students in the waitlist.")
             print('\n')
             return True
         elif option == '3':
@@ -185,6 +170,30 @@ class Manager(User):
 
 
 
+# Fills the free seats of all courses (or of the chosen ones) with waitlisted students in one go.
+# - Prompts for a comma-separated list of course IDs; leaving it empty promotes students in every course.
+# - Moves the longest-waiting students first and commits all moves together through the registration service.
+# - Prints every student that was moved, followed by the number of students moved and the throughput.
+    def promote_waitlisted_students(self, db_manager):
+        course_ids = input("Enter course IDs separated by commas (leave empty for all courses): ").strip()
+        try:
+            course_ids = [int(course_id) for course_id in course_ids.split(",")] if course_ids else None
+        except ValueError:
+            print("Course IDs must be numbers.")
+            return False
+        result = registration_service.promote_waitlists(db_manager, course_ids)
+        promoted = result['promoted']
+        if promoted is None:
+            print("No students were moved.")
+            return False
+        for student in promoted:
+            print(f"{student['course_name']} | {student['student_name']} (waitlist position {student['position']}, registered {student['registered_at']})")
+        print(f"Moved {len(promoted)} students in {result['seconds']:.3f}s ({result['per_second']:,.0f} students/s)")
+        print('\n')
+        return True
+
+
+
 # Manages tasks for employees.
 # - Prompts the user with task management options and performs actions based on the selected option:
 #   1. Create a new task and assign it to an employee:
@@ -204,35 +213,32 @@ class Manager(User):
         option = view_manage_employy_tasks_options()
         print('\n')
         if option == '1':
-            class_rooms = db_manager.get_class_rooms()
-            for room in class_rooms:
+            for room in course_service.list_class_rooms(db_manager):
                 print(f"{room['id']}. {room['name']} - ({room['capacity']}) - classroom id =  {room['id']}")
             class_room_id = input("Enter classroom id from the above options: : ").strip()
             issue = input("Enter the issue description: ")
-            new_issue = Task(
-                description = issue,
-                status = "Pending",
-                class_room_id = class_room_id
-            )
-            task_id = db_manager.create_task_issue(new_issue)
             employee_id = input("Enter employee ID: ")
-            db_manager.assign_task_to_employee(employee_id,task_id)
-            print("Task assigned to employee successfully.")
+            try:
+                task_service.create_task(db_manager, issue, class_room_id, employee_id)
+                print("Task assigned to employee successfully.")
+            except Exception as e:
+                print(f"Failed to create the task: {e}")
             return True
         elif option == '2':
-            tasks = db_manager.get_all_tasks()
-            if not tasks:
+            listed = 0
+            for listed, task in enumerate(task_service.iter_tasks(db_manager), start=1):
+                print(f"{listed}. taskId: {task['id']} | {task['description']} | Status: {task['status']} | assigned to: {task['employee_name']}")
+            if not listed:
                 print("No tasks found.")
-            else:
-                for i, task in enumerate(tasks, start=1):
-                    print(f"{i}. taskId: {task['id']} | {task['description']} | Status: {task['status']} | assigned to: {task['employee_name']}")
             print('\n')
             return True
         elif option == '3':
             task_id = input("Enter task ID: ")
             new_status = input("Enter new status: (Completed/In progress/Pending)").strip()
-            db_manager.update_task_status(task_id,new_status)
-            print("Task status updated successfully.")
+            if task_service.update_task_status(db_manager, task_id, new_status):
+                print("Task status updated successfully.")
+            else:
+                print("Task status not updated.")
             print('\n')
             return True
         elif option == '4':
@@ -244,46 +250,37 @@ class Manager(User):
 
 
 # Manages financial reports for the system.
-# - Retrieves total income details from the database and displays them using the view_income_report function.
-# - Retrieves teacher salaries and displays them using the view_teachers_salaries function.
-# - Retrieves employee salaries and displays them using the view_employees_salaries function.
-# - Calculates the total expenses by summing teacher and employee salaries.
-# - Prints the total outcome (expenses) and the net balance (income minus expenses).
+# - Builds the report with the finance service; totals and breakdowns are aggregated by the database.
+# - Displays the totals, the income per month and the income of every parent using the view_financial_summary function.
+# - On request, streams the individual payments with view_income_report and lists the salaries using
+#   view_teachers_salaries and view_employees_salaries.
     def manage_financial_reports(self,db_manager):
-        income_details = db_manager.get_total_income()
-        total_income = view_income_report(income_details)
-        teacher_salaries = db_manager.get_teachers_salary()
-        total_teachers_outcome = view_teachers_salaries(teacher_salaries)
-        employees_salaries = db_manager.get_employees_salary()
-        total_employees_outcome = view_employees_salaries(employees_salaries)
-        total_outcome = total_teachers_outcome + total_employees_outcome
-        print(f"\nTotal Outcome: {total_outcome:.2f}\n")
-        # Print net balance
-        net_balance = total_income - total_outcome
-        print(f"Net Balance: {net_balance:.2f}")
+        summary = finance_service.financial_summary(db_manager)
+        if summary is None:
+            print("Failed to build the financial report.")
+            return
+        view_financial_summary(summary)
+        if input("Show payment and salary details? (y/n): ").strip().lower() == 'y':
+            view_income_report(finance_service.income_details(db_manager))
+            teacher_salaries, employee_salaries = finance_service.salary_details(db_manager)
+            view_teachers_salaries(teacher_salaries)
+            view_employees_salaries(employee_salaries)
 
     def add_new_classroom(self,db_manager):
         classroom_name = input("Enter classroom name: ")
         capacity = input("Enter classroom capacity: ")
         location = input("Enter classroom location: ")
-        new_class_room = ClassRoom(
-            name = classroom_name,
-            capacity = capacity,
-            location =  location
-        )
-
-        db_manager.create_classroom(new_class_room)
+        course_service.add_class_room(db_manager, classroom_name, capacity, location)
         print("Classroom added successfully.")    
 
     def wait_list_courses_status(self,db_manager):
-        wait_list_courses = db_manager.waitlist_course_status()
-        if not wait_list_courses:
+        found = False
+        for course in registration_service.oversubscribed_courses(db_manager):
+            found = True
+            print(f"{course['registered_students']} Registered students for : {course['name']} | is grater than 5 , the system reccomend to open a new course ")
+            print('\n')
+        if not found:
             print("No courses with waitlist found.")
-        else:
-            for i, course in enumerate(wait_list_courses, start=1):
-                if(course['registered_students'] >= 5):
-                    print(f"{course['registered_students']} Registered students for : {course['name']} | is grater than 5 , the system reccomend to open a new course ")
-                    print('\n')
         return True
 
 # Displays options for managing a course waitlist.
@@ -315,19 +312,36 @@ def view_manage_employy_tasks_options():
 
 
 
-# Displays the income report and calculates the total income.
-# - Iterates through the provided income_details, which include payments made by parents.
+# Displays the financial summary.
+# - Prints the total income, the income per month and the income per parent, highest amount first.
+# - Prints the teacher and employee salary totals, the total outcome (expenses) and the net balance (income minus expenses).
+def view_financial_summary(summary):
+    print(f"\nTotal Income: {summary['total_income']:.2f} ({summary['payments_count']} payments)")
+    print("\nIncome per Month:")
+    for month in summary['by_month']:
+        print(f"{month['month']} | Amount: {month['amount']:.2f} | Payments: {month['payments']}")
+    print(f"\nIncome per Parent ({len(summary['by_parent'])} parents):")
+    for parent in summary['by_parent']:
+        print(f"Parent: {parent['parent_name']} | Amount: {parent['amount']:.2f} | Payments: {parent['payments']}")
+    print(f"\nTotal Teachers Salaries: {summary['total_teachers_salaries']:.2f}")
+    print(f"Total Employees Salaries: {summary['total_employees_salaries']:.2f}")
+    print(f"\nTotal Outcome: {summary['total_outcome']:.2f}\n")
+    print(f"Net Balance: {summary['net_balance']:.2f}")
+
+
+
+# Displays the income report.
+# - Iterates through the provided income_details (a list or a stream of payments made by parents).
 # - For each payment, displays the parent's name, payment amount, and description.
-# - Calculates and prints the total income from all payments.
-# - Returns the calculated total income.
+# - Returns the number of payments displayed.
 def view_income_report(income_details):
-    total_income = 0
+    count = 0
     print("\nIncome Details:")
     for payment in income_details:
-        total_income += payment["amount"]
+        count += 1
         print(f"Parent: {payment['parent_name']} | Amount: {payment['amount']:.2f} | Description: {payment['description']}")
-    print(f"Total Income: {total_income:.2f}\n")
-    return total_income
+    print(f"{count} payments\n")
+    return count
 
 
 
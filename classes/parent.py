@@ -1,14 +1,8 @@
 # Imports necessary classes and modules:
-# - CourseEnrollment: Represents a student's enrollment in a course.
 # - User: Represents a generic user in the system.
-# - Queue: Represents the waitlist or queue for a course.
-# - Payment: Represents payment details made by users (e.g., parents).
-# - datetime: Provides utilities for handling date and time operations.
-from classes.courses_enrollments import CourseEnrollment
+# - registration_service / finance_service: The service functions behind the parent menu options.
 from classes.user import User
-from classes.queue import Queue
-from classes.payment import Payment
-from datetime import datetime
+from services import finance_service, registration_service
 
 
 
@@ -24,115 +18,50 @@ class Parent(User):
 
 # Registers a child to a course or adds them to the waitlist if the course is full.
 # - Prompts the user for the child's ID and the course ID.
-# - Checks if the course exists and if the child is already registered or in the waitlist.
-# - If the child is not registered and the course has space, the child is enrolled.
-# - If the course is full, the child is added to the waitlist.
+# - Lets the registration service check the course, existing registrations and capacity and
+#   enroll or waitlist the child in a single locked transaction.
 # - Prints relevant messages based on the action taken (registration or waitlist).
-# - Displays the waitlist status if the child is added to the waitlist.
+# - Displays the child's waitlist position if the child is added to the waitlist.
     def register_child_to_course(self,db_manager):
         child_id = input("Enter child id: ")
         course_id = input("Enter course id: ")
-        course = db_manager.get_course(course_id)
-        is_child_added_to_wait_list = False
-        if course is not None:
-            course_enrollment = CourseEnrollment(
-                        student_id = child_id,
-                        course_id = course_id,
-                        grade = None,
-
-                    )
-            course_capacity = course['max_capacity']
-            current_capacity = db_manager.fetch_enrollment_count_for_course(course_enrollment)
-            is_child_registered = db_manager.is_child_registered(course_enrollment)
-            is_child_in_waitlist = db_manager.is_child_in_waitlist(course_enrollment)
-            if (is_child_registered):    
-                print('child is already registered')
-            elif(is_child_in_waitlist):
-                print('child is already in waitlist')
-            else:
-                if(current_capacity < course_capacity):
-                    is_child_added_to_course = db_manager.insert_child_to_course(course_enrollment)
-                    if is_child_added_to_course:
-                        print(f"Child {child_id} registered to course {course_id}")
-                    else:
-                        print(f"Something Went Wrong while registering child {child_id} to course {course_id}")
-                else:
-                    queue_entry = Queue(
-                        student_id =child_id,
-                        course_id =course_id,
-                        registered_at = datetime.now()
-                       )
-                    is_child_added_to_wait_list = db_manager.add_child_to_waitlist(queue_entry)
-                    if is_child_added_to_wait_list:
-                        print(f"Course {course['name']} is full. your child has been added to the waitlist")
-                    else:
-                        print(f"Something went wrong while adding child {child_id} to waitlist")
-            if(is_child_added_to_wait_list):
-                print("--- Waitlist Status ---")
-                course_waitlist = db_manager.get_waitlist(course_id)
-                for i, student in enumerate(course_waitlist, start=1):
-                    print(f"{i}. {student['student_name']} | Registered: {student['registered_at']}")
+        result = registration_service.register_child(db_manager, child_id, course_id)
+        if result is None:
+            print(f"Something Went Wrong while registering child {child_id} to course {course_id}")
+            return
+        status = result['status']
+        if status == 'course_not_found':
+            print(f"Course {course_id} not found")
+        elif status == 'already_registered':
+            print('child is already registered')
+        elif status == 'already_waitlisted':
+            print('child is already in waitlist')
+        elif status == 'enrolled':
+            print(f"Child {child_id} registered to course {course_id}")
+        elif status == 'waitlisted':
+            print(f"Course {result['course_name']} is full. your child has been added to the waitlist")
+            print("--- Waitlist Status ---")
+            print(f"Child {child_id} is at position {result['position']} in the waitlist")
     
 
 
 # Retrieves and returns the progress of children (students) for a parent.
-# - Retrieves a list of students associated with the parent using the parent's ID.
+# - Builds the progress report with the registration service.
 # - If no students are found, returns a message indicating no students for the parent.
-# - Retrieves course enrollments and waitlist status for the students.
-# - Calls a method `build_student_progress` to compile and return the progress data.
     def get_children_progress(self,db_manager):
         """Main function to get children progress for a parent."""
-        # Step 1: Retrieve students
-        students = db_manager.get_students_by_parent_id(self.id)
-        if not students:
+        progress = registration_service.children_progress(db_manager, self.id)
+        if progress is None:
             return f"No students found for parent_id {self.id}"
-
-        # Step 2: Get student IDs
-        student_ids = [student['student_id'] for student in students]
-
-        # Step 3: Retrieve enrollments and waitlists
-        enrollments = db_manager.get_course_enrollments(student_ids)
-        waitlists = db_manager.get_waitlist_status(student_ids)
-
-        # Step 4: Build and return the progress data
-        return self.build_student_progress(students, enrollments, waitlists)
+        return progress
     
 
 
 # Combines student data with course enrollments and waitlist status to build a progress report.
-# - Iterates through the list of students and for each student, gathers their course enrollments and waitlist information.
-# - Adds course names and grades for enrolled courses, and marks the course as "Waitlist" if the student is in the waitlist.
-# - Compiles the student’s name along with their courses and status (enrolled or waitlisted) into a dictionary.
-# - Returns a list of dictionaries containing each student's progress data.
+# - See `registration_service.build_student_progress` for the format of the report.
     def build_student_progress(self,students, enrollments, waitlists):
         """Combine student data with course enrollments and waitlist status."""
-        progress = []
-
-        for student in students:
-            student_data = {
-                "student_name": student['student_name'],
-                "courses": []
-            }
-
-            # Add course enrollments
-            for enrollment in enrollments:
-                if enrollment['student_id'] == student['student_id']:
-                    student_data["courses"].append({
-                        "course_name": enrollment['course_name'],
-                        "grade": enrollment.get('grade')
-                    })
-
-            # Add waitlist courses
-            for waitlist in waitlists:
-                if waitlist['student_id'] == student['student_id']:
-                    student_data["courses"].append({
-                        "course_name": waitlist['course_name'],
-                        "status": "Waitlist"
-                    })
-
-            progress.append(student_data)
-
-        return progress
+        return registration_service.build_student_progress(students, enrollments, waitlists)
 
 
 
@@ -157,12 +86,15 @@ class Parent(User):
 
 # Checks and displays a child's position in the waitlist for a specific course.
 # - Prompts the user for the child's ID and the course ID.
-# - Retrieves the child's position in the waitlist using the database manager.
+# - Retrieves the child's position in the waitlist using the registration service.
 # - Prints the child's name and their position in the waitlist for the specified course.
     def check_waitlist_status(self,db_manager):
         child_id = input("Enter child id: ")
         course_id = input("Enter course id: ")
-        child = db_manager.get_child_position_in_waitlist(child_id,course_id)
+        child = registration_service.waitlist_position(db_manager, child_id, course_id)
+        if not child:
+            print(f"Child {child_id} is not in the waitlist for course {course_id}")
+            return
         print(f"Child {child['student_name']} is at position {child['position']} in the waitlist")
 
 
@@ -170,9 +102,7 @@ class Parent(User):
 # Processes a payment for the parent.
 # - Prompts the user to input the payment amount and validates that it is greater than zero.
 # - Asks for a description of the payment.
-# - Retrieves the current date and formats it correctly.
-# - Creates a new Payment object with the provided information.
-# - Calls the database manager's `add_payment` method to insert the payment into the database.
+# - Records the payment (dated today) through the finance service.
 # - Prints a success or failure message based on whether the payment was successfully created.
 # - Catches and prints any errors that occur during the process.
     def make_payment(self,db_manager):
@@ -190,19 +120,8 @@ class Parent(User):
             # Get description
             description = input("Enter description: ").strip()
 
-            # Get the current date in the correct format
-            payment_date = datetime.now().strftime('%Y-%m-%d')
-
-            # Prepare payment information
-            payment_info = Payment(
-                parent_id = self.id,
-                amount = amount,
-                payment_date = payment_date,
-                description = description
-            )
-
-            # Call add_payment to insert into the database
-            if db_manager.add_payment( payment_info):
+            # Record the payment through the finance service
+            if finance_service.make_payment(db_manager, self.id, amount, description):
                 print("Payment created successfully.")
             else:
                 print("Failed to create payment.")
@@ -3,7 +3,8 @@
 # The role is automatically set to "student".
 # Stores age, grade level, and parent ID as private attributes for the student.
 from classes.user import User
-from datetime import datetime,timedelta
+from services import course_service, grade_service
+from services.course_service import format_course_schedule
 
 class Student(User):
     """Represents a Student."""
@@ -75,108 +76,29 @@ class Student(User):
 
 
 # Fetches, groups, and displays the course schedule for the student.
-# - Retrieves courses associated with the student from the database.
+# - Retrieves the student's courses grouped by day of the week from the course service.
 # - If no courses are found, it prints a message indicating this.
-# - Groups the courses by day of the week using the group_courses_by_day function.
 # - Formats the grouped courses into a readable schedule format using the format_course_schedule function.
 # - Prints the formatted schedule for the student.
     def view_schedule(self,db_manager):
         """Main function to fetch, group, and display the course schedule."""
-        # Step 1: Fetch courses for the student
-        courses = db_manager.fetch_courses_for_student(self.id)
-        if not courses:
+        # Step 1: Fetch the courses grouped by the day of the week
+        schedule_by_day = course_service.student_schedule(db_manager, self.id)
+        if not schedule_by_day:
             print("No courses found for this student.")
             return
 
-        # Step 2: Group courses by the day of the week
-        schedule_by_day = group_courses_by_day(courses)
-        # print(schedule_by_day)
-        # Step 3: Format the schedule for display
+        # Step 2: Format the schedule for display
         formatted_schedule = format_course_schedule(schedule_by_day)
 
-        # Step 4: Print the schedule
+        # Step 3: Print the schedule
         print(formatted_schedule)
 
 
 
 # Fetches and displays the student's grades for each course.
-# - Retrieves the grades for the student from the database.
-# - For each course, it checks if the grade is available; if not, it displays "In Progress".
+# - Retrieves the grades for the student from the grade service, which reports missing grades as "In Progress".
 # - Prints the course name along with the corresponding grade or "In Progress" if no grade is assigned.
     def view_grades(self,db_manager):
-        grades = db_manager.fetch_grades(self.id)
-        for course in grades:
-            course_name = course['course_name']
-            grade = course['grade']
-            grade_display = "In Progress" if grade is None else grade
-            print("Course: ", course_name, "| Grade: ", grade_display)
-
-
-
-# Groups courses by the day of the week based on their scheduled date.
-# - Iterates over each course and checks its `course_date`, which can be a datetime or string.
-# - Converts the `course_date` to a `datetime.date` object if it's a string or datetime.
-# - Extracts the day of the week from the date and groups courses by that day.
-# - Stores the grouped courses (course name, time, classroom) in a dictionary, where keys are days of the week.
-# - Returns the dictionary of courses grouped by day.
-# Helper functions      
-def group_courses_by_day(courses):
-    """Group courses by the day of the week."""
-    schedule_by_day = {}
-    for course in courses:
-        try:
-            # Use the course_date directly if it's already a datetime.date object
-            if isinstance(course['course_date'], datetime):
-                course_date = course['course_date'].date()
-            elif isinstance(course['course_date'], str):
-                course_date = datetime.strptime(course['course_date'], '%Y-%m-%d').date()
-            else:
-                course_date = course['course_date']  # Assume it's a datetime.date object
-
-            # Get the day of the week
-            day_of_week = course_date.strftime('%A')
-
-            # Add the course to the respective day
-            if day_of_week not in schedule_by_day:
-                schedule_by_day[day_of_week] = []
-
-            schedule_by_day[day_of_week].append({
-                "course_name": course['course_name'],
-                "course_time": course['course_time'],
-                "class_room_name": course['class_room_name']
-            })
-        except Exception as e:
-            print(f"An error occurred while grouping courses: {e}")
-    return schedule_by_day
-
-
-
-# Formats the course schedule for display in a readable format.
-# - Iterates through the `schedule_by_day` dictionary, which contains courses grouped by day.
-# - For each course, if the course time is a `timedelta`, it converts it to a formatted string in "HH:MM AM/PM" format.
-# - If the course time is invalid, it raises a ValueError.
-# - Adds course details such as name, time, and classroom to the formatted schedule.
-# - The final formatted schedule is returned as a string, with days and courses neatly displayed.
-def format_course_schedule(schedule_by_day):
-    """Format the course schedule for display."""
-    formatted_schedule = "\n"
-    for day, courses in schedule_by_day.items():
-        formatted_schedule += f"{day}:\n"  # Add the day header
-        for course in courses:
-            try:
-                # Convert timedelta to time
-                if isinstance(course['course_time'], timedelta):
-                    total_seconds = course['course_time'].total_seconds()
-                    hours = int(total_seconds // 3600)
-                    minutes = int((total_seconds % 3600) // 60)
-                    # Format the time as AM/PM
-                    time_formatted = datetime.strptime(f"{hours:02}:{minutes:02}", "%H:%M").strftime("%I:%M %p")
-                else:
-                    raise ValueError("Invalid time format")
-
-                # Add formatted course details to the schedule
-                formatted_schedule += f"- {course['course_name']} | {time_formatted} | Room {course['class_room_name']}\n"
-            except Exception as e:
-                print(f"An error occurred while formatting course: {e}")
-        formatted_schedule += "\n"  # Add a blank line between days
-    return formatted_schedule
\ No newline at end of file
+        for course in grade_service.student_grades(db_manager, self.id):
+            print("Course: ", course['course_name'], "| Grade: ", course['grade'])
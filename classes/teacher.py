@@ -1,5 +1,5 @@
-from classes.task import Task
 from classes.user import User
+from services import course_service, grade_service, task_service
 from datetime import date
 
 
@@ -77,52 +77,76 @@ class Teacher(User):
 # - Retrieves the list of courses for the teacher from the database.
 # - Prints the course name and associated classroom name for each course.
     def view_teacher_courses(self,db_manager):
-        teacher_courses = db_manager.fetch_courses_for_teacher(self.id)
-        for course in teacher_courses:
+        for course in course_service.teacher_courses(db_manager, self.id):
             print(f"Course Name: {course['name']}, Class Room: {course['class_room_name']}")
 
 
 
 # Allows the teacher to enter grades for students in a specific course.
 # - Prompts the teacher to input the course ID and retrieves the list of students enrolled in the course.
-# - For each student, displays their current grade and asks the teacher to input a new grade.
-# - Updates the student's grade in the database.
+# - Offers to import the grades from a CSV grade sheet (columns "student_id" and "grade") instead of typing them.
+# - Otherwise, for each student, displays their current grade and asks the teacher to input a new grade
+#   (empty keeps the current grade; invalid grades are asked again).
+# - Saves all entered grades in one transaction through the grade service.
 # - Prints a success message after entering the grades or an error message if no students are found or the course is not assigned to the teacher.
     def enter_grades(self, db_manager):
         print("Enter Grades")
         course_id = input("Enter course id: ")
-        students = db_manager.fetch_students_in_course(course_id, self.id)
-        if students:
+        students = grade_service.course_students(db_manager, course_id, self.id)
+        sheet_path = input("Grade sheet CSV file (leave empty to enter the grades one by one): ").strip() if students else ""
+        if sheet_path:
+            self.import_grade_sheet(db_manager, course_id, sheet_path)
+        elif students:
+            grades = {}
             for student in students:
-                grade = input(f"Student id: {student['student_id']} | name {student['student_name']} | current grade: {student ['current_grade']} | Enter new grade: ").strip()
-                db_manager.set_student_grade(student['student_id'],course_id,grade)
-
-            print("Grade entered successfully")
+                while True:
+                    grade = input(f"Student id: {student['student_id']} | name {student['student_name']} | current grade: {student ['current_grade']} | Enter new grade: ")
+                    try:
+                        grades[student['student_id']] = grade_service.parse_grade(grade)
+                        break
+                    except ValueError as e:
+                        print(f"Invalid grade: {e}. Please try again.")
+            if grade_service.enter_grades(db_manager, course_id, grades) or not any(grade is not None for grade in grades.values()):
+                print("Grade entered successfully")
+            else:
+                print("The grades could not be saved; none of them were changed.")
         else:
             print("No students found for the given course id or the course isn't assigned to you.")
 
 
 
+# Imports the grades of a course from a CSV grade sheet and prints a summary.
+# - Invalid rows are listed and nothing is saved until the sheet is fixed.
+# - Students in the sheet who are not enrolled in the course are listed and skipped.
+    def import_grade_sheet(self, db_manager, course_id, sheet_path):
+        try:
+            result = grade_service.import_grade_sheet(db_manager, course_id, self.id, sheet_path)
+        except (OSError, ValueError) as e:
+            print(f"Could not read the grade sheet: {e}")
+            return
+        for error in result['errors']:
+            print(f"Invalid row, {error}")
+        if result['not_enrolled']:
+            print(f"Not enrolled in the course, skipped: {', '.join(str(student_id) for student_id in result['not_enrolled'])}")
+        if result['saved'] or result['errors'] or not result['graded']:
+            print(f"{result['saved']} grades saved.")
+        else:
+            print("The grade sheet could not be saved; none of the grades were changed.")
+
+
+
 # Allows the teacher to report an issue with a classroom.
 # - Retrieves and displays the list of available classrooms.
 # - Prompts the teacher to select a classroom and enter a description of the issue.
-# - Creates a new task with the issue details and sets its status to "Pending."
-# - Saves the issue to the database and prints a success message with the task ID.
+# - Creates a "Pending" task for the issue through the task service and prints a success message with the task ID.
 # - Handles any exceptions that occur during the process and prints an error message.
     def report_class_issue(self,db_manager):
         try:
-            class_rooms = db_manager.get_class_rooms()
-            for room in class_rooms:
+            for room in course_service.list_class_rooms(db_manager):
                 print(f"{room['id']}. {room['name']} - ({room['capacity']}) - classroom id =  {room['id']}")
             class_room_id = input("Enter classroom id from the above options: : ").strip()
             issue = input("Enter the issue description: ")
-            new_issue = Task(
-                description = issue,
-                status = "Pending",
-                class_room_id = class_room_id
-            )
-            task_id = db_manager.create_task_issue(new_issue)
-            if task_id:
-                print(f"Task created successfully with ID: {task_id}")
+            task_id = task_service.create_task(db_manager, issue, class_room_id)
+            print(f"Task created successfully with ID: {task_id}")
         except Exception as e:
-            print(f"An error occurred while making the payment: {e}")
\ No newline at end of file
+            print(f"An error occurred while creating the task: {e}")
\ No newline at end of file
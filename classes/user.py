@@ -3,6 +3,7 @@
 # - Stores the user details, with the password being assigned a default value of "111".
 # - This class serves as the base for different user types (e.g., teacher, student, parent).
 import re
+from services import user_service
 class User:
     def __init__(self, id=None, name="", email="", role="", password="111"):
         self._id = id
@@ -115,6 +116,6 @@ class User:
         old_password = input("Please Enter old password: ")
         if old_password == self._password:
             new_password = input("Please Enter new password: ")
-            db_manager.update_user_password(self._id, new_password)
+            user_service.change_password(db_manager, self._id, self._password, old_password, new_password)
         else:
             print("Incorrect old password. Password update failed.")
\ No newline at end of file
@@ -0,0 +1,605 @@
+# Asyncio counterpart of DatabaseManager, built on aiomysql (pip install aiomysql).
+# - Covers the per-request operations of the menus (users, registration, waitlists, schedules, grades, payments,
+#   tasks) with the same method names, arguments and return values as DatabaseManager, but every method is a coroutine.
+#   It is used by benchmarks/async_concurrency_benchmark.py and is not a full replacement for DatabaseManager.
+# - Not available here; use DatabaseManager for the schema setup, the caches, `transaction()`, the keyset pages and
+#   `iter_*` streams, `get_financial_summary`, `set_student_grades`, `promote_waitlisted` and `rebuild_payment_ledger`.
+# - Connections come from a shared aiomysql pool and are held only for the duration of one call,
+#   so a single AsyncDatabaseManager can serve many concurrent sessions (e.g. behind a web or chat front-end).
+import databaseManager.database_manager as database_manager
+from databaseManager.database_manager import DB_CONFIG
+from classes.parent import Parent
+from classes.student import Student
+from classes.teacher import Teacher
+from classes.employee import Employee
+from classes.manager import Manager
+import asyncio
+import aiomysql
+
+
+
+# Configuration dictionary for the process-wide aiomysql pool.
+# - 'minsize': Number of connections opened when the pool is created.
+# - 'maxsize': Maximum number of open connections; further callers wait for a free one.
+# - 'pool_recycle': Seconds after which an idle connection is replaced, like 'idle_timeout' in POOL_CONFIG.
+ASYNC_POOL_CONFIG = {
+    'minsize': 1,
+    'maxsize': 20,
+    'pool_recycle': 300,
+}
+
+_async_pool = None
+_async_pool_lock = None
+
+
+
+# Returns the process-wide aiomysql pool, creating it from DB_CONFIG and ASYNC_POOL_CONFIG on first use.
+# - The pool belongs to the event loop that created it; call `close_async_pool()` before starting another loop.
+async def get_async_pool():
+    global _async_pool, _async_pool_lock
+    if _async_pool_lock is None:
+        _async_pool_lock = asyncio.Lock()
+    async with _async_pool_lock:
+        if _async_pool is None:
+            _async_pool = await aiomysql.create_pool(
+                host=DB_CONFIG["host"],
+                port=DB_CONFIG["port"],
+                user=DB_CONFIG["user"],
+                password=DB_CONFIG["password"],
+                db=database_manager.DATABASE_NAME,
+                autocommit=False,
+                **ASYNC_POOL_CONFIG
+            )
+        return _async_pool
+
+
+
+# Closes all pooled connections; the next call creates a fresh pool.
+async def close_async_pool():
+    global _async_pool, _async_pool_lock
+    if _async_pool is not None:
+        _async_pool.close()
+        await _async_pool.wait_closed()
+    _async_pool = None
+    _async_pool_lock = None
+
+
+
+# Manages asynchronous database operations.
+# - Borrows a connection from the shared aiomysql pool for every call and returns it as soon as the call is done.
+# - Read helpers roll back afterwards so a pooled connection never keeps an open snapshot; write helpers commit.
+# - Errors are handled like in DatabaseManager: the error is printed and None, False or [] is returned.
+class AsyncDatabaseManager:
+    """Handles asynchronous database operations."""
+    def __init__(self, pool=None):
+        self._pool = pool
+
+    async def __aenter__(self):
+        await self._get_pool()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+# The shared pool stays open for other managers; use `close_async_pool()` to shut it down.
+    async def close(self):
+        self._pool = None
+
+    async def _get_pool(self):
+        if self._pool is None:
+            self._pool = await get_async_pool()
+        return self._pool
+
+
+
+# Runs a read query on a pooled connection and returns all rows (dictionaries by default).
+    async def _fetch_all(self, query, params=None, dictionary=True):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            try:
+                async with conn.cursor(aiomysql.DictCursor if dictionary else aiomysql.Cursor) as cursor:
+                    await cursor.execute(query, params)
+                    return await cursor.fetchall()
+            finally:
+                await conn.rollback()
+
+
+
+# Runs a write query on a pooled connection, commits it and returns the ID of the inserted row (if any).
+# - Rolls back and re-raises on error.
+    async def _execute(self, query, params=None):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query, params)
+                    await conn.commit()
+                    return cursor.lastrowid
+            except Exception:
+                await conn.rollback()
+                raise
+
+
+
+                                                     # User Functions
+
+
+
+# Fetches a user by email; returns the user dictionary or None.
+    async def get_user(self, email):
+        try:
+            rows = await self._fetch_all("SELECT * FROM Users WHERE email = %s", (email,))
+            return rows[0] if rows else None
+        except Exception as e:
+            print(f"An error occurred while fetching the user: {e}")
+            return None
+
+    async def update_user_password(self, id, new_password):
+        try:
+            await self._execute("UPDATE Users SET password = %s WHERE id = %s", (new_password, id))
+            print("Password updated successfully.")
+        except Exception as e:
+            print(f"An error occurred while updating the password: {e}")
+
+
+
+                                             # Manager Functions
+
+
+
+# Inserts a user and its role-specific row in one transaction; returns the new user ID or None.
+    async def create_user(self, user):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("""
+                        INSERT INTO Users (name, email, role, password)
+                        VALUES (%s, %s, %s, %s)
+                    """, (user.name, user.email, user.role, user.password))
+                    user.id = cursor.lastrowid
+
+                    if isinstance(user, Manager):
+                        await cursor.execute("INSERT INTO Managers (manager_id) VALUES (%s)", (user.id,))
+                    elif isinstance(user, Parent):
+                        await cursor.execute("INSERT INTO Parents (parent_id) VALUES (%s)", (user.id,))
+                    elif isinstance(user, Student):
+                        await cursor.execute("""
+                            INSERT INTO Students (student_id, age, grade_level, parent_id)
+                            VALUES (%s, %s, %s, %s)
+                        """, (user.id, user.age, user.grade_level, user.parent_id))
+                    elif isinstance(user, Teacher):
+                        await cursor.execute("""
+                            INSERT INTO Teachers (teacher_id, specialization, hire_date, salary)
+                            VALUES (%s, %s, %s, %s)
+                        """, (user.id, user.specialization, user.hire_date, user.salary))
+                    elif isinstance(user, Employee):
+                        await cursor.execute("""
+                            INSERT INTO Employees (employee_id, salary)
+                            VALUES (%s, %s)
+                        """, (user.id, user.salary))
+
+                    await conn.commit()
+                    return user.id
+            except Exception as e:
+                await conn.rollback()
+                print(f"Error creating user: {e}")
+                return None
+
+
+
+# Creates a course and its schedule in one transaction; returns the new course ID or None.
+    async def create_course(self, course, schedule):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(
+                        "INSERT INTO Courses (name, description, teacher_id, max_capacity) VALUES (%s, %s, %s, %s)",
+                        (course.name, course.description, course.teacher_id, course.max_capacity)
+                    )
+                    course_id = cursor.lastrowid
+                    schedule.course_id = course_id
+                    await cursor.execute(
+                        "INSERT INTO Schedules (course_id, teacher_id, date, time, class_room_id) VALUES (%s, %s, %s, %s, %s)",
+                        (schedule.course_id, schedule.teacher_id, schedule.date, schedule.time, schedule.class_room_id))
+                    await conn.commit()
+                    return course_id
+            except Exception as e:
+                await conn.rollback()
+                print(f"An error occurred while creating the course: {e}")
+                return None
+
+    async def get_class_rooms(self):
+        try:
+            return await self._fetch_all("SELECT * FROM ClassRooms")
+        except Exception as e:
+            print(f"An error occurred while fetching class rooms: {e}")
+            return None
+
+    async def insert_into_schedule(self, schedule):
+        try:
+            return await self._execute(
+                "INSERT INTO Schedules (course_id, teacher_id, date, time, class_room_id) VALUES (%s, %s, %s, %s, %s)",
+                (schedule.course_id, schedule.teacher_id, schedule.date, schedule.time, schedule.class_room_id))
+        except Exception as e:
+            print(f"An error occurred while inserting into the schedule: {e}")
+            return None
+
+    async def get_course(self, course_id):
+        try:
+            rows = await self._fetch_all("SELECT * FROM Courses WHERE id = %s", (course_id,))
+            return rows[0] if rows else None
+        except Exception as e:
+            print(f"An error occurred while fetching course: {e}")
+            return None
+
+    async def remove_student_from_waitlist(self, student_id, course_id):
+        try:
+            await self._execute("DELETE FROM Queue WHERE student_id = %s AND course_id = %s", (student_id, course_id))
+            return True
+        except Exception as e:
+            print(f"An error occurred while removing the student from the waitlist: {e}")
+            return False
+
+    async def assign_task_to_employee(self, employee_id, task_id):
+        try:
+            await self._execute("UPDATE tasks SET assigned_to = %s WHERE id = %s", (employee_id, task_id))
+            return True
+        except Exception as e:
+            print(f"An error occurred while managing the employee tasks: {e}")
+            return False
+
+    async def get_all_tasks(self):
+        try:
+            return await self._fetch_all("""
+                SELECT tt.*, us.name as employee_name FROM tasks tt
+                LEFT JOIN users us ON tt.assigned_to = us.id
+            """)
+        except Exception as e:
+            print(f"An error occurred while fetching all tasks: {e}")
+            return None
+
+    async def get_total_income(self):
+        try:
+            return await self._fetch_all("""
+                SELECT p.amount, u.name AS parent_name, p.description
+                FROM payments p
+                JOIN users u ON p.parent_id = u.id
+            """)
+        except Exception as e:
+            print(f"An error occurred while fetching income details: {e}")
+            return None
+
+    async def get_teachers_salary(self):
+        try:
+            return await self._fetch_all("""
+                SELECT t.salary, u.name AS teacher_name
+                FROM teachers t
+                JOIN users u ON t.teacher_id = u.id
+            """)
+        except Exception as e:
+            print(f"An error occurred while fetching teachers' salaries: {e}")
+            return None
+
+    async def get_employees_salary(self):
+        try:
+            return await self._fetch_all("""
+                SELECT e.salary, u.name AS employee_name
+                FROM employees e
+                JOIN users u ON e.employee_id = u.id
+            """)
+        except Exception as e:
+            print(f"An error occurred while fetching teachers' salaries: {e}")
+            return None
+
+    async def create_classroom(self, class_room):
+        try:
+            await self._execute("INSERT INTO ClassRooms (name, capacity, location) VALUES (%s, %s, %s)",
+                                (class_room.name, class_room.capacity, class_room.location))
+            print("Classroom created successfully.")
+        except Exception as e:
+            print(f"An error occurred while creating the classroom: {e}")
+
+    async def waitlist_course_status(self):
+        try:
+            return await self._fetch_all("""
+                SELECT c.id, c.name, COUNT(q.student_id) AS registered_students
+                FROM queue q
+                JOIN courses c ON q.course_id = c.id
+                GROUP BY c.id, c.name
+                ORDER BY registered_students DESC
+            """)
+        except Exception as e:
+            print(f"An error occurred while fetching the course waitlist status: {e}")
+
+
+
+                                                    # Parent Functions
+
+
+
+# Registers a student to a course or waitlists them through the `register_or_enqueue` stored procedure.
+# - Returns {'status', 'position', 'course_name'} like DatabaseManager.register_or_enqueue, or None on error.
+    async def register_or_enqueue(self, student_id, course_id):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.callproc("register_or_enqueue", (student_id, course_id))
+                    row = await cursor.fetchone()
+                    # Drain the procedure's trailing status result so the connection can be reused
+                    while await cursor.nextset():
+                        pass
+                if row is None:
+                    return None
+                status, position, course_name = row
+                return {
+                    "status": status,
+                    "position": position,
+                    "course_name": course_name
+                }
+            except Exception as e:
+                await conn.rollback()
+                print(f"An error occurred while registering the student to the course: {e}")
+                return None
+
+    async def fetch_enrollment_count_for_course(self, course_enrollment):
+        try:
+            rows = await self._fetch_all("SELECT COUNT(*) FROM CourseEnrollments WHERE course_id = %s",
+                                         (course_enrollment.course_id,), dictionary=False)
+            return rows[0][0]
+        except Exception as e:
+            print(f"An error occurred while fetching enrollment count: {e}")
+            return None
+
+    async def is_child_registered(self, course_enrollment):
+        try:
+            rows = await self._fetch_all(
+                "SELECT COUNT(*) as count FROM CourseEnrollments WHERE course_id = %s AND student_id = %s",
+                (course_enrollment.course_id, course_enrollment.student_id))
+            return rows[0]["count"] >= 1 if rows else False
+        except Exception as e:
+            print(f"An error occurred while checking if the student is registered: {e}")
+            return False
+
+    async def is_child_in_waitlist(self, course_enrollment):
+        try:
+            rows = await self._fetch_all("SELECT 1 FROM Queue WHERE course_id = %s AND student_id = %s LIMIT 1",
+                                         (course_enrollment.course_id, course_enrollment.student_id), dictionary=False)
+            return len(rows) > 0
+        except Exception as e:
+            print(f"An error occurred while checking if the student is in the waitlist: {e}")
+            return False
+
+    async def insert_child_to_course(self, course_enrollment):
+        try:
+            await self._execute("INSERT INTO CourseEnrollments (student_id, course_id) VALUES (%s, %s)",
+                                (course_enrollment.student_id, course_enrollment.course_id))
+            return True
+        except Exception as e:
+            print(f"An error occurred while inserting the student to the course: {e}")
+            return False
+
+    async def add_child_to_waitlist(self, queue_entry):
+        try:
+            await self._execute("INSERT INTO Queue (student_id, course_id) VALUES (%s, %s)",
+                                (queue_entry.student_id, queue_entry.course_id))
+            return True
+        except Exception as e:
+            print(f"An error occurred while adding the student to the waitlist: {e}")
+            return False
+
+    async def get_waitlist(self, course_id):
+        try:
+            return await self._fetch_all("""
+                SELECT Queue.student_id, Users.name AS student_name, Queue.registered_at
+                FROM Queue
+                JOIN users ON Queue.student_id = Users.id
+                WHERE Queue.course_id = %s
+                ORDER BY Queue.registered_at ASC
+            """, (course_id,))
+        except Exception as e:
+            print(f"An error occurred while fetching the waitlist: {e}")
+            return None
+
+    async def get_students_by_parent_id(self, parent_id):
+        try:
+            return await self._fetch_all("""
+                SELECT s.student_id, u.name AS student_name
+                FROM Students s
+                JOIN Users u ON s.student_id = u.id
+                WHERE s.parent_id = %s
+            """, (parent_id,))
+        except Exception as e:
+            print(f"Error fetching students for parent_id {parent_id}: {e}")
+            return []
+
+    async def get_course_enrollments(self, student_ids):
+        try:
+            placeholders = ','.join(['%s'] * len(student_ids))
+            return await self._fetch_all(f"""
+                SELECT ce.student_id, c.name AS course_name, ce.grade
+                FROM CourseEnrollments ce
+                JOIN Courses c ON ce.course_id = c.id
+                WHERE ce.student_id IN ({placeholders})
+            """, tuple(student_ids))
+        except Exception as e:
+            print(f"Error fetching course enrollments: {e}")
+            return []
+
+    async def get_waitlist_status(self, student_ids):
+        try:
+            placeholders = ','.join(['%s'] * len(student_ids))
+            return await self._fetch_all(f"""
+                SELECT q.student_id, c.name AS course_name
+                FROM Queue q
+                JOIN Courses c ON q.course_id = c.id
+                WHERE q.student_id IN ({placeholders})
+            """, tuple(student_ids))
+        except Exception as e:
+            print(f"Error fetching waitlist status: {e}")
+            return []
+
+    async def get_child_position_in_waitlist(self, student_id, course_id):
+        try:
+            rows = await self._fetch_all("""
+                SELECT qp.position, u.name AS student_name
+                FROM queue_positions qp
+                JOIN users u ON u.id = qp.student_id
+                WHERE qp.course_id = %s AND qp.student_id = %s
+            """, (course_id, student_id))
+            if rows:
+                return {
+                    "position": rows[0]["position"],
+                    "student_name": rows[0]["student_name"]
+                }
+            return None
+        except Exception as e:
+            print(f"An error occurred while fetching the child's position in the waitlist: {e}")
+            return None
+
+
+
+# Adds a payment and updates the payment ledger in one transaction (see DatabaseManager.add_payment).
+    async def add_payment(self, payment_info):
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                try:
+                    async with conn.cursor() as cursor:
+                        await cursor.execute("""
+                            INSERT INTO Payments (parent_id, amount, payment_date, description)
+                            VALUES (%s, %s, %s, %s)
+                        """, (payment_info.parent_id, payment_info.amount, payment_info.payment_date, payment_info.description))
+                        await cursor.execute("""
+                            INSERT INTO payment_ledger_months (month, total_amount, payment_count)
+                            VALUES (DATE_FORMAT(%s, '%%Y-%%m'), %s, 1)
+                            ON DUPLICATE KEY UPDATE total_amount = total_amount + VALUES(total_amount), payment_count = payment_count + 1
+                        """, (payment_info.payment_date, payment_info.amount))
+                        if payment_info.parent_id is not None:
+                            await cursor.execute("""
+                                INSERT INTO payment_ledger (month, parent_id, total_amount, payment_count)
+                                VALUES (DATE_FORMAT(%s, '%%Y-%%m'), %s, %s, 1)
+                                ON DUPLICATE KEY UPDATE total_amount = total_amount + VALUES(total_amount), payment_count = payment_count + 1
+                            """, (payment_info.payment_date, payment_info.parent_id, payment_info.amount))
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+            return True
+        except Exception as e:
+            print(f"An error occurred while adding the payment: {e}")
+            return None
+
+
+
+                                                        # Student Functions
+
+
+
+    async def fetch_courses_for_student(self, student_id):
+        try:
+            return await self._fetch_all("""
+                SELECT ce.course_id, c.name AS course_name, s.date AS course_date, s.time AS course_time,
+                       cr.name AS class_room_name
+                FROM CourseEnrollments ce
+                JOIN Schedules s ON ce.course_id = s.course_id
+                JOIN Courses c ON ce.course_id = c.id
+                JOIN classRooms cr ON s.class_room_id = cr.id
+                WHERE ce.student_id = %s
+                ORDER BY s.date, s.time
+            """, (student_id,))
+        except Exception as e:
+            print(f"An error occurred while fetching courses: {e}")
+            return []
+
+    async def fetch_grades(self, student_id):
+        try:
+            return await self._fetch_all("""
+                SELECT ce.course_id, c.name AS course_name, ce.grade
+                FROM CourseEnrollments ce
+                JOIN Courses c ON ce.course_id = c.id
+                WHERE ce.student_id = %s
+            """, (student_id,))
+        except Exception as e:
+            print(f"An error occurred while fetching grades: {e}")
+            return []
+
+
+
+                                                # Teacher Functions
+
+
+
+    async def fetch_courses_for_teacher(self, teacher_id):
+        try:
+            return await self._fetch_all("""
+                SELECT c.id, c.name, c.description, c.max_capacity, s.date, s.time, cr.name as class_room_name
+                FROM Courses c
+                JOIN Schedules s ON c.id = s.course_id
+                JOIN ClassRooms cr ON s.class_room_id = cr.id
+                WHERE c.teacher_id = %s
+                ORDER BY s.date, s.time
+            """, (teacher_id,))
+        except Exception as e:
+            print(f"An error occurred while fetching courses: {e}")
+            return []
+
+    async def fetch_students_in_course(self, course_id, teacher_id):
+        try:
+            return await self._fetch_all("""
+                SELECT u.id as student_id, u.name as student_name, ce.grade as current_grade
+                FROM CourseEnrollments ce
+                JOIN Users u ON ce.student_id = u.id
+                JOIN Courses c ON ce.course_id = c.id
+                WHERE ce.course_id = %s AND c.teacher_id = %s
+            """, (course_id, teacher_id))
+        except Exception as e:
+            print(f"An error occurred while fetching students: {e}")
+            return []
+
+    async def set_student_grade(self, student_id, course_id, grade):
+        try:
+            await self._execute("UPDATE CourseEnrollments SET grade = %s WHERE student_id = %s AND course_id = %s",
+                                (grade, student_id, course_id))
+            return True
+        except Exception as e:
+            print(f"An error occurred while setting the student grade: {e}")
+            return False
+
+
+
+                                                        # Employee Functions
+
+
+
+    async def fetch_all_employee_tasks(self, employee_id):
+        try:
+            return await self._fetch_all("SELECT * FROM tasks WHERE assigned_to = %s", (employee_id,))
+        except Exception as e:
+            print(f"An error occurred while fetching the employee tasks: {e}")
+            return None
+
+    async def update_task_status(self, task_id, status):
+        try:
+            await self._execute("UPDATE tasks SET status = %s WHERE id = %s", (status, task_id))
+            return True
+        except Exception as e:
+            print(f"An error occurred while updating the task status: {e}")
+
+    async def check_task_assignee(self, task_id, employee_id):
+        try:
+            rows = await self._fetch_all("SELECT id FROM tasks WHERE id = %s AND assigned_to = %s", (task_id, employee_id))
+            return bool(rows)
+        except Exception as e:
+            print(f"An error occurred while checking the task assignee: {e}")
+            return None
+
+    async def create_task_issue(self, task):
+        try:
+            return await self._execute("INSERT INTO tasks (description, status, class_room_id) VALUES (%s, %s, %s)",
+                                       (task.description, task.status, task.class_room_id))
+        except Exception as e:
+            print(f"An error occurred while creating the task: {e}")
+            return None
@@ -5,21 +5,56 @@ from classes.employee import Employee
 from classes.user import User
 from classes.manager import Manager
 import mysql.connector
+import mysql.connector.errors
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+import threading
+import time
+import weakref
 
 DATABASE_NAME = "academy_of_tomorrow"
 
 # Configuration dictionary for database connection parameters.
 # - 'host': The address of the database server (e.g., 'localhost' for local server).
+# - 'port': The port the database server listens on.
 # - 'user': The username for connecting to the database.
 # - 'password': The password associated with the username for authentication.
+# - 'allow_local_infile': Allows `LOAD DATA LOCAL INFILE`, used by the CSV bulk-load mode of the seeder.
 DB_CONFIG = {
     'host': 'localhost',
+    'port': 3306,
     'user': 'root',
     'password': 'root',
+    'allow_local_infile': False,
 }
 
 
 
+# Configuration dictionary for the process-wide connection pool shared by every DatabaseManager.
+# - 'pool_size': Maximum number of open connections kept by the pool.
+# - 'checkout_timeout': Seconds to wait for a free connection before giving up.
+# - 'health_check': Ping a pooled connection before handing it out and replace it if it is dead.
+# - 'idle_timeout': Seconds a connection may sit unused in the pool before it is closed.
+POOL_CONFIG = {
+    'pool_size': 5,
+    'checkout_timeout': 10,
+    'health_check': True,
+    'idle_timeout': 300,
+}
+
+
+
+# Configuration dictionary for the process-wide cache of slowly changing reference data
+# (class rooms, courses and the course list of each teacher).
+# - 'ttl': Seconds a cached entry is served before it is read from the database again.
+# - 'enabled': Set to False to always read from the database.
+REFERENCE_CACHE_CONFIG = {
+    'ttl': 60,
+    'enabled': True,
+}
+
+
 # Connects to the database using the MySQL connector.
 # - Attempts to establish a connection using provided configuration values (host, user, password, port, timeout).
 # - If successful, prints a success message and returns the connection object.
@@ -29,9 +64,10 @@ def connect_to_database():
         print("Connecting .....")
         conn = mysql.connector.connect(
             host=DB_CONFIG["host"],
+            port=DB_CONFIG["port"],
             user=DB_CONFIG["user"],
             password=DB_CONFIG["password"],
-
+            allow_local_infile=DB_CONFIG["allow_local_infile"],
         )
         print("Connection successful!")
         return conn
@@ -43,15 +79,242 @@ def connect_to_database():
 
 
 
+# Keeps a bounded set of open MySQL connections that are reused across DatabaseManager instances.
+# - Hands out the most recently returned idle connection first so warm connections stay in use.
+# - Closes idle connections that have not been used for longer than `idle_timeout`.
+# - Pings a connection before handing it out (when `health_check` is on) and replaces it if it is dead.
+# - Opens a new connection only when no idle one is available and the pool is below `pool_size`.
+# - Waits up to `checkout_timeout` seconds for a connection to be released, then raises a PoolError.
+class ConnectionPool:
+    """Thread-safe pool of MySQL connections."""
+    def __init__(self, pool_size=5, checkout_timeout=10, health_check=True, idle_timeout=300):
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check = health_check
+        self.idle_timeout = idle_timeout
+        self._idle = []  # (connection, released_at) pairs, most recently released last
+        self._open_connections = 0
+        self._condition = threading.Condition()
+
+
+
+# Borrows a connection from the pool.
+# - Evicts idle connections that expired, then reuses the freshest healthy idle connection.
+# - Opens a new connection if the pool still has room, otherwise waits for a release.
+# - Raises mysql.connector.errors.PoolError if no connection frees up within the checkout timeout.
+    def get_connection(self):
+        deadline = time.monotonic() + self.checkout_timeout
+        with self._condition:
+            while True:
+                self._evict_idle_connections()
+                while self._idle:
+                    conn, _ = self._idle.pop()
+                    if not self.health_check or self._is_healthy(conn):
+                        return conn
+                    self._discard(conn)
+                if self._open_connections < self.pool_size:
+                    self._open_connections += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    raise mysql.connector.errors.PoolError(
+                        f"No database connection became available within {self.checkout_timeout} seconds."
+                    )
+        # Open the connection outside the lock so other callers are not blocked by the handshake
+        try:
+            conn = connect_to_database()
+        except BaseException:
+            with self._condition:
+                self._open_connections -= 1
+                self._condition.notify()
+            raise
+        if conn is None:
+            with self._condition:
+                self._open_connections -= 1
+                self._condition.notify()
+            raise mysql.connector.errors.PoolError("Could not open a new database connection.")
+        return conn
+
+
+
+# Returns a borrowed connection to the pool.
+# - Rolls back any transaction left open so the next borrower starts from a clean state.
+# - Drops the connection instead of pooling it if the rollback fails.
+    def release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except Exception:
+            with self._condition:
+                self._discard(conn)
+                self._condition.notify()
+            return
+        with self._condition:
+            self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+
+
+# Closes every idle connection and resets the pool.
+# - Connections that are currently borrowed are closed when they are released.
+    def close_all(self):
+        with self._condition:
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._discard(conn)
+            self._condition.notify_all()
+
+
+
+# Closes idle connections that have been unused for longer than `idle_timeout` seconds.
+# - The idle list is ordered by release time, so expired connections are always at the front.
+    def _evict_idle_connections(self):
+        if self.idle_timeout is None:
+            return
+        expired_before = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < expired_before:
+            conn, _ = self._idle.pop(0)
+            self._discard(conn)
+
+
+
+# Checks whether a pooled connection is still usable by pinging the server.
+    def _is_healthy(self, conn):
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+
+
+# Closes a connection and frees its slot in the pool.
+    def _discard(self, conn):
+        self._open_connections -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+
+# Read-through cache for reference data shared by every DatabaseManager in the process.
+# - Entries are grouped by namespace ('class_rooms', 'course', 'teacher_courses') and keyed within it.
+# - An entry expires `ttl` seconds after it was loaded; writes invalidate whole namespaces explicitly.
+# - Values of None (not found or failed lookups) are never cached.
+# - Counts hits and misses so the effect of the cache can be measured.
+class ReferenceCache:
+    """Thread-safe TTL cache for reference data."""
+    def __init__(self, ttl=60, enabled=True):
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+
+
+# Returns the cached value for (namespace, key), calling `loader()` and caching its result on a miss.
+    def get(self, namespace, key, loader):
+        if not self.enabled:
+            return loader()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = loader()
+        if value is not None:
+            with self._lock:
+                self._entries[(namespace, key)] = (now + self.ttl, value)
+        return value
+
+
+
+# Drops every entry of the given namespaces.
+    def invalidate(self, *namespaces):
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._entries if cache_key[0] in namespaces]:
+                del self._entries[cache_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+
+# Returns the hit and miss counters, the hit rate and the number of cached entries.
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+
+_connection_pool = None
+_connection_pool_lock = threading.Lock()
+
+_reference_cache = ReferenceCache(**REFERENCE_CACHE_CONFIG)
+
+# Server-side prepared statements cached per connection: {connection: {(query, dictionary): prepared cursor}}.
+# Entries disappear together with their connection, so evicted or dead connections never leak statements.
+_prepared_statements = weakref.WeakKeyDictionary()
+
+
+
+# Returns the process-wide connection pool, creating it from POOL_CONFIG on first use.
+def get_connection_pool():
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            _connection_pool = ConnectionPool(**POOL_CONFIG)
+        return _connection_pool
+
+
+
+# Closes all pooled connections; the next DatabaseManager creates a fresh pool from POOL_CONFIG.
+def close_connection_pool():
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is not None:
+            _connection_pool.close_all()
+            _connection_pool = None
+
+
+
+# Returns the process-wide reference data cache.
+def get_reference_cache():
+    return _reference_cache
+
+
+
 # Manages database connections and operations.
-# - Initializes a connection to the database using the `connect_to_database` function.
+# - Borrows a connection from the shared connection pool instead of opening a new one.
+# - Serves class rooms, courses and teacher course lists from the shared reference cache.
 # - Creates a cursor object for executing SQL queries.
 # - Attempts to select the specified database using `USE` command.
 # - If the database cannot be selected, an error message is printed, and the exception is re-raised to halt execution.
+# - Call `close()` (or use the manager as a context manager) to hand the connection back to the pool.
 class DatabaseManager:
     """Handles database Connections."""
     def __init__(self, to_use_database = True):
-        self.conn = connect_to_database()
+        self._pool = get_connection_pool()
+        self._cache = get_reference_cache()
+        self._transaction_depth = 0
+        self._pending_invalidations = set()
+        self.conn = self._pool.get_connection()
         self.cursor = self.conn.cursor()
         try:
             # Set the database
@@ -59,10 +322,164 @@ class DatabaseManager:
                 self.cursor.execute(f"USE {DATABASE_NAME}")
         except Exception as e:
             print(f"Error selecting database '{DATABASE_NAME}': {e}")
+            self.close()
             raise  # Re-raise the exception to stop execution if the database cannot be selected
 
 
 
+# Returns the borrowed connection to the pool.
+# - Safe to call more than once; after closing, the manager must not be used again.
+    def close(self):
+        if self.conn is None:
+            return
+        try:
+            self.cursor.close()
+        except Exception:
+            pass
+        self._pool.release(self.conn)
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+
+# Opens a cursor for the duration of a `with` block and always closes it afterwards.
+# - Cursors are buffered by default so that closing never trips over unread rows.
+    @contextmanager
+    def _cursor(self, dictionary=False, buffered=True):
+        cursor = self.conn.cursor(dictionary=dictionary, buffered=buffered)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+
+
+# Runs a read query through a server-side prepared statement cached on the current connection.
+# - The statement is prepared once per connection and re-executed with new parameters afterwards.
+# - A statement that fails is dropped from the cache so the next call prepares it again.
+# - Returns all rows (dictionaries by default).
+    def _fetch_prepared(self, query, params, dictionary=True):
+        statements = _prepared_statements.setdefault(self.conn, {})
+        key = (query, dictionary)
+        cursor = statements.get(key)
+        if cursor is None:
+            cursor = self.conn.cursor(prepared=True, dictionary=dictionary)
+            statements[key] = cursor
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        except Exception:
+            statements.pop(key, None)
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            raise
+
+
+
+# Runs a read query on an unbuffered cursor and yields its rows one at a time, `batch_size` rows per fetch.
+# - Rows are pulled from the server as the caller iterates, so memory stays bounded and the first row
+#   arrives before the query has finished sending the rest.
+# - The connection is busy until the generator is exhausted or closed: don't run other queries on this
+#   manager while iterating. Rows left unread when the generator is closed early are discarded.
+# - If the query fails, the error is printed and the stream simply ends.
+    def _stream(self, query, params=None, batch_size=500, dictionary=True):
+        cursor = self.conn.cursor(dictionary=dictionary, buffered=False)
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from rows
+        except Exception as e:
+            print(f"An error occurred while streaming rows: {e}")
+        finally:
+            if self.conn.unread_result:
+                self.conn.consume_results()
+            cursor.close()
+
+
+
+# Groups the changes of several mutating methods into one transaction (unit of work).
+# - Inside the block, mutating methods don't commit on their own: everything is committed once when the block ends,
+#   or rolled back if it raises.
+# - A mutating method that fails inside the block re-raises its error instead of returning False or None, so the rest
+#   of the block is skipped and nothing is half-applied; catch the error around the `with` statement.
+# - Blocks can be nested; only the outermost block commits or rolls back.
+# - The outermost block starts a new transaction: the connection runs with autocommit off, so an earlier read in the
+#   same session would otherwise have fixed a REPEATABLE READ snapshot that the block's consistent reads keep seeing,
+#   even after its locking reads. Only reads are open at that point (mutating methods commit), so they are committed.
+# - Don't call `register_or_enqueue` inside a block: its stored procedure commits on its own.
+    @contextmanager
+    def transaction(self):
+        if not self._transaction_depth:
+            self.conn.commit()
+            self.conn.start_transaction()
+        self._transaction_depth += 1
+        completed = False
+        try:
+            yield self
+            if self._transaction_depth == 1:
+                self.conn.commit()
+            completed = True
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                if not completed:
+                    self.conn.rollback()
+                # Entries loaded while the transaction was open may hold uncommitted or rolled back rows
+                if self._pending_invalidations:
+                    self._cache.invalidate(*self._pending_invalidations)
+                    self._pending_invalidations.clear()
+
+
+
+# Commits the changes of a mutating method, unless a unit of work is open (see `transaction`).
+    def _commit(self):
+        if not self._transaction_depth:
+            self.conn.commit()
+
+
+
+# Rolls back the changes of a mutating method that failed; call it from the `except` block.
+# - Inside a unit of work it re-raises the error instead, so that the whole unit is rolled back.
+    def _rollback(self):
+        if self._transaction_depth:
+            raise
+        try:
+            self.conn.rollback()
+        except Exception:
+            pass
+
+
+
+# Drops cached reference data after a change; inside a unit of work it is dropped again when the unit ends.
+    def _invalidate(self, *namespaces):
+        self._cache.invalidate(*namespaces)
+        if self._transaction_depth:
+            self._pending_invalidations.update(namespaces)
+
+
+
+# Returns the hit/miss counters of the reference data cache (see ReferenceCache.stats).
+    def cache_stats(self):
+        return self._cache.stats()
+
+
+
 # Initializes the database by checking if it exists and creating it if necessary.
 # - Checks if the specified database exists using the `database_exists` method.
 # - If the database does not exist, attempts to create it using the `create_database` method.
@@ -85,9 +502,9 @@ class DatabaseManager:
         """
         Check if a database exists.
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SHOW DATABASES LIKE %s", (db_name,))
-        return cursor.fetchone() is not None
+        with self._cursor() as cursor:
+            cursor.execute("SHOW DATABASES LIKE %s", (db_name,))
+            return cursor.fetchone() is not None
 
 
 
@@ -100,9 +517,9 @@ class DatabaseManager:
         Create the database.
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(f"CREATE DATABASE {db_name} DEFAULT CHARACTER SET 'utf8'")
-            print(f"Database `{db_name}` created successfully.")
+            with self._cursor() as cursor:
+                cursor.execute(f"CREATE DATABASE {db_name} DEFAULT CHARACTER SET 'utf8'")
+                print(f"Database `{db_name}` created successfully.")
         except mysql.connector.Error as err:
             print(f"Failed to create database: {err}")
             exit(1)
@@ -117,16 +534,51 @@ class DatabaseManager:
 # - If an error occurs while creating a table, it prints the error message and exits the program.
     # Table Creation Functions
     def create_tables(self,tables): 
-        cursor = self.conn.cursor()
-        cursor.execute(f"USE {DATABASE_NAME}")
-        for table_name, table_query in tables.items():
-            try:
-                print(f"Creating table `{table_name}`...")
-                cursor.execute(table_query)
-                print(f"Table `{table_name}` created successfully.")
-            except mysql.connector.Error as err:
-                print(f"Error creating table `{table_name}`: {err}")
-                exit(1)
+        with self._cursor() as cursor:
+            cursor.execute(f"USE {DATABASE_NAME}")
+            for table_name, table_query in tables.items():
+                try:
+                    print(f"Creating table `{table_name}`...")
+                    cursor.execute(table_query)
+                    print(f"Table `{table_name}` created successfully.")
+                except mysql.connector.Error as err:
+                    print(f"Error creating table `{table_name}`: {err}")
+                    exit(1)
+
+
+
+# Creates (or replaces) the views in the specified database.
+# - Executes each `CREATE OR REPLACE VIEW` query from the `views` dictionary.
+# - If an error occurs while creating a view, it prints the error message and exits the program.
+    def create_views(self, views):
+        with self._cursor() as cursor:
+            cursor.execute(f"USE {DATABASE_NAME}")
+            for view_name, view_query in views.items():
+                try:
+                    print(f"Creating view `{view_name}`...")
+                    cursor.execute(view_query)
+                    print(f"View `{view_name}` created successfully.")
+                except mysql.connector.Error as err:
+                    print(f"Error creating view `{view_name}`: {err}")
+                    exit(1)
+
+
+
+# Creates (or replaces) the stored procedures in the specified database.
+# - Drops each procedure first so the definition always matches the one in `procedures`.
+# - If an error occurs while creating a procedure, it prints the error message and exits the program.
+    def create_procedures(self, procedures):
+        with self._cursor() as cursor:
+            cursor.execute(f"USE {DATABASE_NAME}")
+            for procedure_name, procedure_query in procedures.items():
+                try:
+                    print(f"Creating procedure `{procedure_name}`...")
+                    cursor.execute(f"DROP PROCEDURE IF EXISTS {procedure_name}")
+                    cursor.execute(procedure_query)
+                    print(f"Procedure `{procedure_name}` created successfully.")
+                except mysql.connector.Error as err:
+                    print(f"Error creating procedure `{procedure_name}`: {err}")
+                    exit(1)
     
 
 
@@ -140,11 +592,9 @@ class DatabaseManager:
 # - If an error occurs while fetching the user, it prints the error message and returns None.
     def get_user(self, email):
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            # Execute the SQL query
-             # Execute the SQL query
-            cursor.execute("SELECT * FROM Users WHERE email = %s", (email,))
-            return cursor.fetchone()
+            # Execute the SQL query through a cached prepared statement
+            rows = self._fetch_prepared("SELECT * FROM Users WHERE email = %s", (email,))
+            return rows[0] if rows else None
         except Exception as e:
             # Log the error and return None if an exception occurs
             print(f"An error occurred while fetching the user: {e}")
@@ -152,11 +602,12 @@ class DatabaseManager:
         
     def update_user_password(self, id, new_password):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("UPDATE Users SET password = %s WHERE id = %s", (new_password, id))  # Execute the SQL query
-            self.conn.commit()  # Commit the transaction
-            print("Password updated successfully.")
+            with self._cursor() as cursor:
+                cursor.execute("UPDATE Users SET password = %s WHERE id = %s", (new_password, id))  # Execute the SQL query
+                self._commit()  # Commit the transaction
+                print("Password updated successfully.")
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while updating the password: {e}")    
 
 
@@ -174,76 +625,77 @@ class DatabaseManager:
         :param user: An instance of User or its subclass.
         :return: The ID of the created user, or None on failure.
         """
-        cursor = self.conn.cursor()
         try:
-            # Insert into Users table
-            cursor.execute("""
-                INSERT INTO Users (name, email, role, password)
-                VALUES (%s, %s, %s, %s)
-            """, (user.name, user.email, user.role, user.password))
+            with self._cursor() as cursor:
+                # Insert into Users table
+                cursor.execute("""
+                    INSERT INTO Users (name, email, role, password)
+                    VALUES (%s, %s, %s, %s)
+                """, (user.name, user.email, user.role, user.password))
 
-            # Get the user ID of the inserted user
-            user.id = cursor.lastrowid
+                # Get the user ID of the inserted user
+                user.id = cursor.lastrowid
 
-            # Insert into role-specific tables
-            if isinstance(user, Manager):
-                cursor.execute("INSERT INTO Managers (manager_id) VALUES (%s)", (user.id,))
+                # Insert into role-specific tables
+                if isinstance(user, Manager):
+                    cursor.execute("INSERT INTO Managers (manager_id) VALUES (%s)", (user.id,))
 
-            elif isinstance(user, Parent):
-                cursor.execute("INSERT INTO Parents (parent_id) VALUES (%s)", (user.id,))
+                elif isinstance(user, Parent):
+                    cursor.execute("INSERT INTO Parents (parent_id) VALUES (%s)", (user.id,))
 
-            elif isinstance(user, Student):
-                cursor.execute("""
-                    INSERT INTO Students (student_id, age, grade_level, parent_id)
-                    VALUES (%s, %s, %s, %s)
-                """, (user.id, user.age, user.grade_level, user.parent_id))
+                elif isinstance(user, Student):
+                    cursor.execute("""
+                        INSERT INTO Students (student_id, age, grade_level, parent_id)
+                        VALUES (%s, %s, %s, %s)
+                    """, (user.id, user.age, user.grade_level, user.parent_id))
 
-            elif isinstance(user, Teacher):
-                cursor.execute("""
-                    INSERT INTO Teachers (teacher_id, specialization, hire_date, salary)
-                    VALUES (%s, %s, %s, %s)
-                """, (user.id, user.specialization, user.hire_date, user.salary))
+                elif isinstance(user, Teacher):
+                    cursor.execute("""
+                        INSERT INTO Teachers (teacher_id, specialization, hire_date, salary)
+                        VALUES (%s, %s, %s, %s)
+                    """, (user.id, user.specialization, user.hire_date, user.salary))
 
-            elif isinstance(user, Employee):
-                cursor.execute("""
-                    INSERT INTO Employees (employee_id, salary)
-                    VALUES (%s, %s)
-                """, (user.id, user.salary))
+                elif isinstance(user, Employee):
+                    cursor.execute("""
+                        INSERT INTO Employees (employee_id, salary)
+                        VALUES (%s, %s)
+                    """, (user.id, user.salary))
 
-            # Commit the transaction
-            self.conn.commit()
-            return user.id
+                # Commit the transaction
+                self._commit()
+                return user.id
 
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             print(f"Error creating user: {e}")
             return None
 
-        finally:
-            cursor.close()
-
 
 
 # Creates a new course in the database and inserts the associated schedule.
 # - Inserts the course details (name, description, teacher ID, max capacity) into the "Courses" table.
-# - Commits the transaction and retrieves the ID of the newly inserted course.
 # - Sets the course ID in the schedule object and calls `insert_into_schedule` to insert the schedule into the database.
+# - The course and its schedule are committed together in one unit of work (see `transaction`), so a course
+#   is never saved without its schedule.
+# - Invalidates the cached courses and teacher course lists.
 # - Returns the ID of the newly created course or None if an error occurs.
     def create_course(self,course, schedule): 
         try:
-            # Execute the SQL query
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO Courses (name, description, teacher_id, max_capacity) VALUES (%s, %s, %s, %s)",
-                (course.name, course.description, course.teacher_id, course.max_capacity)
-            )
-            # Commit the transaction
-            self.conn.commit()
-            schedule.course_id = cursor.lastrowid
-            self.insert_into_schedule(schedule)
-            # Return the ID of the last inserted row
-            return cursor.lastrowid
+            with self.transaction():
+                # Execute the SQL query
+                with self._cursor() as cursor:
+                    cursor.execute(
+                        "INSERT INTO Courses (name, description, teacher_id, max_capacity) VALUES (%s, %s, %s, %s)",
+                        (course.name, course.description, course.teacher_id, course.max_capacity)
+                    )
+                    course_id = cursor.lastrowid
+                self._invalidate("course", "teacher_courses")
+                schedule.course_id = course_id
+                self.insert_into_schedule(schedule)
+            # Return the ID of the inserted course
+            return course_id
         except Exception as e:
+            self._rollback()
             # Log the error and return None if an exception occurs
             print(f"An error occurred while creating the course: {e}")
             return None
@@ -251,18 +703,14 @@ class DatabaseManager:
 
 
 # Fetches all the classrooms from the "ClassRooms" table.
-# - Executes a SELECT query to retrieve all classroom details.
+# - Served from the reference cache; the table is only queried on a miss or after the TTL has expired.
 # - Uses a dictionary cursor to return results in dictionary format.
 # - Returns a list of all classrooms or None if an error occurs during the process.
     def get_class_rooms(self):  
 
         try:
-            # Execute the SQL query
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM ClassRooms")
-            # Fetch all the results
-            class_rooms = cursor.fetchall()
-            return class_rooms  # Return the results
+            class_rooms = self._cache.get("class_rooms", None, self._load_class_rooms)
+            return [dict(room) for room in class_rooms]  # Copies, so callers cannot alter the cached rows
         except Exception as e:
             # Log the error and return None if an exception occurs
             print(f"An error occurred while fetching class rooms: {e}")
@@ -270,23 +718,33 @@ class DatabaseManager:
 
 
 
+    def _load_class_rooms(self):
+        with self._cursor(dictionary=True) as cursor:
+            cursor.execute("SELECT * FROM ClassRooms")
+            return cursor.fetchall()
+
+
+
 # Inserts a new schedule entry into the "Schedules" table.
 # - Executes an SQL query to insert the course ID, teacher ID, date, time, and classroom ID into the schedule.
 # - Commits the transaction if successful and retrieves the ID of the last inserted schedule entry.
+# - Invalidates the cached teacher course lists.
 # - Returns the ID of the newly inserted schedule or None if an error occurs during the insertion.  
     def insert_into_schedule(self, schedule):
 
         try:
             # Execute the SQL query
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO Schedules (course_id, teacher_id, date, time, class_room_id) VALUES (%s, %s, %s, %s, %s)",
-                (schedule.course_id, schedule.teacher_id, schedule.date, schedule.time, schedule.class_room_id))
+            with self._cursor() as cursor:
+                cursor.execute(
+                    "INSERT INTO Schedules (course_id, teacher_id, date, time, class_room_id) VALUES (%s, %s, %s, %s, %s)",
+                    (schedule.course_id, schedule.teacher_id, schedule.date, schedule.time, schedule.class_room_id))
             
-            # Commit the transaction
-            self.conn.commit()
-            return cursor.lastrowid
+                # Commit the transaction
+                self._commit()
+                self._invalidate("teacher_courses")
+                return cursor.lastrowid
         except Exception as e:
+            self._rollback()
             # Log the error and return None if an exception occurs
             print(f"An error occurred while inserting into the schedule: {e}")
             return None
@@ -294,17 +752,14 @@ class DatabaseManager:
 
 
 # Fetches a course from the "Courses" table based on the provided course ID.
-# - Executes a SELECT query to retrieve course details where the ID matches.
+# - Executes a SELECT query to retrieve course details where the ID matches, served from the reference cache.
 # - Returns the first matching course if found or None if no course is found or an error occurs.
 # - Uses a dictionary cursor to return the results in dictionary format.
     def get_course(self,course_id):
         try:
-            # Execute the SQL query
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM Courses WHERE id = %s", (course_id,))
-            # Fetch the result
-            course = cursor.fetchone()
-            return course  # Return the result
+            # IDs typed at the menus arrive as strings, so both forms share one cache entry
+            course = self._cache.get("course", str(course_id), lambda: self._load_course(course_id))
+            return dict(course) if course else None  # Return a copy of the result
         except Exception as e:
             # Log the error and return None if an exception occurs
             print(f"An error occurred while fetching course: {e}")
@@ -312,6 +767,12 @@ class DatabaseManager:
 
 
 
+    def _load_course(self, course_id):
+        rows = self._fetch_prepared("SELECT * FROM Courses WHERE id = %s", (course_id,))
+        return rows[0] if rows else None
+
+
+
 # Removes a student from the waitlist for a specific course.
 # - Executes a DELETE query to remove the student from the "Queue" table where the student ID and course ID match.
 # - Commits the transaction if successful and returns True.
@@ -320,14 +781,15 @@ class DatabaseManager:
 
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM Queue
-                WHERE student_id = %s AND course_id = %s
-            """, (student_id, course_id))
-            self.conn.commit()
-            return True
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    DELETE FROM Queue
+                    WHERE student_id = %s AND course_id = %s
+                """, (student_id, course_id))
+                self._commit()
+                return True
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while removing the student from the waitlist: {e}")
             return False
     
@@ -340,15 +802,16 @@ class DatabaseManager:
     def assign_task_to_employee(self,employee_id,task_id):
     
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
-                UPDATE tasks
-                SET assigned_to = %s
-                WHERE id = %s
-            """, (employee_id, task_id))
-            self.conn.commit()
-            return True
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    UPDATE tasks
+                    SET assigned_to = %s
+                    WHERE id = %s
+                """, (employee_id, task_id))
+                self._commit()
+                return True
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while managing the employee tasks: {e}")
             return False
 
@@ -360,14 +823,42 @@ class DatabaseManager:
     def get_all_tasks(self):
 
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""SELECT tt.*, us.name as employee_name FROM tasks tt
-                           LEFT JOIN users us ON tt.assigned_to = us.id
-                           """)
-            return cursor.fetchall()
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute("""SELECT tt.*, us.name as employee_name FROM tasks tt
+                               LEFT JOIN users us ON tt.assigned_to = us.id
+                               """)
+                return cursor.fetchall()
         except Exception as e:
             print(f"An error occurred while fetching all tasks: {e}")
             return None
+
+
+
+# Fetches one page of tasks (with the assigned employee's name) in task ID order.
+# - Keyset pagination: pass the last 'id' of the previous page as `after_id` to get the next page.
+# - Returns a list of at most `page_size` tasks (empty after the last page), or None if an error occurs.
+    def get_tasks_page(self, after_id=0, page_size=100):
+        try:
+            return self._fetch_prepared("""
+                SELECT tt.*, us.name as employee_name FROM tasks tt
+                LEFT JOIN users us ON tt.assigned_to = us.id
+                WHERE tt.id > %s
+                ORDER BY tt.id
+                LIMIT %s
+            """, (after_id, page_size))
+        except Exception as e:
+            print(f"An error occurred while fetching tasks: {e}")
+            return None
+
+
+
+# Streams all tasks with the assigned employee's name in task ID order (see `_stream`).
+    def iter_tasks(self, batch_size=500):
+        return self._stream("""
+            SELECT tt.*, us.name as employee_name FROM tasks tt
+            LEFT JOIN users us ON tt.assigned_to = us.id
+            ORDER BY tt.id
+        """, batch_size=batch_size)
     
 
 
@@ -376,18 +867,28 @@ class DatabaseManager:
 # - Returns a list of income details, including amount, parent name, and description, or None if an error occurs.
     def get_total_income(self):
         try:
-            cursor = self.conn.cursor(dictionary=True)
+            with self._cursor(dictionary=True) as cursor:
 
-            # Fetch income details from payments
-            cursor.execute("""
-                SELECT p.amount, u.name AS parent_name, p.description 
-                FROM payments p
-                JOIN users u ON p.parent_id = u.id
-            """)
-            return cursor.fetchall()
+                # Fetch income details from payments
+                cursor.execute("""
+                    SELECT p.amount, u.name AS parent_name, p.description 
+                    FROM payments p
+                    JOIN users u ON p.parent_id = u.id
+                """)
+                return cursor.fetchall()
         except Exception as e:
             print(f"An error occurred while fetching income details: {e}")
             return None
+
+
+
+# Streams the income details (amount, parent name, description) of every payment (see `_stream`).
+    def iter_total_income(self, batch_size=500):
+        return self._stream("""
+            SELECT p.amount, u.name AS parent_name, p.description
+            FROM payments p
+            JOIN users u ON p.parent_id = u.id
+        """, batch_size=batch_size)
         
 
 
@@ -396,14 +897,14 @@ class DatabaseManager:
 # - Returns a list of teachers' salaries and names, or None if an error occurs.
     def get_teachers_salary(self):
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            # Fetch outcome details from teachers (salary)
-            cursor.execute("""
-                SELECT t.salary, u.name AS teacher_name
-                FROM teachers t
-                JOIN users u ON t.teacher_id = u.id
-            """)
-            return cursor.fetchall()
+            with self._cursor(dictionary=True) as cursor:
+                # Fetch outcome details from teachers (salary)
+                cursor.execute("""
+                    SELECT t.salary, u.name AS teacher_name
+                    FROM teachers t
+                    JOIN users u ON t.teacher_id = u.id
+                """)
+                return cursor.fetchall()
 
         except Exception as e:
             print(f"An error occurred while fetching teachers' salaries: {e}")
@@ -416,49 +917,225 @@ class DatabaseManager:
 # - Returns a list of employees' salaries and names, or None if an error occurs.
     def get_employees_salary(self):
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            # Fetch outcome details from teachers (salary)
-            cursor.execute("""
-            SELECT e.salary, u.name AS employee_name
-            FROM employees e
-            JOIN users u ON e.employee_id = u.id
-            """)
-            return cursor.fetchall()
+            with self._cursor(dictionary=True) as cursor:
+                # Fetch outcome details from teachers (salary)
+                cursor.execute("""
+                SELECT e.salary, u.name AS employee_name
+                FROM employees e
+                JOIN users u ON e.employee_id = u.id
+                """)
+                return cursor.fetchall()
 
         except Exception as e:
             print(f"An error occurred while fetching teachers' salaries: {e}")
             return None
 
+
+
+# Computes the financial report with SQL aggregation in a single round trip.
+# - One UNION ALL query returns the income, teacher salary and employee salary totals, the income per month
+#   and the income per parent, so no payment rows are transferred.
+# - Every parent who paid is included; pass `top_parents` to keep only that many parents who paid the most.
+# - Income is read from the payment ledger instead of "payments": the totals and the months cost one row per month,
+#   and the top parents are ranked over the per-month parent totals.
+# - Returns a dictionary with 'total_income', 'total_teachers_salaries', 'total_employees_salaries', 'total_outcome',
+#   'net_balance', 'payments_count', 'by_month' ([{month, amount, payments}], oldest first) and
+#   'by_parent' ([{parent_id, parent_name, amount, payments}], highest amount first), or None if an error occurs.
+    def get_financial_summary(self, top_parents=None):
+        try:
+            limit = "" if top_parents is None else "LIMIT %s"
+            params = () if top_parents is None else (top_parents,)
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute(f"""
+                    SELECT 'income' AS section, NULL AS period, NULL AS parent_id, NULL AS parent_name,
+                           COALESCE(SUM(total_amount), 0) AS amount, COALESCE(SUM(payment_count), 0) AS row_count
+                    FROM payment_ledger_months
+                    UNION ALL
+                    SELECT 'teachers_salaries', NULL, NULL, NULL, COALESCE(SUM(salary), 0), COUNT(*)
+                    FROM teachers
+                    UNION ALL
+                    SELECT 'employees_salaries', NULL, NULL, NULL, COALESCE(SUM(salary), 0), COUNT(*)
+                    FROM employees
+                    UNION ALL
+                    SELECT 'month', month, NULL, NULL, total_amount, payment_count
+                    FROM payment_ledger_months
+                    UNION ALL
+                    (SELECT 'parent', NULL, pl.parent_id, u.name, pl.amount, pl.payments
+                     FROM (
+                         SELECT parent_id, SUM(total_amount) AS amount, SUM(payment_count) AS payments
+                         FROM payment_ledger
+                         GROUP BY parent_id
+                         ORDER BY amount DESC
+                         {limit}
+                     ) pl
+                     JOIN users u ON pl.parent_id = u.id)
+                """, params)
+                rows = cursor.fetchall()
+            totals = {row['section']: row for row in rows if row['section'] in ('income', 'teachers_salaries', 'employees_salaries')}
+            total_income = totals['income']['amount']
+            total_outcome = totals['teachers_salaries']['amount'] + totals['employees_salaries']['amount']
+            return {
+                "total_income": total_income,
+                "total_teachers_salaries": totals['teachers_salaries']['amount'],
+                "total_employees_salaries": totals['employees_salaries']['amount'],
+                "total_outcome": total_outcome,
+                "net_balance": total_income - total_outcome,
+                "payments_count": totals['income']['row_count'],
+                "by_month": sorted(
+                    ({"month": row['period'], "amount": row['amount'], "payments": row['row_count']}
+                     for row in rows if row['section'] == 'month'),
+                    key=lambda month: month['month'] or ''
+                ),
+                "by_parent": sorted(
+                    ({"parent_id": row['parent_id'], "parent_name": row['parent_name'], "amount": row['amount'], "payments": row['row_count']}
+                     for row in rows if row['section'] == 'parent'),
+                    key=lambda parent: parent['amount'], reverse=True
+                ),
+            }
+        except Exception as e:
+            print(f"An error occurred while computing the financial summary: {e}")
+            return None
+
+
+
+# Fetches one page of payment details (amount, parent name, description, date) in payment ID order.
+# - Uses keyset pagination: pass the last 'id' of the previous page as `after_id` to get the next page,
+#   so every page costs the same no matter how deep into the history it is.
+# - Returns a list of at most `page_size` payments (empty after the last page), or None if an error occurs.
+    def get_payments_page(self, after_id=0, page_size=100):
+        try:
+            return self._fetch_prepared("""
+                SELECT p.id, p.amount, u.name AS parent_name, p.description, p.payment_date
+                FROM payments p
+                JOIN users u ON p.parent_id = u.id
+                WHERE p.id > %s
+                ORDER BY p.id
+                LIMIT %s
+            """, (after_id, page_size))
+        except Exception as e:
+            print(f"An error occurred while fetching payments: {e}")
+            return None
+
+
+
+# Streams all payment details page by page (see `get_payments_page`), yielding one payment at a time.
+# - Only one page is held in memory; stops early if a page cannot be fetched.
+    def iter_payments(self, page_size=1000):
+        after_id = 0
+        while True:
+            page = self.get_payments_page(after_id, page_size)
+            if not page:
+                return
+            yield from page
+            after_id = page[-1]['id']
+
+
+
+# Rebuilds the payment ledger from the full "payments" history.
+# - Empties "payment_ledger" and "payment_ledger_months" and refills them with one aggregation per table,
+#   all in one transaction, so readers never see a half-built ledger.
+# - Run it after bulk-loading payments or whenever the ledger is suspected to be out of sync; payments added
+#   while it runs are not lost, but may have to wait for the transaction to finish.
+# - Returns the number of (month, parent) rows written, or None if an error occurs.
+    def rebuild_payment_ledger(self):
+        try:
+            with self._cursor() as cursor:
+                cursor.execute("DELETE FROM payment_ledger")
+                cursor.execute("DELETE FROM payment_ledger_months")
+                cursor.execute("""
+                    INSERT INTO payment_ledger (month, parent_id, total_amount, payment_count)
+                    SELECT DATE_FORMAT(payment_date, '%Y-%m'), parent_id, SUM(amount), COUNT(*)
+                    FROM payments
+                    WHERE parent_id IS NOT NULL
+                    GROUP BY DATE_FORMAT(payment_date, '%Y-%m'), parent_id
+                """)
+                ledger_rows = cursor.rowcount
+                cursor.execute("""
+                    INSERT INTO payment_ledger_months (month, total_amount, payment_count)
+                    SELECT DATE_FORMAT(payment_date, '%Y-%m'), SUM(amount), COUNT(*)
+                    FROM payments
+                    GROUP BY DATE_FORMAT(payment_date, '%Y-%m')
+                """)
+                self._commit()
+                return ledger_rows
+        except Exception as e:
+            self._rollback()
+            print(f"An error occurred while rebuilding the payment ledger: {e}")
+            return None
+
     def create_classroom(self,class_room):    
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""  INSERT INTO ClassRooms (name, capacity, location) VALUES (%s, %s, %s) """, (class_room.name, class_room.capacity, class_room.location))
-            self.conn.commit()
-            print("Classroom created successfully.")
+            with self._cursor() as cursor:
+                cursor.execute("""  INSERT INTO ClassRooms (name, capacity, location) VALUES (%s, %s, %s) """, (class_room.name, class_room.capacity, class_room.location))
+                self._commit()
+                self._invalidate("class_rooms")
+                print("Classroom created successfully.")
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while creating the classroom: {e}")    
 
     def waitlist_course_status(self):
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
-            SELECT 
-            c.id, 
-            c.name, 
-            COUNT(q.student_id) AS registered_students
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                SELECT 
+                c.id, 
+                c.name, 
+                COUNT(q.student_id) AS registered_students
+                FROM queue q
+                JOIN courses c ON q.course_id = c.id
+                GROUP BY c.id, c.name
+                ORDER BY registered_students DESC;""")
+                return cursor.fetchall()
+        except Exception as e:  
+            print(f"An error occurred while fetching the course waitlist status: {e}")    
+
+
+
+# Streams the number of waitlisted students per course, longest waitlist first (see `_stream`).
+# - Only courses with at least `min_students` waitlisted students are returned; the filter runs in SQL.
+    def iter_waitlist_course_status(self, min_students=1, batch_size=500):
+        return self._stream("""
+            SELECT c.id, c.name, COUNT(q.student_id) AS registered_students
             FROM queue q
             JOIN courses c ON q.course_id = c.id
             GROUP BY c.id, c.name
-            ORDER BY registered_students DESC;""")
-            return cursor.fetchall()
-        except Exception as e:  
-            print(f"An error occurred while fetching the course waitlist status: {e}")    
+            HAVING COUNT(q.student_id) >= %s
+            ORDER BY registered_students DESC
+        """, (min_students,), batch_size)
                            
 
                                                     # Parent Functions
 
 
 
+# Registers a student to a course, or adds them to the waitlist when the course is full, in a single round trip.
+# - Calls the `register_or_enqueue` stored procedure, which locks the course row, checks capacity and existing
+#   registrations, and inserts into "CourseEnrollments" or "Queue" inside one transaction.
+# - Returns a dictionary with the outcome ('enrolled', 'waitlisted', 'already_registered', 'already_waitlisted'
+#   or 'course_not_found'), the waitlist position (None unless waitlisted) and the course name.
+# - If an error occurs, it logs the error and returns None.
+    def register_or_enqueue(self, student_id, course_id):
+        try:
+            with self._cursor() as cursor:
+                cursor.callproc("register_or_enqueue", (student_id, course_id))
+                row = None
+                for result in cursor.stored_results():
+                    row = result.fetchone()
+                if row is None:
+                    return None
+                status, position, course_name = row
+                return {
+                    "status": status,
+                    "position": position,
+                    "course_name": course_name
+                }
+        except Exception as e:
+            print(f"An error occurred while registering the student to the course: {e}")
+            return None
+
+
+
 # Fetches the number of students enrolled in a specific course.
 # - Executes a SELECT query to count the number of records in the "CourseEnrollments" table for the given course ID.
 # - Returns the count of enrollments for the course or None if an error occurs.
@@ -466,11 +1143,13 @@ class DatabaseManager:
 
         try:
             # Execute the SQL query
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM CourseEnrollments WHERE course_id = %s", (course_enrollment.course_id,))
+            rows = self._fetch_prepared(
+                "SELECT COUNT(*) FROM CourseEnrollments WHERE course_id = %s",
+                (course_enrollment.course_id,),
+                dictionary=False
+            )
             # Fetch the result
-            count = cursor.fetchone()[0]
-            return count  # Return the result
+            return rows[0][0]  # Return the result
         except Exception as e:
             # Log the error and return None if an exception occurs
             print(f"An error occurred while fetching enrollment count: {e}")
@@ -484,14 +1163,12 @@ class DatabaseManager:
 # - Handles any exceptions that occur during the process and logs the error.
     def is_child_registered(self,course_enrollment):
         try:
-            cursor = self.conn.cursor(dictionary=True)
             # Execute the SQL query with parameterized input for safety
-            cursor.execute(
+            rows = self._fetch_prepared(
                 "SELECT COUNT(*) as count FROM CourseEnrollments WHERE course_id = %s AND student_id = %s",
                 (course_enrollment.course_id, course_enrollment.student_id)
             )
-            result = cursor.fetchone()
-            return result["count"] >= 1 if result else False
+            return rows[0]["count"] >= 1 if rows else False
         except Exception as e:
             # Log the error and return False if an exception occurs
             print(f"An error occurred while checking if the student is registered: {e}")
@@ -505,16 +1182,14 @@ class DatabaseManager:
 # - Handles any exceptions that occur during the process and logs the error.
     def is_child_in_waitlist(self,course_enrollment):
         try:
-            cursor = self.conn.cursor()
             # Execute the SQL query with parameterized input for safety
-            cursor.execute("""
+            rows = self._fetch_prepared("""
                 SELECT 1 
                 FROM Queue 
                 WHERE course_id = %s AND student_id = %s 
                 LIMIT 1
-            """, (course_enrollment.course_id, course_enrollment.student_id))
-            result = cursor.fetchone()
-            return result is not None
+            """, (course_enrollment.course_id, course_enrollment.student_id), dictionary=False)
+            return len(rows) > 0
         except Exception as e:
             # Log the error and return False if an exception occurs
             print(f"An error occurred while checking if the student is in the waitlist: {e}")
@@ -528,16 +1203,17 @@ class DatabaseManager:
 # - If an error occurs during the insertion, it logs the error and returns False.
     def insert_child_to_course(self, course_enrollment):
         try:
-            cursor = self.conn.cursor()
-            # Execute the SQL query with parameterized input for safety
-            cursor.execute(
-                "INSERT INTO CourseEnrollments (student_id, course_id) VALUES (%s, %s)",
-                (course_enrollment.student_id, course_enrollment.course_id)
-            )
-            # Commit the transaction
-            self.conn.commit()
-            return True
+            with self._cursor() as cursor:
+                # Execute the SQL query with parameterized input for safety
+                cursor.execute(
+                    "INSERT INTO CourseEnrollments (student_id, course_id) VALUES (%s, %s)",
+                    (course_enrollment.student_id, course_enrollment.course_id)
+                )
+                # Commit the transaction
+                self._commit()
+                return True
         except Exception as e:
+            self._rollback()
             # Log the error and return False if an exception occurs
             print(f"An error occurred while inserting the student to the course: {e}")
             return False
@@ -550,16 +1226,17 @@ class DatabaseManager:
 # - If an error occurs during the insertion, it logs the error and returns False.  
     def add_child_to_waitlist(self, queue_entry):
         try:
-            cursor = self.conn.cursor()
-            # Execute the SQL query with parameterized input for safety
-            cursor.execute(
-                "INSERT INTO Queue (student_id, course_id) VALUES (%s, %s)",
-                (queue_entry.student_id, queue_entry.course_id)
-            )
-            # Commit the transaction
-            self.conn.commit()
-            return True
+            with self._cursor() as cursor:
+                # Execute the SQL query with parameterized input for safety
+                cursor.execute(
+                    "INSERT INTO Queue (student_id, course_id) VALUES (%s, %s)",
+                    (queue_entry.student_id, queue_entry.course_id)
+                )
+                # Commit the transaction
+                self._commit()
+                return True
         except Exception as e:
+            self._rollback()
             # Log the error and return False if an exception occurs
             print(f"An error occurred while adding the student to the waitlist: {e}")
             return False
@@ -577,9 +1254,8 @@ class DatabaseManager:
         Fetch the waitlist for a specific course, including student names and registration dates.
         """
         try:
-            cursor = self.conn.cursor(dictionary=True)
             # Execute the SQL query to join Users and Queue tables
-            cursor.execute("""
+            return self._fetch_prepared("""
                 SELECT 
                     Queue.student_id, 
                     Users.name AS student_name, 
@@ -589,11 +1265,121 @@ class DatabaseManager:
                 WHERE Queue.course_id = %s
                 ORDER BY Queue.registered_at ASC
             """, (course_id,))
-            return cursor.fetchall()
         except Exception as e:
             # Log the error and return None if an exception occurs
             print(f"An error occurred while fetching the waitlist: {e}")
             return None
+
+
+
+# Promotes waitlisted students into free seats, for every course (or only `course_ids`) at once.
+# - Free seats are computed per course as max_capacity minus the current enrollments; each course takes that many
+#   of its longest-waiting queue entries, in the order of the "queue_positions" view (FIFO).
+# - Locks the course rows first, like the `register_or_enqueue` procedure does, so registrations made meanwhile wait
+#   instead of taking the same seats. The enrollments are then counted with a locking read, which sees every committed
+#   registration even when the transaction's snapshot is older than the course locks (e.g. inside an outer unit of work).
+# - Runs as one unit of work (see `transaction`): one multi-row INSERT into "courseEnrollments" and one DELETE from
+#   "queue" per `batch_size` students, then a single commit.
+# - Returns the promoted entries (queue_id, student_id, student_name, course_id, course_name, registered_at, position)
+#   in course and waitlist order, or None if an error occurs (nothing is promoted then).
+    def promote_waitlisted(self, course_ids=None, batch_size=1000):
+        course_filter = "TRUE"
+        params = ()
+        if course_ids is not None:
+            if not course_ids:
+                return []
+            course_filter = f"c.id IN ({','.join(['%s'] * len(course_ids))})"
+            params = tuple(course_ids)
+        try:
+            with self.transaction():
+                with self._cursor(dictionary=True) as cursor:
+                    cursor.execute(f"SELECT c.id, c.max_capacity FROM courses c WHERE {course_filter} ORDER BY c.id FOR UPDATE", params)
+                    capacities = {row['id']: row['max_capacity'] for row in cursor.fetchall()}
+                    cursor.execute(f"""
+                        SELECT ce.course_id, COUNT(*) AS enrolled
+                        FROM courseEnrollments ce
+                        JOIN courses c ON c.id = ce.course_id
+                        WHERE {course_filter}
+                        GROUP BY ce.course_id
+                        FOR SHARE OF ce
+                    """, params)
+                    enrolled = {row['course_id']: row['enrolled'] for row in cursor.fetchall()}
+                    free_seats = [
+                        (course_id, capacity - enrolled.get(course_id, 0))
+                        for course_id, capacity in capacities.items()
+                        if capacity is not None and capacity > enrolled.get(course_id, 0)
+                    ]
+                    if not free_seats:
+                        return []
+                    cases = " ".join(["WHEN %s THEN %s"] * len(free_seats))
+                    cursor.execute(f"""
+                        SELECT qp.id AS queue_id, qp.student_id, u.name AS student_name, qp.course_id,
+                               c.name AS course_name, qp.registered_at, qp.position
+                        FROM queue_positions qp
+                        JOIN courses c ON c.id = qp.course_id
+                        JOIN users u ON u.id = qp.student_id
+                        WHERE qp.position <= CASE qp.course_id {cases} ELSE 0 END
+                        ORDER BY qp.course_id, qp.position
+                    """, [value for seats in free_seats for value in seats])
+                    promoted = cursor.fetchall()
+                    for start in range(0, len(promoted), batch_size):
+                        batch = promoted[start:start + batch_size]
+                        cursor.executemany(
+                            "INSERT INTO courseEnrollments (student_id, course_id) VALUES (%s, %s)",
+                            [(entry['student_id'], entry['course_id']) for entry in batch]
+                        )
+                        cursor.execute(
+                            f"DELETE FROM queue WHERE id IN ({','.join(['%s'] * len(batch))})",
+                            [entry['queue_id'] for entry in batch]
+                        )
+            return promoted
+        except Exception as e:
+            self._rollback()
+            print(f"An error occurred while promoting waitlisted students: {e}")
+            return None
+
+
+
+# Fetches one page of a course's waitlist in registration order.
+# - Keyset pagination on (registered_at, queue_id): pass the last entry of the previous page as `after`
+#   to get the next page; leave it None for the first page. Served by idx_queue_course_registered.
+# - Returns a list of at most `page_size` entries (queue_id, student_id, student_name, registered_at),
+#   or None if an error occurs.
+    def get_waitlist_page(self, course_id, after=None, page_size=100):
+        try:
+            if after is None:
+                return self._fetch_prepared("""
+                    SELECT Queue.id AS queue_id, Queue.student_id, Users.name AS student_name, Queue.registered_at
+                    FROM Queue
+                    JOIN users ON Queue.student_id = Users.id
+                    WHERE Queue.course_id = %s
+                    ORDER BY Queue.registered_at, Queue.id
+                    LIMIT %s
+                """, (course_id, page_size))
+            return self._fetch_prepared("""
+                SELECT Queue.id AS queue_id, Queue.student_id, Users.name AS student_name, Queue.registered_at
+                FROM Queue
+                JOIN users ON Queue.student_id = Users.id
+                WHERE Queue.course_id = %s
+                  AND (Queue.registered_at > %s OR (Queue.registered_at = %s AND Queue.id > %s))
+                ORDER BY Queue.registered_at, Queue.id
+                LIMIT %s
+            """, (course_id, after['registered_at'], after['registered_at'], after['queue_id'], page_size))
+        except Exception as e:
+            print(f"An error occurred while fetching the waitlist: {e}")
+            return None
+
+
+
+# Streams a course's waitlist in registration order (see `_stream`).
+    def iter_waitlist(self, course_id, batch_size=500):
+        return self._stream("""
+            SELECT Queue.id AS queue_id, Queue.student_id, Users.name AS student_name, Queue.registered_at
+            FROM Queue
+            JOIN users ON Queue.student_id = Users.id
+            WHERE Queue.course_id = %s
+            ORDER BY Queue.registered_at, Queue.id
+        """, (course_id,), batch_size)
         
 
 
@@ -603,14 +1389,12 @@ class DatabaseManager:
     def get_students_by_parent_id(self, parent_id):
         """Retrieve all students (children) for a given parent."""
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
+            return self._fetch_prepared("""
                 SELECT s.student_id, u.name AS student_name
                 FROM Students s
                 JOIN Users u ON s.student_id = u.id
                 WHERE s.parent_id = %s
             """, (parent_id,))
-            return cursor.fetchall()
         except Exception as e:
             print(f"Error fetching students for parent_id {parent_id}: {e}")
             return []
@@ -624,19 +1408,18 @@ class DatabaseManager:
     def get_course_enrollments(self,  student_ids):
         """Retrieve all course enrollments for a list of student IDs."""
         try:
-            cursor = self.conn.cursor(dictionary=True)
-
-    # Generate the correct number of placeholders
-            placeholders = ','.join(['%s'] * len(student_ids))
-            query = f"""
-                SELECT ce.student_id, c.name AS course_name, ce.grade
-                FROM CourseEnrollments ce
-                JOIN Courses c ON ce.course_id = c.id
-                WHERE ce.student_id IN ({placeholders})
-            """
-            # Execute the query with the list of student_ids unpacked
-            cursor.execute(query, student_ids)
-            return cursor.fetchall()
+            with self._cursor(dictionary=True) as cursor:
+                # Generate the correct number of placeholders
+                placeholders = ','.join(['%s'] * len(student_ids))
+                query = f"""
+                    SELECT ce.student_id, c.name AS course_name, ce.grade
+                    FROM CourseEnrollments ce
+                    JOIN Courses c ON ce.course_id = c.id
+                    WHERE ce.student_id IN ({placeholders})
+                """
+                # Execute the query with the list of student_ids unpacked
+                cursor.execute(query, student_ids)
+                return cursor.fetchall()
         except Exception as e:
             print(f"Error fetching course enrollments: {e}")
             return []
@@ -650,16 +1433,16 @@ class DatabaseManager:
     def get_waitlist_status(self, student_ids):
         """Retrieve waitlist status for a list of student IDs."""
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            placeholders = ','.join(['%s'] * len(student_ids))
-            query = f"""
-                SELECT q.student_id, c.name AS course_name
-                FROM Queue q
-                JOIN Courses c ON q.course_id = c.id
-                WHERE q.student_id IN ({placeholders})
-            """
-            cursor.execute(query, student_ids)
-            return cursor.fetchall()
+            with self._cursor(dictionary=True) as cursor:
+                placeholders = ','.join(['%s'] * len(student_ids))
+                query = f"""
+                    SELECT q.student_id, c.name AS course_name
+                    FROM Queue q
+                    JOIN Courses c ON q.course_id = c.id
+                    WHERE q.student_id IN ({placeholders})
+                """
+                cursor.execute(query, student_ids)
+                return cursor.fetchall()
         
         except Exception as e:
             print(f"Error fetching waitlist status: {e}")
@@ -667,40 +1450,67 @@ class DatabaseManager:
 
 
 
+# Streams the children, course enrollments and waitlist entries of many families with one query.
+# - Reads every family when `parent_ids` is None, otherwise only the given parents; rows arrive ordered by parent
+#   and student and are grouped on the fly (see `_stream`), so only one family is held in memory at a time.
+# - Yields (parent_id, students, enrollments, waitlists) per family, where the three lists have the same format as
+#   `get_students_by_parent_id`, `get_course_enrollments` and `get_waitlist_status`.
+    def iter_family_progress(self, parent_ids=None, batch_size=500):
+        params = None
+        parent_filter = "s.parent_id IS NOT NULL"
+        if parent_ids is not None:
+            if not parent_ids:
+                return
+            parent_filter = f"s.parent_id IN ({','.join(['%s'] * len(parent_ids))})"
+            params = list(parent_ids) * 2
+        rows = self._stream(f"""
+            SELECT s.parent_id, s.student_id, u.name AS student_name, 'enrolled' AS kind, c.name AS course_name, ce.grade
+            FROM Students s
+            JOIN Users u ON s.student_id = u.id
+            LEFT JOIN CourseEnrollments ce ON ce.student_id = s.student_id
+            LEFT JOIN Courses c ON ce.course_id = c.id
+            WHERE {parent_filter}
+            UNION ALL
+            SELECT s.parent_id, s.student_id, u.name, 'waitlist', c.name, NULL
+            FROM Students s
+            JOIN Users u ON s.student_id = u.id
+            JOIN Queue q ON q.student_id = s.student_id
+            JOIN Courses c ON q.course_id = c.id
+            WHERE {parent_filter}
+            ORDER BY parent_id, student_id, kind
+        """, params, batch_size)
+        for parent_id, family_rows in groupby(rows, key=itemgetter('parent_id')):
+            students, enrollments, waitlists = [], [], []
+            for row in family_rows:
+                if not students or students[-1]['student_id'] != row['student_id']:
+                    students.append({"student_id": row['student_id'], "student_name": row['student_name']})
+                if row['course_name'] is None:
+                    continue
+                if row['kind'] == 'enrolled':
+                    enrollments.append({"student_id": row['student_id'], "course_name": row['course_name'], "grade": row['grade']})
+                else:
+                    waitlists.append({"student_id": row['student_id'], "course_name": row['course_name']})
+            yield parent_id, students, enrollments, waitlists
+
+
+
 # Retrieves the position of a student in the waitlist for a specific course.
-# - Executes a query to calculate the position of the student in the waitlist based on their registration time relative to other students.
-# - Fetches the student's name for display purposes.
+# - Reads the student's rank from the "queue_positions" view (registration order, ties broken by queue id)
+#   and joins the student's name in the same query.
 # - Returns a dictionary containing the student's position and name, or None if an error occurs or no data is found.
     def get_child_position_in_waitlist(self, student_id, course_id):
 
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            # Query to calculate the position
-            cursor.execute("""
-            SELECT COUNT(*) + 1 AS position
-            FROM Queue
-            WHERE course_id = %s
-            AND registered_at < (
-                SELECT registered_at
-                FROM Queue
-                WHERE course_id = %s AND student_id = %s
-            )
-            """, (course_id, course_id, student_id))
-            position_result = cursor.fetchone()
-
-            # Fetch student name for display purposes
-            cursor.execute("""
-            SELECT name
-            FROM users
-            WHERE id = %s
-            """, (student_id,))
-            name_result = cursor.fetchone()
-
-            # Combine results into a dictionary
-            if position_result and name_result:
+            rows = self._fetch_prepared("""
+            SELECT qp.position, u.name AS student_name
+            FROM queue_positions qp
+            JOIN users u ON u.id = qp.student_id
+            WHERE qp.course_id = %s AND qp.student_id = %s
+            """, (course_id, student_id))
+            if rows:
                 return {
-                    "position": position_result["position"],
-                    "student_name": name_result["name"]
+                    "position": rows[0]["position"],
+                    "student_name": rows[0]["student_name"]
                 }
             return None
         except Exception as e:
@@ -712,21 +1522,36 @@ class DatabaseManager:
 
 # Adds a payment record to the "Payments" table.
 # - Executes an INSERT query to add the parent ID, amount, payment date, and description into the payments table.
+# - Adds the amount to the month's row in "payment_ledger_months" and to the month and parent's row in
+#   "payment_ledger" (INSERT ... ON DUPLICATE KEY UPDATE) in the same transaction.
 # - Commits the transaction if the insertion is successful and returns True.
-# - If an error occurs during the insertion, it logs the error and returns None.  
+# - If an error occurs during the insertion, it rolls back, logs the error and returns None.  
     def add_payment(self,payment_info):
         try:
-            cursor = self.conn.cursor()
-            # Execute the SQL query
-            cursor.execute("""
-                INSERT INTO Payments (parent_id, amount, payment_date, description)
-                VALUES (%s, %s, %s, %s)
-            """, (payment_info.parent_id, payment_info.amount, payment_info.payment_date, payment_info.description))
-            # Commit the transaction
-            self.conn.commit()
-            return True
+            with self._cursor() as cursor:
+                # Execute the SQL query
+                cursor.execute("""
+                    INSERT INTO Payments (parent_id, amount, payment_date, description)
+                    VALUES (%s, %s, %s, %s)
+                """, (payment_info.parent_id, payment_info.amount, payment_info.payment_date, payment_info.description))
+                # Update the ledger
+                cursor.execute("""
+                    INSERT INTO payment_ledger_months (month, total_amount, payment_count)
+                    VALUES (DATE_FORMAT(%s, '%Y-%m'), %s, 1)
+                    ON DUPLICATE KEY UPDATE total_amount = total_amount + VALUES(total_amount), payment_count = payment_count + 1
+                """, (payment_info.payment_date, payment_info.amount))
+                if payment_info.parent_id is not None:
+                    cursor.execute("""
+                        INSERT INTO payment_ledger (month, parent_id, total_amount, payment_count)
+                        VALUES (DATE_FORMAT(%s, '%Y-%m'), %s, %s, 1)
+                        ON DUPLICATE KEY UPDATE total_amount = total_amount + VALUES(total_amount), payment_count = payment_count + 1
+                    """, (payment_info.payment_date, payment_info.parent_id, payment_info.amount))
+                # Commit the transaction
+                self._commit()
+                return True
         except Exception as e:
             # Log the error and return None if an exception occurs
+            self._rollback()
             print(f"An error occurred while adding the payment: {e}")
             return None
     
@@ -743,8 +1568,7 @@ class DatabaseManager:
     def fetch_courses_for_student(self, student_id):
         """Fetch courses, schedule details, and classroom names for the given student ID."""
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
+            return self._fetch_prepared("""
                 SELECT 
                     ce.course_id, 
                     c.name AS course_name, 
@@ -758,7 +1582,6 @@ class DatabaseManager:
                 WHERE ce.student_id = %s
                 ORDER BY s.date, s.time
             """, (student_id,))
-            return cursor.fetchall()
         except Exception as e:
             print(f"An error occurred while fetching courses: {e}")
             return []
@@ -772,14 +1595,12 @@ class DatabaseManager:
 
         """Fetch grades for the given student ID."""
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
+            return self._fetch_prepared("""
                 SELECT ce.course_id, c.name AS course_name, ce.grade
                 FROM CourseEnrollments ce
                 JOIN Courses c ON ce.course_id = c.id
                 WHERE ce.student_id = %s
             """, (student_id,))
-            return cursor.fetchall()
         except Exception as e:
             print(f"An error occurred while fetching grades: {e}")
             return []
@@ -792,23 +1613,40 @@ class DatabaseManager:
 # Fetches all courses assigned to a specific teacher, including schedule and classroom information.
 # - Executes a SELECT query that joins the "Courses", "Schedules", and "ClassRooms" tables to retrieve course details.
 # - Orders the results by the course date and time.
+# - Served from the reference cache; creating a course or a schedule invalidates it.
 # - Returns a list of course details (course name, description, schedule, and classroom) or an empty list if an error occurs or no courses are found.
     def fetch_courses_for_teacher(self,teacher_id):
 
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT c.id, c.name, c.description, c.max_capacity, s.date, s.time, cr.name as class_room_name
-                FROM Courses c
-                JOIN Schedules s ON c.id = s.course_id
-                JOIN ClassRooms cr ON s.class_room_id = cr.id
-                WHERE c.teacher_id = %s
-                ORDER BY s.date, s.time
-            """, (teacher_id,))
-            return cursor.fetchall()
+            courses = self._cache.get("teacher_courses", str(teacher_id), lambda: self._load_courses_for_teacher(teacher_id))
+            return [dict(course) for course in courses]
         except Exception as e:
             print(f"An error occurred while fetching courses: {e}")
             return []
+
+    def _load_courses_for_teacher(self, teacher_id):
+        return self._fetch_prepared("""
+            SELECT c.id, c.name, c.description, c.max_capacity, s.date, s.time, cr.name as class_room_name
+            FROM Courses c
+            JOIN Schedules s ON c.id = s.course_id
+            JOIN ClassRooms cr ON s.class_room_id = cr.id
+            WHERE c.teacher_id = %s
+            ORDER BY s.date, s.time
+        """, (teacher_id,))
+
+
+
+# Streams a teacher's scheduled courses in date and time order, bypassing the reference cache (see `_stream`).
+# - Meant for exports over long schedules; the menus keep using the cached `fetch_courses_for_teacher`.
+    def iter_courses_for_teacher(self, teacher_id, batch_size=500):
+        return self._stream("""
+            SELECT c.id, c.name, c.description, c.max_capacity, s.date, s.time, cr.name as class_room_name
+            FROM Courses c
+            JOIN Schedules s ON c.id = s.course_id
+            JOIN ClassRooms cr ON s.class_room_id = cr.id
+            WHERE c.teacher_id = %s
+            ORDER BY s.date, s.time
+        """, (teacher_id,), batch_size)
     
 
 
@@ -818,15 +1656,13 @@ class DatabaseManager:
     def fetch_students_in_course(self,course_id, teacher_id):
 
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
+            return self._fetch_prepared("""
                 SELECT u.id as student_id, u.name as student_name , ce.grade as current_grade
                 FROM CourseEnrollments ce
                 JOIN Users u ON ce.student_id = u.id
                 JOIN Courses c ON ce.course_id = c.id
                 WHERE ce.course_id = %s AND c.teacher_id = %s
             """, (course_id,teacher_id))
-            return cursor.fetchall()
         except Exception as e:
             print(f"An error occurred while fetching students: {e}")
             return []
@@ -840,20 +1676,51 @@ class DatabaseManager:
     def set_student_grade(self, student_id,course_id,grade):
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE CourseEnrollments
-                SET grade = %s
-                WHERE student_id = %s AND course_id = %s
-            """, (grade, student_id, course_id))
-            self.conn.commit()
-            return True
+            with self._cursor() as cursor:
+                cursor.execute("""
+                    UPDATE CourseEnrollments
+                    SET grade = %s
+                    WHERE student_id = %s AND course_id = %s
+                """, (grade, student_id, course_id))
+                self._commit()
+                return True
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while setting the student grade: {e}")
             return False 
 
 
 
+# Updates the grades of many students in a course in one transaction.
+# - `grades` maps student IDs to grades. Each batch of `batch_size` students is written with a single
+#   `UPDATE ... SET grade = CASE student_id ...` statement, so a grade sheet costs one round trip per batch and one commit.
+# - Students that are not enrolled in the course are ignored by the UPDATE.
+# - Returns True if every batch was applied; on error it rolls back the whole sheet, logs the error and returns False.
+    def set_student_grades(self, course_id, grades, batch_size=500):
+        sheet = list(grades.items())
+        try:
+            with self._cursor() as cursor:
+                for start in range(0, len(sheet), batch_size):
+                    batch = sheet[start:start + batch_size]
+                    cases = " ".join(["WHEN %s THEN %s"] * len(batch))
+                    placeholders = ','.join(['%s'] * len(batch))
+                    params = [value for student_id, grade in batch for value in (student_id, grade)]
+                    params.append(course_id)
+                    params.extend(student_id for student_id, _ in batch)
+                    cursor.execute(f"""
+                        UPDATE CourseEnrollments
+                        SET grade = CASE student_id {cases} ELSE grade END
+                        WHERE course_id = %s AND student_id IN ({placeholders})
+                    """, params)
+                self._commit()
+                return True
+        except Exception as e:
+            self._rollback()
+            print(f"An error occurred while setting the student grades: {e}")
+            return False
+
+
+
                                                         # Employee Functions 
 
 
@@ -863,12 +1730,10 @@ class DatabaseManager:
 # - Handles any exceptions that occur during the process and logs the error.
     def fetch_all_employee_tasks(self,emplyee_id):
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute(""" 
+            return self._fetch_prepared(""" 
                 SELECT * FROM tasks 
                 WHERE assigned_to = %s
             """, (emplyee_id,))
-            return cursor.fetchall()
         except Exception as e:
             print(f"An error occurred while setting the student grade: {e}")
             return None 
@@ -881,16 +1746,17 @@ class DatabaseManager:
 # - If an error occurs during the update, it logs the error and returns False.
     def update_task_status(self,task_id,status):
         try:
-            cursor = self.conn.cursor(dictionary=True)
+            with self._cursor(dictionary=True) as cursor:
 
-            cursor.execute("""
-                UPDATE tasks
-                SET status = %s
-                WHERE id = %s
-            """, (status, task_id))
-            self.conn.commit()
-            return True
+                cursor.execute("""
+                    UPDATE tasks
+                    SET status = %s
+                    WHERE id = %s
+                """, (status, task_id))
+                self._commit()
+                return True
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while updating the task status: {e}")
     
 
@@ -901,13 +1767,12 @@ class DatabaseManager:
 # - If an error occurs during the check, it logs the error and returns None.
     def check_task_assignee(self,task_id,employee_id):
         try:
-            cursor = self.conn.cursor(dictionary=True)
             # בדיקה אם המשימה שייכת לעובד
-            cursor.execute("""
+            rows = self._fetch_prepared("""
                 SELECT id FROM tasks
                 WHERE id = %s AND assigned_to = %s
             """, (task_id, employee_id))
-            if cursor.fetchone() is None:
+            if not rows:
                 return False
             return True
         except Exception as e:
@@ -923,14 +1788,15 @@ class DatabaseManager:
     def create_task_issue(self,task):
 
         try:
-            cursor = self.conn.cursor(dictionary=True)
-            cursor.execute("""
-                INSERT INTO tasks (description, status, class_room_id)
-                VALUES (%s, %s, %s)
-            """, (task.description, task.status, task.class_room_id))
-            self.conn.commit()
-            return cursor.lastrowid
+            with self._cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    INSERT INTO tasks (description, status, class_room_id)
+                    VALUES (%s, %s, %s)
+                """, (task.description, task.status, task.class_room_id))
+                self._commit()
+                return cursor.lastrowid
         except Exception as e:
+            self._rollback()
             print(f"An error occurred while creating the task: {e}")
             return None
     
@@ -48,4 +48,7 @@ def employeeMain(user):
         email=user.email,
         password=user.password
     )
-    employee_menu(int(choice),current_employee,db_manager)
\ No newline at end of file
+    try:
+        employee_menu(int(choice),current_employee,db_manager)
+    finally:
+        db_manager.close()
\ No newline at end of file
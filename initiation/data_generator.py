@@ -0,0 +1,390 @@
+# Deterministic synthetic data generator for load testing.
+# - Produces every table of tables_structure.tables at any scale, in the same format as dummy-data.json.
+# - The same --seed always produces the same data set.
+# - Writes a JSON seed file, or streams the records straight into the bulk loader with --load.
+# Usage:
+#   python initiation/data_generator.py --users 1e6 --courses 5e4 --output big-data.json
+#   python initiation/data_generator.py --users 1e5 --courses 5e3 --load
+import argparse
+import bisect
+import json
+import random
+import sys
+import dotenv
+import os
+from datetime import datetime, timedelta
+from itertools import accumulate
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+from initiation.insertData import TABLE_COLUMNS, DEFAULT_BATCH_SIZE
+from services.grade_service import MAX_GRADE
+
+FIRST_NAMES = ["James", "Olivia", "Emily", "Liam", "Noah", "Emma", "Ava", "Mia", "Lucas", "Ethan",
+               "Grace", "Sophia", "Henry", "Ella", "Jack", "Chloe", "Daniel", "Leah", "Adam", "Maya"]
+LAST_NAMES = ["Johnson", "Harris", "Carter", "Brown", "Wilson", "Taylor", "Moore", "Clark", "Lewis", "Walker",
+              "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams", "Nelson", "Hill", "Cohen"]
+SUBJECTS = ["Algebra", "Geometry", "Physics", "Chemistry", "Biology", "History", "Literature", "Art",
+            "Music", "Programming", "Robotics", "Astronomy", "Economics", "Spanish", "French", "Drama"]
+LEVELS = ["101", "Basics", "Intermediate", "Advanced", "Workshop", "Lab"]
+GRADE_LEVELS = ["5th Grade", "6th Grade", "7th Grade", "8th Grade", "9th Grade", "10th Grade", "11th Grade", "12th Grade"]
+TASK_DESCRIPTIONS = ["Fix the projector", "Replace broken chairs", "Clean the whiteboard", "Repair the air conditioner",
+                     "Prepare the classroom for a workshop", "Restock lab supplies", "Fix the lights"]
+TASK_STATUSES = ["Pending", "In Progress", "Completed"]
+TIME_SLOTS = [f"{hour:02}:00:00" for hour in range(8, 18)]
+
+# Number of children per parent (1-4) and how likely each count is.
+CHILDREN_PER_PARENT = [1, 2, 3, 4]
+CHILDREN_WEIGHTS = [0.45, 0.35, 0.15, 0.05]
+# Number of courses each student asks for (1-3) and how likely each count is.
+COURSES_PER_STUDENT = [1, 2, 3]
+COURSES_WEIGHTS = [0.5, 0.35, 0.15]
+# Exponent of the Zipf-like course popularity; higher values concentrate demand on fewer courses.
+POPULARITY_SKEW = 1.1
+
+BASE_TIME = datetime(2025, 1, 1, 8, 0, 0)
+
+
+
+# Computes the size of every role and the ID ranges used by the generator.
+# - Managers, teachers and employees get fixed shares; the remaining users are parents and their children.
+# - Returns a dictionary of counts and first IDs that all table generators share.
+def plan_scale(users, courses):
+    managers = max(1, users // 1000)
+    teachers = max(1, min(users // 10, (courses + 1) // 2))
+    employees = max(1, users // 200)
+    family_users = users - managers - teachers - employees
+    if family_users < 2:
+        raise ValueError("Not enough users for at least one parent and one child; increase --users.")
+    return {
+        "users": users,
+        "courses": courses,
+        "managers": managers,
+        "teachers": teachers,
+        "employees": employees,
+        "first_teacher_id": managers + 1,
+        "first_employee_id": managers + teachers + 1,
+        "first_family_id": managers + teachers + employees + 1,
+        "class_rooms": max(5, courses // 8),
+        "tasks": max(1, users // 100),
+    }
+
+
+
+# Replays the family structure: yields (parent ID, [child IDs]) for every family.
+# - Each parent's ID is followed directly by the IDs of their children.
+# - Uses its own random generator, so every table that needs families sees the same ones.
+def iter_families(plan, seed):
+    rng = random.Random(f"{seed}-families")
+    next_id = plan["first_family_id"]
+    last_id = plan["users"]
+    while next_id < last_id:
+        children = rng.choices(CHILDREN_PER_PARENT, CHILDREN_WEIGHTS)[0]
+        children = min(children, last_id - next_id)
+        if next_id + children + 1 == last_id:
+            children += 1  # a single leftover ID cannot form a family, so it joins this one
+        yield next_id, list(range(next_id + 1, next_id + 1 + children))
+        next_id += children + 1
+
+
+
+# Builds the skewed course popularity used to pick courses.
+# - Course ranks are shuffled so that popular courses are spread over the ID range.
+# - Returns (course IDs ordered by rank, cumulative weights) for bisect-based sampling.
+def course_popularity(plan, seed):
+    rng = random.Random(f"{seed}-popularity")
+    ranked_courses = list(range(1, plan["courses"] + 1))
+    rng.shuffle(ranked_courses)
+    weights = [1 / (rank ** POPULARITY_SKEW) for rank in range(1, plan["courses"] + 1)]
+    return ranked_courses, list(accumulate(weights))
+
+
+
+# Returns the capacity of every course (index = course ID), derived from the course seed.
+def course_capacities(plan, seed):
+    rng = random.Random(f"{seed}-courses")
+    capacities = [0]
+    for _ in range(plan["courses"]):
+        capacities.append(rng.choice([15, 20, 25, 30]))
+        rng.random()  # teacher draw, kept in step with iter_courses
+        rng.random()  # class room draw, kept in step with iter_courses
+    return capacities
+
+
+
+# Replays the registration process: yields ("enrolled" | "waitlisted", student ID, course ID, registration time).
+# - Students register in ID order and pick courses by popularity; a course takes students until it is full,
+#   after which further students join its waitlist, so popular courses build long waitlists.
+def iter_registrations(plan, seed):
+    rng = random.Random(f"{seed}-registrations")
+    ranked_courses, cumulative_weights = course_popularity(plan, seed)
+    total_weight = cumulative_weights[-1]
+    free_seats = course_capacities(plan, seed)
+    clock = BASE_TIME
+    for _, child_ids in iter_families(plan, seed):
+        for student_id in child_ids:
+            wanted = min(rng.choices(COURSES_PER_STUDENT, COURSES_WEIGHTS)[0], plan["courses"])
+            picked = set()
+            while len(picked) < wanted:
+                rank = bisect.bisect_left(cumulative_weights, rng.random() * total_weight)
+                picked.add(ranked_courses[min(rank, len(ranked_courses) - 1)])
+            for course_id in sorted(picked):
+                clock += timedelta(seconds=rng.randint(1, 90))
+                if free_seats[course_id] > 0:
+                    free_seats[course_id] -= 1
+                    yield "enrolled", student_id, course_id, clock
+                else:
+                    yield "waitlisted", student_id, course_id, clock
+
+
+
+def format_time(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+
+def iter_users(plan, seed):
+    rng = random.Random(f"{seed}-users")
+
+    def user(user_id, role):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        return {
+            "id": user_id,
+            "name": f"{first} {last}",
+            "email": f"{first}.{last}.{user_id}@example.com".lower(),
+            "role": role,
+            "password": "12345",
+            "created_at": format_time(BASE_TIME + timedelta(minutes=user_id)),
+        }
+
+    for user_id in range(1, plan["first_teacher_id"]):
+        yield user(user_id, "manager")
+    for user_id in range(plan["first_teacher_id"], plan["first_employee_id"]):
+        yield user(user_id, "teacher")
+    for user_id in range(plan["first_employee_id"], plan["first_family_id"]):
+        yield user(user_id, "employee")
+    for parent_id, child_ids in iter_families(plan, seed):
+        yield user(parent_id, "parent")
+        for child_id in child_ids:
+            yield user(child_id, "student")
+
+
+
+def iter_managers(plan, seed):
+    for manager_id in range(1, plan["first_teacher_id"]):
+        yield {"manager_id": manager_id}
+
+
+
+def iter_parents(plan, seed):
+    for parent_id, _ in iter_families(plan, seed):
+        yield {"parent_id": parent_id}
+
+
+
+def iter_students(plan, seed):
+    rng = random.Random(f"{seed}-students")
+    for parent_id, child_ids in iter_families(plan, seed):
+        for child_id in child_ids:
+            age = rng.randint(10, 18)
+            yield {
+                "student_id": child_id,
+                "age": age,
+                "grade_level": GRADE_LEVELS[min(age - 10, len(GRADE_LEVELS) - 1)],
+                "parent_id": parent_id,
+            }
+
+
+
+def iter_teachers(plan, seed):
+    rng = random.Random(f"{seed}-teachers")
+    for teacher_id in range(plan["first_teacher_id"], plan["first_employee_id"]):
+        yield {
+            "teacher_id": teacher_id,
+            "specialization": rng.choice(SUBJECTS),
+            "hire_date": (BASE_TIME - timedelta(days=rng.randint(30, 3650))).strftime("%Y-%m-%d"),
+            "salary": float(rng.randrange(45000, 90000, 500)),
+        }
+
+
+
+def iter_employees(plan, seed):
+    rng = random.Random(f"{seed}-employees")
+    for employee_id in range(plan["first_employee_id"], plan["first_family_id"]):
+        yield {"employee_id": employee_id, "salary": float(rng.randrange(30000, 60000, 500))}
+
+
+
+def iter_class_rooms(plan, seed):
+    rng = random.Random(f"{seed}-class-rooms")
+    for room_id in range(1, plan["class_rooms"] + 1):
+        yield {
+            "id": room_id,
+            "name": f"Room {room_id}",
+            "capacity": rng.choice([20, 25, 30, 35, 40]),
+            "location": f"Floor {1 + (room_id - 1) // 20}",
+            "created_at": format_time(BASE_TIME - timedelta(days=30)),
+        }
+
+
+
+def iter_courses(plan, seed):
+    rng = random.Random(f"{seed}-courses")
+    for course_id in range(1, plan["courses"] + 1):
+        max_capacity = rng.choice([15, 20, 25, 30])
+        teacher_id = plan["first_teacher_id"] + int(rng.random() * plan["teachers"])
+        class_room_id = 1 + int(rng.random() * plan["class_rooms"])
+        subject = SUBJECTS[course_id % len(SUBJECTS)]
+        level = LEVELS[(course_id // len(SUBJECTS)) % len(LEVELS)]
+        yield {
+            "id": course_id,
+            "name": f"{subject} {level} #{course_id}",
+            "description": f"{subject} course ({level.lower()} level)",
+            "teacher_id": teacher_id,
+            "max_capacity": max_capacity,
+            "class_room_id": class_room_id,
+        }
+
+
+
+def iter_course_enrollments(plan, seed):
+    rng = random.Random(f"{seed}-grades")
+    enrollment_id = 0
+    for status, student_id, course_id, _ in iter_registrations(plan, seed):
+        if status == "enrolled":
+            enrollment_id += 1
+            grade = None if rng.random() < 0.4 else round(rng.uniform(55, MAX_GRADE), 2)
+            yield {"id": enrollment_id, "course_id": course_id, "student_id": student_id, "grade": grade}
+
+
+
+def iter_queue(plan, seed):
+    queue_id = 0
+    for status, student_id, course_id, registered_at in iter_registrations(plan, seed):
+        if status == "waitlisted":
+            queue_id += 1
+            yield {"id": queue_id, "course_id": course_id, "student_id": student_id, "registered_at": format_time(registered_at)}
+
+
+
+def iter_tasks(plan, seed):
+    rng = random.Random(f"{seed}-tasks")
+    for task_id in range(1, plan["tasks"] + 1):
+        yield {
+            "id": task_id,
+            "description": rng.choice(TASK_DESCRIPTIONS),
+            "assigned_to": plan["first_employee_id"] + int(rng.random() * plan["employees"]),
+            "status": rng.choice(TASK_STATUSES),
+            "updated_at": format_time(BASE_TIME + timedelta(hours=task_id)),
+            "class_room_id": 1 + int(rng.random() * plan["class_rooms"]),
+        }
+
+
+
+def iter_payments(plan, seed):
+    rng = random.Random(f"{seed}-payments")
+    payment_id = 0
+    for parent_id, child_ids in iter_families(plan, seed):
+        for _ in range(rng.randint(0, 2 * len(child_ids) + 1)):
+            payment_id += 1
+            yield {
+                "id": payment_id,
+                "parent_id": parent_id,
+                "amount": round(rng.uniform(50, 500), 2),
+                "payment_date": (BASE_TIME - timedelta(days=rng.randint(0, 365))).strftime("%Y-%m-%d"),
+                "description": "Tuition payment",
+            }
+
+
+
+def iter_schedules(plan, seed):
+    rng = random.Random(f"{seed}-schedules")
+    for course in iter_courses(plan, seed):
+        yield {
+            "id": course["id"],
+            "course_id": course["id"],
+            "teacher_id": course["teacher_id"],
+            "date": (BASE_TIME + timedelta(days=rng.randint(1, 120))).strftime("%Y-%m-%d"),
+            "time": rng.choice(TIME_SLOTS),
+            "class_room_id": course["class_room_id"],
+        }
+
+
+
+# Generator function for every table, keyed like TABLE_COLUMNS.
+table_generators = {
+    "Users": iter_users,
+    "Managers": iter_managers,
+    "Parents": iter_parents,
+    "Students": iter_students,
+    "Teachers": iter_teachers,
+    "Employees": iter_employees,
+    "ClassRooms": iter_class_rooms,
+    "Courses": iter_courses,
+    "CourseEnrollments": iter_course_enrollments,
+    "Queue": iter_queue,
+    "Tasks": iter_tasks,
+    "Payments": iter_payments,
+    "Schedules": iter_schedules,
+}
+
+
+
+# Yields (table name, records generator) pairs for every table, in TABLE_COLUMNS order.
+# - Records are produced lazily, so the output can be streamed into a file or the bulk loader.
+def generate_tables(users, courses, seed=42):
+    plan = plan_scale(users, courses)
+    for table_name in TABLE_COLUMNS:
+        yield table_name, table_generators[table_name](plan, seed)
+
+
+
+# Writes the generated tables to a JSON seed file in the dummy-data.json format, one record at a time.
+def write_json(tables, output_path):
+    with open(output_path, "w", encoding="utf-8") as file:
+        file.write("{")
+        for table_index, (table_name, records) in enumerate(tables):
+            file.write(("," if table_index else "") + f"\n  {json.dumps(table_name)}: [")
+            for record_index, record in enumerate(records):
+                file.write(("," if record_index else "") + "\n    " + json.dumps(record))
+            file.write("\n  ]")
+        file.write("\n}\n")
+
+
+
+# Streams the generated tables straight into the database through the bulk loader.
+# - Creates the database, tables, views and procedures first if they do not exist; the tables should be empty.
+def load_into_database(tables, batch_size, use_load_data):
+    from databaseManager.database_manager import DatabaseManager
+    from initiation.insertData import bulk_load
+    from initiation.tables_structure import tables as table_definitions, views, procedures
+    with DatabaseManager(to_use_database=False) as db_manager:
+        db_manager.initialize_database()
+        db_manager.create_tables(table_definitions)
+        db_manager.create_views(views)
+        db_manager.create_procedures(procedures)
+        return bulk_load(db_manager, tables, batch_size, use_load_data)
+
+
+
+# Parses counts such as "1e6" or "50000".
+def scale_count(value):
+    return int(float(value))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic academy data set at any scale.")
+    parser.add_argument("--users", type=scale_count, default=10_000)
+    parser.add_argument("--courses", type=scale_count, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write a JSON seed file to this path")
+    parser.add_argument("--load", action="store_true", help="Stream the data straight into the database")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--load-data", action="store_true", help="Use LOAD DATA LOCAL INFILE when loading")
+    args = parser.parse_args()
+    if not args.output and not args.load:
+        parser.error("choose --output and/or --load")
+    if args.output:
+        write_json(generate_tables(args.users, args.courses, args.seed), args.output)
+        print(f"Seed file written to {args.output}")
+    if args.load:
+        load_into_database(generate_tables(args.users, args.courses, args.seed), args.batch_size, args.load_data)
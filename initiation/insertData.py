@@ -1,110 +1,175 @@
-import json
+import os
+import tempfile
+import time
+from itertools import islice
+from initiation.seed_reader import iter_seed_tables
 
 # Function to insert data from JSON
 
 
+
+# Column order of each table in the JSON seed file.
+# - Tables are listed in dependency order; the loader itself follows file order, which is safe because
+#   foreign-key checks are disabled during the load.
+TABLE_COLUMNS = {
+    "Users": ("id", "name", "email", "role", "password", "created_at"),
+    "Managers": ("manager_id",),
+    "Parents": ("parent_id",),
+    "Students": ("student_id", "age", "grade_level", "parent_id"),
+    "Teachers": ("teacher_id", "specialization", "hire_date", "salary"),
+    "Employees": ("employee_id", "salary"),
+    "ClassRooms": ("id", "name", "capacity", "location", "created_at"),
+    "Courses": ("id", "name", "description", "teacher_id", "max_capacity", "class_room_id"),
+    "CourseEnrollments": ("id", "course_id", "student_id", "grade"),
+    "Queue": ("id", "course_id", "student_id", "registered_at"),
+    "Tasks": ("id", "description", "assigned_to", "status", "updated_at", "class_room_id"),
+    "Payments": ("id", "parent_id", "amount", "payment_date", "description"),
+    "Schedules": ("id", "course_id", "teacher_id", "date", "time", "class_room_id"),
+}
+
+# Number of rows sent to the server per multi-row INSERT (or per CSV file when using LOAD DATA).
+DEFAULT_BATCH_SIZE = 1000
+
+# Print a progress line every time this many rows of a table have been loaded.
+PROGRESS_INTERVAL = 100_000
+
+
+
 # Reads data from a JSON file and inserts it into database tables.
-# - Expects a JSON file with keys corresponding to table names.
-# - Iterates over each key and inserts data into the respective table.
-# - Commits changes to the database after all records are inserted.
-def insert_data_from_json(db_manager, file_path):
-    with open(file_path, 'r') as file:
-        data = json.load(file)
-    
+# - Expects a JSON file with keys corresponding to table names; keys not in TABLE_COLUMNS are skipped.
+# - Streams the file with `iter_seed_tables`, so records go straight from the parser into the insert batches
+#   and memory use stays flat regardless of the file size.
+# - Loads each table with batched multi-row inserts (`batch_size` rows per statement), or with
+#   `LOAD DATA LOCAL INFILE` from generated CSV files when `use_load_data` is True.
+# - Disables foreign-key checks for the duration of the load and re-enables them afterwards; unique keys stay
+#   enforced, so a duplicate seed row fails the load instead of being inserted.
+# - Commits changes to the database after all records are inserted, or rolls back on error.
+# - Prints the rows per second achieved for every table and for the whole load, and returns
+#   a dictionary of {table name: (rows, seconds)}.
+def insert_data_from_json(db_manager, file_path, batch_size=DEFAULT_BATCH_SIZE, use_load_data=False):
+    tables = (
+        (table_name, records)
+        for table_name, records in iter_seed_tables(file_path)
+        if table_name in TABLE_COLUMNS
+    )
+    return bulk_load(db_manager, tables, batch_size, use_load_data)
+
+
+
+# Loads (table name, records) pairs into the database.
+# - `tables` can be any iterable, including a generator that reads records lazily; each record
+#   is a dictionary keyed by the column names in TABLE_COLUMNS.
+# - See `insert_data_from_json` for the load options and the returned statistics.
+# - Rebuilds the payment ledger afterwards when payments were loaded.
+def bulk_load(db_manager, tables, batch_size=DEFAULT_BATCH_SIZE, use_load_data=False):
     conn = db_manager.conn  # Access the database connection from the manager
     cursor = conn.cursor()  # Create a cursor object for executing queries
-
-    # Insert Users
-    for user in data["Users"]:
-        cursor.execute("""
-            INSERT INTO Users (id, name, email, role, password, created_at)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (user["id"], user["name"], user["email"], user["role"], user["password"], user["created_at"]))
-
-    # Insert Managers
-    for manager in data["Managers"]:
-        cursor.execute("""
-            INSERT INTO Managers (manager_id)
-            VALUES (%s)
-        """, (manager["manager_id"],))
-
-    # Insert Parents
-    for parent in data["Parents"]:
-        cursor.execute("""
-            INSERT INTO Parents (parent_id)
-            VALUES (%s)
-        """, (parent["parent_id"],))
-
-    # Insert Students
-    for student in data["Students"]:
-        cursor.execute("""
-            INSERT INTO Students (student_id, age, grade_level, parent_id)
-            VALUES (%s, %s, %s, %s)
-        """, (student["student_id"], student["age"], student["grade_level"], student["parent_id"]))
-
-    # Insert Teachers
-    for teacher in data["Teachers"]:
-        cursor.execute("""
-            INSERT INTO Teachers (teacher_id, specialization, hire_date, salary)
-            VALUES (%s, %s, %s, %s)
-        """, (teacher["teacher_id"], teacher["specialization"], teacher["hire_date"], teacher["salary"]))
-
-    # Insert Employees
-    for employee in data["Employees"]:
-        cursor.execute("""
-            INSERT INTO Employees (employee_id, salary)
-            VALUES (%s, %s)
-        """, (employee["employee_id"], employee["salary"]))
-
-    # Insert ClassRooms
-    for classroom in data["ClassRooms"]:
-        cursor.execute("""
-            INSERT INTO ClassRooms (id, name, capacity, location, created_at)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (classroom["id"], classroom["name"], classroom["capacity"], classroom["location"], classroom["created_at"]))
-
-    # Insert Courses
-    for course in data["Courses"]:
-        cursor.execute("""
-            INSERT INTO Courses (id, name, description, teacher_id, max_capacity, class_room_id)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (course["id"], course["name"], course["description"], course["teacher_id"], course["max_capacity"], course["class_room_id"]))
-
-    # Insert CourseEnrollments
-    for enrollment in data["CourseEnrollments"]:
-        cursor.execute("""
-            INSERT INTO CourseEnrollments (id, course_id, student_id, grade)
-            VALUES (%s, %s, %s, %s)
-        """, (enrollment["id"], enrollment["course_id"], enrollment["student_id"], enrollment["grade"]))
-
-    # Insert Queue
-    for queue in data["Queue"]:
-        cursor.execute("""
-            INSERT INTO Queue (id, course_id, student_id, registered_at)
-            VALUES (%s, %s, %s, %s)
-        """, (queue["id"], queue["course_id"], queue["student_id"], queue["registered_at"]))
-
-    # Insert Tasks
-    for task in data["Tasks"]:
-        cursor.execute("""
-            INSERT INTO Tasks (id, description, assigned_to, status, updated_at, class_room_id)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (task["id"], task["description"], task["assigned_to"], task["status"], task["updated_at"], task["class_room_id"]))
-
-    # Insert Payments
-    for payment in data["Payments"]:
-        cursor.execute("""
-            INSERT INTO Payments (id, parent_id, amount, payment_date, description)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (payment["id"], payment["parent_id"], payment["amount"], payment["payment_date"], payment["description"]))
-
-    # Insert Schedules
-    for schedule in data["Schedules"]:
-        cursor.execute("""
-            INSERT INTO Schedules (id, course_id, teacher_id, date, time, class_room_id)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (schedule["id"], schedule["course_id"], schedule["teacher_id"], 
-              schedule["date"], schedule["time"], schedule["class_room_id"]))
-
-    # Commit changes
-    conn.commit()
+    stats = {}
+    load_started = time.perf_counter()
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    try:
+        for table_name, records in tables:
+            columns = TABLE_COLUMNS[table_name]
+            started = time.perf_counter()
+            if use_load_data:
+                row_count = load_rows_from_csv(cursor, table_name, columns, records, batch_size)
+            else:
+                row_count = insert_rows(cursor, table_name, columns, records, batch_size)
+            elapsed = time.perf_counter() - started
+            stats[table_name] = (row_count, elapsed)
+            print(f"Loaded {row_count} rows into `{table_name}` in {elapsed:.2f}s ({rows_per_second(row_count, elapsed):,.0f} rows/s)")
+
+        # Commit changes
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        cursor.close()
+
+    # Payments are bulk-inserted without touching the ledger, so rebuild it in one pass
+    if "Payments" in stats:
+        db_manager.rebuild_payment_ledger()
+
+    total_rows = sum(row_count for row_count, _ in stats.values())
+    total_elapsed = time.perf_counter() - load_started
+    print(f"Loaded {total_rows} rows in {total_elapsed:.2f}s ({rows_per_second(total_rows, total_elapsed):,.0f} rows/s)")
+    return stats
+
+
+
+# Inserts records into a table with batched `executemany` calls.
+# - MySQL Connector rewrites each batch into a single multi-row INSERT statement.
+# - Returns the number of inserted rows.
+def insert_rows(cursor, table_name, columns, records, batch_size):
+    query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    row_count = 0
+    for batch in batched_rows(records, columns, batch_size):
+        cursor.executemany(query, batch)
+        row_count = report_progress(table_name, row_count, len(batch))
+    return row_count
+
+
+
+# Loads records into a table with `LOAD DATA LOCAL INFILE`, one temporary CSV file per batch.
+# - Requires 'allow_local_infile' in DB_CONFIG and `local_infile` enabled on the server.
+# - Raises a ValueError if the server skipped rows of a batch, as it does for duplicate keys.
+# - Returns the number of loaded rows.
+def load_rows_from_csv(cursor, table_name, columns, records, batch_size):
+    row_count = 0
+    for batch in batched_rows(records, columns, batch_size):
+        csv_file = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8", newline="")
+        try:
+            with csv_file:
+                for row in batch:
+                    csv_file.write(",".join(csv_value(value) for value in row) + "\n")
+            cursor.execute(f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE {table_name}
+                CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY '\\\\'
+                LINES TERMINATED BY '\\n'
+                ({', '.join(columns)})
+            """, (csv_file.name.replace("\\", "/"),))
+            # LOCAL turns duplicate-key errors into warnings, so check that every row was loaded
+            if cursor.rowcount != len(batch):
+                raise ValueError(f"{len(batch) - cursor.rowcount} rows of `{table_name}` were skipped (duplicate keys?)")
+        finally:
+            os.remove(csv_file.name)
+        row_count = report_progress(table_name, row_count, len(batch))
+    return row_count
+
+
+
+# Groups records into lists of at most `batch_size` row tuples, in the column order given.
+def batched_rows(records, columns, batch_size):
+    rows = (tuple(record[column] for column in columns) for record in records)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+
+# Formats one value for the CSV files read by LOAD DATA (NULL as \N, everything else quoted and escaped).
+def csv_value(value):
+    if value is None:
+        return "\\N"
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{text}"'
+
+
+
+# Adds a batch to the running row count and prints progress whenever another PROGRESS_INTERVAL rows are done.
+def report_progress(table_name, row_count, batch_rows):
+    new_count = row_count + batch_rows
+    if new_count // PROGRESS_INTERVAL > row_count // PROGRESS_INTERVAL:
+        print(f"  ... {new_count} rows loaded into `{table_name}`")
+    return new_count
+
+
+
+# Returns the throughput in rows per second, guarding against a zero duration.
+def rows_per_second(row_count, elapsed):
+    return row_count / elapsed if elapsed > 0 else 0.0
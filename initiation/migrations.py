@@ -0,0 +1,272 @@
+import argparse
+import sys
+import dotenv
+import os
+dotenv.load_dotenv()
+sys.path.append(os.environ["path"])
+from databaseManager.database_manager import DatabaseManager, DATABASE_NAME
+from initiation.tables_structure import tables, views, procedures
+
+
+
+# Index migrations for databases created before the indexes were added to tables_structure.
+# - Each key is the index name, and the value holds the table, the column list and whether the index is unique.
+# - Unique indexes are preceded by a cleanup query that removes duplicate rows, keeping the oldest one.
+indexes = {
+    "uq_enrollments_course_student": {
+        "table": "courseEnrollments",
+        "columns": "(course_id, student_id)",
+        "unique": True,
+        "deduplicate": """
+            DELETE newer FROM courseEnrollments newer
+            JOIN courseEnrollments older
+              ON newer.course_id = older.course_id
+             AND newer.student_id = older.student_id
+             AND newer.id > older.id
+        """,
+    },
+    "idx_enrollments_student": {
+        "table": "courseEnrollments",
+        "columns": "(student_id)",
+        "unique": False,
+    },
+    "uq_queue_course_student": {
+        "table": "queue",
+        "columns": "(course_id, student_id)",
+        "unique": True,
+        "deduplicate": """
+            DELETE newer FROM queue newer
+            JOIN queue older
+              ON newer.course_id = older.course_id
+             AND newer.student_id = older.student_id
+             AND (newer.registered_at > older.registered_at
+                  OR (newer.registered_at = older.registered_at AND newer.id > older.id))
+        """,
+    },
+    "idx_queue_course_registered": {
+        "table": "queue",
+        "columns": "(course_id, registered_at, id)",
+        "unique": False,
+    },
+    "idx_queue_student": {
+        "table": "queue",
+        "columns": "(student_id)",
+        "unique": False,
+    },
+    "idx_schedules_course_date": {
+        "table": "schedules",
+        "columns": "(course_id, date, time)",
+        "unique": False,
+    },
+}
+
+
+
+# Column migrations for databases created with an older column type.
+# - Each key is "table.column", and the value holds the new column definition and the (precision, scale) it must have.
+columns = {
+    "courseEnrollments.grade": {
+        "definition": "DECIMAL(5, 2)",
+        "numeric": (5, 2),
+    },
+}
+
+
+
+# Tables added after the first release; created by the migration if they are missing.
+new_tables = ["PaymentLedger", "PaymentLedgerMonths"]
+
+
+
+# Hot queries that must be answered through an index.
+# - Each key names the DatabaseManager method, and the value holds the query, sample parameters
+#   and the tables that must not be read with a full table scan.
+hot_queries = {
+    "is_child_registered": {
+        "query": "SELECT COUNT(*) as count FROM CourseEnrollments WHERE course_id = %s AND student_id = %s",
+        "params": (1, 3),
+        "tables": ["CourseEnrollments"],
+    },
+    "fetch_enrollment_count_for_course": {
+        "query": "SELECT COUNT(*) FROM CourseEnrollments WHERE course_id = %s",
+        "params": (1,),
+        "tables": ["CourseEnrollments"],
+    },
+    "is_child_in_waitlist": {
+        "query": "SELECT 1 FROM Queue WHERE course_id = %s AND student_id = %s LIMIT 1",
+        "params": (1, 28),
+        "tables": ["Queue"],
+    },
+    "get_waitlist": {
+        "query": """
+            SELECT Queue.student_id, Users.name AS student_name, Queue.registered_at
+            FROM Queue
+            JOIN users ON Queue.student_id = Users.id
+            WHERE Queue.course_id = %s
+            ORDER BY Queue.registered_at ASC
+        """,
+        "params": (1,),
+        "tables": ["Queue", "users"],
+    },
+    "get_child_position_in_waitlist": {
+        "query": """
+            SELECT qp.position, u.name AS student_name
+            FROM queue_positions qp
+            JOIN users u ON u.id = qp.student_id
+            WHERE qp.course_id = %s AND qp.student_id = %s
+        """,
+        "params": (1, 28),
+        "tables": ["q", "u"],
+    },
+    "fetch_courses_for_student": {
+        "query": """
+            SELECT ce.course_id, c.name AS course_name, s.date AS course_date, s.time AS course_time, cr.name AS class_room_name
+            FROM CourseEnrollments ce
+            JOIN Schedules s ON ce.course_id = s.course_id
+            JOIN Courses c ON ce.course_id = c.id
+            JOIN classRooms cr ON s.class_room_id = cr.id
+            WHERE ce.student_id = %s
+            ORDER BY s.date, s.time
+        """,
+        "params": (3,),
+        "tables": ["ce", "s"],
+    },
+}
+
+
+
+# Checks whether the index, or an index that already covers its columns, exists on a table.
+# - A unique index is covered by a unique index on the same columns; any other index is covered by an index
+#   whose leading columns are its columns (e.g. the index InnoDB created for a foreign key on the column).
+def index_exists(db_manager, table, index_name, index):
+    columns = [column.strip().lower() for column in index["columns"].strip("()").split(",")]
+    with db_manager._cursor() as cursor:
+        cursor.execute("""
+            SELECT index_name, MIN(non_unique), GROUP_CONCAT(LOWER(column_name) ORDER BY seq_in_index)
+            FROM information_schema.statistics
+            WHERE table_schema = %s AND LOWER(table_name) = LOWER(%s)
+            GROUP BY index_name
+        """, (DATABASE_NAME, table))
+        existing = cursor.fetchall()
+    for name, non_unique, indexed_columns in existing:
+        indexed_columns = indexed_columns.split(",")
+        if name == index_name:
+            return True
+        if index["unique"] and not non_unique and indexed_columns == columns:
+            return True
+        if not index["unique"] and indexed_columns[:len(columns)] == columns:
+            return True
+    return False
+
+
+
+# Adds every missing index from `indexes` to an existing database.
+# - Skips indexes that already exist or are covered by another index (see `index_exists`),
+#   so the migration can be run any number of times and never duplicates a foreign-key index.
+# - Removes duplicate rows before adding a unique index and reports how many were deleted.
+# - Returns the names of the indexes that were added.
+def migrate_indexes(db_manager):
+    added = []
+    for index_name, index in indexes.items():
+        table = index["table"]
+        if index_exists(db_manager, table, index_name, index):
+            continue
+        with db_manager._cursor() as cursor:
+            if index["unique"]:
+                cursor.execute(index["deduplicate"])
+                if cursor.rowcount:
+                    print(f"Removed {cursor.rowcount} duplicate rows from `{table}`.")
+                db_manager.conn.commit()
+            kind = "UNIQUE INDEX" if index["unique"] else "INDEX"
+            print(f"Adding {kind.lower()} `{index_name}` to `{table}`...")
+            cursor.execute(f"ALTER TABLE {table} ADD {kind} {index_name} {index['columns']}")
+        added.append(index_name)
+    return added
+
+
+
+# Changes every column in `columns` whose precision and scale differ from the required ones.
+# - Columns that are already up to date are skipped, so the migration can be run any number of times.
+# - Returns the names of the columns that were changed.
+def migrate_columns(db_manager):
+    changed = []
+    for column_name, column in columns.items():
+        table, column_key = column_name.split(".")
+        with db_manager._cursor() as cursor:
+            cursor.execute("""
+                SELECT numeric_precision, numeric_scale FROM information_schema.columns
+                WHERE table_schema = %s AND LOWER(table_name) = LOWER(%s) AND column_name = %s
+            """, (DATABASE_NAME, table, column_key))
+            current = cursor.fetchone()
+            if current is None or tuple(current) == column["numeric"]:
+                continue
+            print(f"Changing `{column_name}` to {column['definition']}...")
+            cursor.execute(f"ALTER TABLE {table} MODIFY {column_key} {column['definition']}")
+        changed.append(column_name)
+    return changed
+
+
+
+# Creates the payment ledger tables if needed and fills them from the existing payments.
+# - The ledger is only backfilled when it is empty and "payments" is not, or when `rebuild` is True;
+#   rebuild while no payments are being added, since the ledger is emptied and refilled.
+# - Returns the number of ledger rows written, or 0 if the ledger was left as it was.
+def migrate_payment_ledger(db_manager, rebuild=False):
+    db_manager.create_tables({table_name: tables[table_name] for table_name in new_tables})
+    with db_manager._cursor() as cursor:
+        cursor.execute("SELECT EXISTS(SELECT 1 FROM payment_ledger_months), EXISTS(SELECT 1 FROM payments)")
+        ledger_filled, has_payments = cursor.fetchone()
+    if rebuild or (has_payments and not ledger_filled):
+        print("Rebuilding the payment ledger...")
+        return db_manager.rebuild_payment_ledger() or 0
+    return 0
+
+
+
+# Runs EXPLAIN on every query in `hot_queries` and collects the ones that scan a whole table.
+# - A row with access type 'ALL' for one of the watched tables means no index was used.
+# - Returns a list of (query name, table) pairs; an empty list means every hot query uses an index.
+def explain_hot_queries(db_manager):
+    full_scans = []
+    for query_name, hot_query in hot_queries.items():
+        with db_manager._cursor(dictionary=True) as cursor:
+            cursor.execute("EXPLAIN " + hot_query["query"], hot_query["params"])
+            plan = cursor.fetchall()
+        watched = {table.lower() for table in hot_query["tables"]}
+        for step in plan:
+            if step["type"] == "ALL" and (step["table"] or "").lower() in watched:
+                full_scans.append((query_name, step["table"]))
+    return full_scans
+
+
+
+# Applies the index and column migrations, adds the payment ledger, (re)creates the views and stored procedures
+# and verifies the hot queries with EXPLAIN.
+# - `rebuild_ledger` recomputes the payment ledger from "payments" even if it is already filled.
+# - Exits with status 1 if any hot query still needs a full table scan.
+def migrationsMain(rebuild_ledger=False):
+    with DatabaseManager() as db_manager:
+        added = migrate_indexes(db_manager)
+        print(f"Indexes added: {', '.join(added) if added else 'none, schema is up to date'}")
+        changed = migrate_columns(db_manager)
+        if changed:
+            print(f"Columns changed: {', '.join(changed)}")
+        ledger_rows = migrate_payment_ledger(db_manager, rebuild_ledger)
+        if ledger_rows:
+            print(f"Payment ledger rebuilt with {ledger_rows} rows.")
+        db_manager.create_views(views)
+        db_manager.create_procedures(procedures)
+        full_scans = explain_hot_queries(db_manager)
+    if full_scans:
+        for query_name, table in full_scans:
+            print(f"Full table scan on `{table}` in {query_name}")
+        sys.exit(1)
+    print("All hot queries use an index.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate an existing database to the current schema.")
+    parser.add_argument("--rebuild-ledger", action="store_true",
+                        help="Recompute the payment ledger from the payments table")
+    args = parser.parse_args()
+    migrationsMain(args.rebuild_ledger)
@@ -0,0 +1,112 @@
+import json
+
+# Size of each read from the seed file, in characters.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+
+# Reads a seed file of the form {"Table": [{...}, {...}], ...} incrementally.
+# - Yields (table name, records) pairs in file order, where `records` is a generator of dictionaries.
+# - Only one record (plus one read chunk) is held in memory at a time, so memory use does not grow with the file.
+# - A table's records must be consumed before moving on; any records left unread are skipped automatically.
+# - Non-array values are yielded as a single-element records generator.
+def iter_seed_tables(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    with open(file_path, 'r', encoding='utf-8') as file:
+        reader = _StreamReader(file, chunk_size)
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            table_name = reader.read_value()
+            reader.expect(":")
+            records = reader.iter_array() if reader.peek() == "[" else iter([reader.read_value()])
+            yield table_name, records
+            # Drain whatever the caller did not read before parsing the next key
+            for _ in records:
+                pass
+            separator = reader.next_char()
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed seed file: expected ',' or '}}' but found {separator!r}")
+
+
+
+# Minimal pull parser over a text file; decodes one JSON value at a time with json.JSONDecoder.raw_decode.
+class _StreamReader:
+    def __init__(self, file, chunk_size):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    # Reads the next chunk into the buffer, dropping everything already consumed; returns False at end of file.
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    # Returns the next non-whitespace character without consuming it (empty string at end of file).
+    def peek(self):
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def next_char(self):
+        char = self.peek()
+        self._pos += len(char)
+        return char
+
+    def expect(self, char):
+        found = self.next_char()
+        if found != char:
+            raise ValueError(f"Malformed seed file: expected {char!r} but found {found!r}")
+
+    # Decodes one complete JSON value, reading more of the file until the value is complete.
+    # - A number followed only by characters that could continue it (e.g. "62." or "1e" at the end of the buffer)
+    #   may have been cut by the chunk boundary, so it is re-read once more data is available.
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+                truncated = (
+                    isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and all(char in _NUMBER_CHARS for char in self._buffer[end:])
+                )
+                if not truncated or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    # Yields the elements of the JSON array starting at the current position, one at a time.
+    def iter_array(self):
+        self.expect("[")
+        if self.peek() == "]":
+            self.next_char()
+            return
+        while True:
+            yield self.read_value()
+            separator = self.next_char()
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Malformed seed file: expected ',' or ']' but found {separator!r}")
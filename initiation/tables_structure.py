@@ -1,6 +1,8 @@
 # Defines the database schema using SQL CREATE TABLE statements.
 # - Each key corresponds to a table name, and the value contains the SQL to create the table.
 # - Includes relationships using foreign keys to enforce referential integrity.
+# - Declares the composite indexes used by the enrollment, waitlist and schedule lookups
+#   (existing databases get them through initiation/migrations.py).
 tables = {
     "Users": """
         CREATE TABLE IF NOT EXISTS users (
@@ -76,7 +78,9 @@ tables = {
             id INT AUTO_INCREMENT PRIMARY KEY,
             course_id INT,
             student_id INT,
-            grade DECIMAL(4, 2),
+            grade DECIMAL(5, 2),
+            UNIQUE KEY uq_enrollments_course_student (course_id, student_id),
+            KEY idx_enrollments_student (student_id),
             FOREIGN KEY (course_id) REFERENCES courses(id),
             FOREIGN KEY (student_id) REFERENCES students(student_id)
         )
@@ -87,6 +91,9 @@ tables = {
             course_id INT,
             student_id INT,
             registered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE KEY uq_queue_course_student (course_id, student_id),
+            KEY idx_queue_course_registered (course_id, registered_at, id),
+            KEY idx_queue_student (student_id),
             FOREIGN KEY (course_id) REFERENCES courses(id),
             FOREIGN KEY (student_id) REFERENCES students(student_id)
         )
@@ -114,6 +121,26 @@ tables = {
             FOREIGN KEY (parent_id) REFERENCES parents(parent_id)
         )
     """,
+    # Payment totals per month and parent, kept up to date by DatabaseManager.add_payment
+    # (backfilled from `payments` by DatabaseManager.rebuild_payment_ledger).
+    "PaymentLedger": """
+        CREATE TABLE IF NOT EXISTS payment_ledger (
+            month CHAR(7) NOT NULL,
+            parent_id INT NOT NULL,
+            total_amount DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            payment_count INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, parent_id),
+            INDEX idx_payment_ledger_parent (parent_id)
+        )
+    """,
+    # Payment totals per month over all parents, maintained together with `payment_ledger`.
+    "PaymentLedgerMonths": """
+        CREATE TABLE IF NOT EXISTS payment_ledger_months (
+            month CHAR(7) PRIMARY KEY,
+            total_amount DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            payment_count INT NOT NULL DEFAULT 0
+        )
+    """,
     "Schedules": """
         CREATE TABLE IF NOT EXISTS schedules (
             id INT AUTO_INCREMENT PRIMARY KEY,
@@ -122,10 +149,84 @@ tables = {
             date DATE NOT NULL,
             time TIME NOT NULL,
             class_room_id INT,
+            KEY idx_schedules_course_date (course_id, date, time),
             FOREIGN KEY (course_id) REFERENCES courses(id),
             FOREIGN KEY (teacher_id) REFERENCES teachers(teacher_id),
             FOREIGN KEY (class_room_id) REFERENCES classRooms(id) ON DELETE SET NULL
 
         )
     """,
-}
\ No newline at end of file
+}
+
+
+# Defines the views used by DatabaseManager.
+# - Each key is the view name, and the value contains the SQL to create or replace it.
+views = {
+    # Ranks every waitlist entry within its course by registration time (ties broken by queue id).
+    # - Filtering on course_id is pushed into the window, so a lookup only walks that course's
+    #   entries in idx_queue_course_registered order, without sorting.
+    "queue_positions": """
+        CREATE OR REPLACE VIEW queue_positions AS
+        SELECT
+            q.id,
+            q.course_id,
+            q.student_id,
+            q.registered_at,
+            ROW_NUMBER() OVER (PARTITION BY q.course_id ORDER BY q.registered_at, q.id) AS position
+        FROM queue q
+    """,
+}
+
+
+
+# Defines the stored procedures used by DatabaseManager.
+# - Each key is the procedure name, and the value contains the SQL to create it.
+# - Procedures are dropped and re-created by DatabaseManager.create_procedures, so edits here reach existing databases.
+procedures = {
+    # Registers a student to a course, or puts them on the waitlist when the course is full, in one locked transaction.
+    # - Locks the course row so concurrent registrations for the same course are serialized.
+    # - Returns one row: status ('enrolled', 'waitlisted', 'already_registered', 'already_waitlisted' or
+    #   'course_not_found'), the waitlist position (or NULL) and the course name.
+    "register_or_enqueue": """
+        CREATE PROCEDURE register_or_enqueue(IN p_student_id INT, IN p_course_id INT)
+        BEGIN
+            DECLARE v_found INT DEFAULT 0;
+            DECLARE v_course_name VARCHAR(255) DEFAULT NULL;
+            DECLARE v_capacity INT DEFAULT NULL;
+            DECLARE v_enrolled INT DEFAULT 0;
+            DECLARE v_status VARCHAR(20);
+            DECLARE v_position INT DEFAULT NULL;
+            DECLARE EXIT HANDLER FOR SQLEXCEPTION
+            BEGIN
+                ROLLBACK;
+                RESIGNAL;
+            END;
+
+            START TRANSACTION;
+            SELECT 1, name, max_capacity INTO v_found, v_course_name, v_capacity
+            FROM courses WHERE id = p_course_id
+            FOR UPDATE;
+
+            IF v_found = 0 THEN
+                SET v_status = 'course_not_found';
+            ELSEIF EXISTS (SELECT 1 FROM courseEnrollments WHERE course_id = p_course_id AND student_id = p_student_id) THEN
+                SET v_status = 'already_registered';
+            ELSEIF EXISTS (SELECT 1 FROM queue WHERE course_id = p_course_id AND student_id = p_student_id) THEN
+                SET v_status = 'already_waitlisted';
+            ELSE
+                SELECT COUNT(*) INTO v_enrolled FROM courseEnrollments WHERE course_id = p_course_id;
+                IF v_enrolled < v_capacity THEN
+                    INSERT INTO courseEnrollments (student_id, course_id) VALUES (p_student_id, p_course_id);
+                    SET v_status = 'enrolled';
+                ELSE
+                    INSERT INTO queue (student_id, course_id) VALUES (p_student_id, p_course_id);
+                    SELECT COUNT(*) INTO v_position FROM queue WHERE course_id = p_course_id;
+                    SET v_status = 'waitlisted';
+                END IF;
+            END IF;
+            COMMIT;
+
+            SELECT v_status AS status, v_position AS position, v_course_name AS course_name;
+        END
+    """,
+}
@@ -47,9 +47,9 @@ def handle_choice (choice):
 def loginMain():
     choice = welcome_page()
     handle_choice(choice)
-    db_manager = DatabaseManager()
     userInput = getUserInput()
-    user = db_manager.get_user(userInput['email'])
+    with DatabaseManager() as db_manager:
+        user = db_manager.get_user(userInput['email'])
 
     if  user is not None:
         current_user = User(
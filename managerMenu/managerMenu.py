@@ -6,7 +6,8 @@ from classes.all_classes import *
 
 # Handles manager menu actions based on user input.
 # 1: Add new user, 2: Create new course, 3: Manage financial reports,
-# 4: Manage waitlists, 5: Manage employee tasks, 6: Logout.
+# 4: Manage waitlists, 5: Manage employee tasks, 6: Add class room, 7: Update password,
+# 8: Promote waitlisted students, 9: Logout.
 # Default: Displays an error message and exits for invalid options.
 def manager_menu(option,current_manager: Manager,db_manager: DatabaseManager):
     match option:
@@ -23,11 +24,13 @@ def manager_menu(option,current_manager: Manager,db_manager: DatabaseManager):
             print("--- Manage Waitlists ---")
             return_to_main = current_manager.manage_waitlists(db_manager)
             if return_to_main:
+                db_manager.close()
                 managerMain(current_manager)
         case 5:
             print("--- Manage Employee Tasks ---")
             return_to_main = current_manager.manage_employee_tasks(db_manager)
             if return_to_main:
+                db_manager.close()
                 managerMain(current_manager)
         case 6:
             print("--- Add New Class Room ---")
@@ -37,6 +40,9 @@ def manager_menu(option,current_manager: Manager,db_manager: DatabaseManager):
             print("--- Update password ---")
             current_manager.update_password(db_manager)        
         case 8:
+            print("--- Promote Waitlisted Students ---")
+            current_manager.promote_waitlisted_students(db_manager)
+        case 9:
             print("--- Logging out ---")
             sys.exit()
 
@@ -48,7 +54,8 @@ def manager_menu(option,current_manager: Manager,db_manager: DatabaseManager):
 
 # Displays a menu of options for managers and returns the user's choice.
 # Options: 1-Add user, 2-Create course, 3-Manage financials,
-# 4-Manage waitlists, 5-Manage tasks, 6-Logout.
+# 4-Manage waitlists, 5-Manage tasks, 6-Add class room, 7-Update password,
+# 8-Promote waitlisted students, 9-Logout.
 def list_options():
     print("1. Add New User")
     print("2. Create New Course")
@@ -57,7 +64,8 @@ def list_options():
     print("5. Manage Employee Tasks")
     print("6. Add New Class Room")
     print("7. update password")
-    print("8. Logout")
+    print("8. Promote Waitlisted Students")
+    print("9. Logout")
     return input("Choose an option: ")
 
 
@@ -65,6 +73,7 @@ def list_options():
 # Main function for manager operations.
 # - Displays menu, initializes database and manager objects.
 # - Passes user choice, manager, and database manager to the menu handler.
+# - Returns the pooled connection once the chosen action is done.
 def managerMain(user):
     db_manager = DatabaseManager()
     current_manager = Manager(
@@ -75,4 +84,7 @@ def managerMain(user):
     )
     current_manager.wait_list_courses_status(db_manager)
     choice = list_options()
-    manager_menu(int(choice),current_manager,db_manager)
\ No newline at end of file
+    try:
+        manager_menu(int(choice),current_manager,db_manager)
+    finally:
+        db_manager.close()
\ No newline at end of file
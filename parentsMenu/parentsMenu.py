@@ -58,4 +58,7 @@ def parentMain(user):
         email=user.email,
         password=user.password
     )
-    parent_menu(int(choice),db_manager,current_parent)
\ No newline at end of file
+    try:
+        parent_menu(int(choice),db_manager,current_parent)
+    finally:
+        db_manager.close()
\ No newline at end of file
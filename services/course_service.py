@@ -0,0 +1,140 @@
+# Service functions for courses, class rooms and schedules.
+from classes.class_room import ClassRoom
+from classes.course import Course
+from classes.schedule import Schedule
+from datetime import datetime, timedelta
+
+
+
+# Parses a course date in YYYY-MM-DD format.
+# - Raises a ValueError if the text is not a valid date.
+def parse_course_date(text):
+    return datetime.strptime(text.strip(), '%Y-%m-%d').date()
+
+
+
+# Parses a course time in HH:MM (24-hour) format.
+# - Raises a ValueError if the text is not a valid time.
+def parse_course_time(text):
+    return datetime.strptime(text.strip(), '%H:%M').time()
+
+
+
+# Creates a course together with its schedule.
+# - Returns the ID of the new course, or None if it could not be created.
+def create_course(db_manager, name, description, teacher_id, class_room_id, max_capacity, course_date, course_time):
+    new_course = Course(
+        name = name,
+        description = description,
+        teacher_id = teacher_id,
+        max_capacity = max_capacity,
+        class_room_id = class_room_id
+    )
+    schedule = Schedule(
+        teacher_id = teacher_id,
+        date = course_date,
+        time = course_time,
+        class_room_id = class_room_id
+    )
+    return db_manager.create_course(new_course, schedule)
+
+
+
+# Returns all class rooms, or an empty list if none could be fetched.
+def list_class_rooms(db_manager):
+    return db_manager.get_class_rooms() or []
+
+
+
+# Creates a class room.
+def add_class_room(db_manager, name, capacity, location):
+    new_class_room = ClassRoom(
+        name = name,
+        capacity = capacity,
+        location = location
+    )
+    return db_manager.create_classroom(new_class_room)
+
+
+
+# Returns the courses taught by a teacher, with their schedule and class room.
+def teacher_courses(db_manager, teacher_id):
+    return db_manager.fetch_courses_for_teacher(teacher_id) or []
+
+
+
+# Returns a student's courses grouped by day of the week: {day name: [course, ...]}.
+def student_schedule(db_manager, student_id):
+    courses = db_manager.fetch_courses_for_student(student_id)
+    if not courses:
+        return {}
+    return group_courses_by_day(courses)
+
+
+
+# Groups courses by the day of the week based on their scheduled date.
+# - Iterates over each course and checks its `course_date`, which can be a datetime or string.
+# - Converts the `course_date` to a `datetime.date` object if it's a string or datetime.
+# - Extracts the day of the week from the date and groups courses by that day.
+# - Stores the grouped courses (course name, time, classroom) in a dictionary, where keys are days of the week.
+# - Returns the dictionary of courses grouped by day.
+def group_courses_by_day(courses):
+    """Group courses by the day of the week."""
+    schedule_by_day = {}
+    for course in courses:
+        try:
+            # Use the course_date directly if it's already a datetime.date object
+            if isinstance(course['course_date'], datetime):
+                course_date = course['course_date'].date()
+            elif isinstance(course['course_date'], str):
+                course_date = datetime.strptime(course['course_date'], '%Y-%m-%d').date()
+            else:
+                course_date = course['course_date']  # Assume it's a datetime.date object
+
+            # Get the day of the week
+            day_of_week = course_date.strftime('%A')
+
+            # Add the course to the respective day
+            if day_of_week not in schedule_by_day:
+                schedule_by_day[day_of_week] = []
+
+            schedule_by_day[day_of_week].append({
+                "course_name": course['course_name'],
+                "course_time": course['course_time'],
+                "class_room_name": course['class_room_name']
+            })
+        except Exception as e:
+            print(f"An error occurred while grouping courses: {e}")
+    return schedule_by_day
+
+
+
+# Formats the course schedule for display in a readable format.
+# - Iterates through the `schedule_by_day` dictionary, which contains courses grouped by day.
+# - For each course, if the course time is a `timedelta`, it converts it to a formatted string in "HH:MM AM/PM" format.
+# - If the course time is invalid, it raises a ValueError.
+# - Adds course details such as name, time, and classroom to the formatted schedule.
+# - The final formatted schedule is returned as a string, with days and courses neatly displayed.
+def format_course_schedule(schedule_by_day):
+    """Format the course schedule for display."""
+    formatted_schedule = "\n"
+    for day, courses in schedule_by_day.items():
+        formatted_schedule += f"{day}:\n"  # Add the day header
+        for course in courses:
+            try:
+                # Convert timedelta to time
+                if isinstance(course['course_time'], timedelta):
+                    total_seconds = course['course_time'].total_seconds()
+                    hours = int(total_seconds // 3600)
+                    minutes = int((total_seconds % 3600) // 60)
+                    # Format the time as AM/PM
+                    time_formatted = datetime.strptime(f"{hours:02}:{minutes:02}", "%H:%M").strftime("%I:%M %p")
+                else:
+                    raise ValueError("Invalid time format")
+
+                # Add formatted course details to the schedule
+                formatted_schedule += f"- {course['course_name']} | {time_formatted} | Room {course['class_room_name']}\n"
+            except Exception as e:
+                print(f"An error occurred while formatting course: {e}")
+        formatted_schedule += "\n"  # Add a blank line between days
+    return formatted_schedule
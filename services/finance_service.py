@@ -0,0 +1,40 @@
+# Service functions for payments and financial reports.
+from classes.payment import Payment
+from datetime import datetime
+
+
+
+# Records a payment made by a parent.
+# - Raises a ValueError if the amount is not greater than zero.
+# - Uses today's date when no payment date is given.
+# - Returns True if the payment was saved, otherwise False.
+def make_payment(db_manager, parent_id, amount, description, payment_date=None):
+    if amount <= 0:
+        raise ValueError("Amount must be greater than zero.")
+    payment_info = Payment(
+        parent_id = parent_id,
+        amount = amount,
+        payment_date = payment_date or datetime.now().strftime('%Y-%m-%d'),
+        description = description
+    )
+    return bool(db_manager.add_payment(payment_info))
+
+
+
+# Builds the financial report: totals, income per month and income per parent, aggregated by the database.
+# - `top_parents` keeps only that many parents who paid the most; by default every parent is listed.
+# - See `DatabaseManager.get_financial_summary` for the returned dictionary; None if it could not be computed.
+def financial_summary(db_manager, top_parents=None):
+    return db_manager.get_financial_summary(top_parents)
+
+
+
+# Streams the individual payments (amount, parent name, description, date) page by page.
+def income_details(db_manager, page_size=1000):
+    return db_manager.iter_payments(page_size)
+
+
+
+# Returns the teacher and employee salary rows as (teacher_salaries, employee_salaries).
+def salary_details(db_manager):
+    return db_manager.get_teachers_salary() or [], db_manager.get_employees_salary() or []
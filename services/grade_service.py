@@ -0,0 +1,90 @@
+# Service functions for grades.
+import csv
+
+# Highest grade; courseEnrollments.grade is DECIMAL(5, 2), so it fits.
+MAX_GRADE = 100
+
+
+
+# Parses a grade entered as text.
+# - Returns None for an empty value (keep the current grade).
+# - Raises a ValueError if the grade is not a number between 0 and MAX_GRADE.
+def parse_grade(text):
+    text = str(text).strip()
+    if not text:
+        return None
+    grade = float(text)
+    if not 0 <= grade <= MAX_GRADE:
+        raise ValueError(f"Grade must be a number between 0 and {MAX_GRADE}.")
+    return grade
+
+
+
+# Returns the students of a course taught by the given teacher, with their current grade.
+# - The list is empty if the course has no students or is not assigned to the teacher.
+def course_students(db_manager, course_id, teacher_id):
+    return db_manager.fetch_students_in_course(course_id, teacher_id) or []
+
+
+
+# Saves the grades of a course in one transaction.
+# - `grades` maps student IDs to grades; None values are skipped.
+# - Returns the number of grades that were saved (0 if the sheet was rolled back).
+def enter_grades(db_manager, course_id, grades):
+    grades = {student_id: grade for student_id, grade in grades.items() if grade is not None}
+    if not grades or not db_manager.set_student_grades(course_id, grades):
+        return 0
+    return len(grades)
+
+
+
+# Reads a grade sheet from a CSV file with a header row containing "student_id" and "grade" columns.
+# - Other columns (e.g. the student's name) are ignored; rows with an empty grade are skipped.
+# - Returns (grades, errors): `grades` maps student IDs to grades, and `errors` lists a message
+#   for every row that could not be read, with its line number.
+def read_grade_sheet(file_path):
+    grades = {}
+    errors = []
+    with open(file_path, newline="", encoding="utf-8-sig") as sheet:
+        reader = csv.DictReader(sheet)
+        if not reader.fieldnames or not {"student_id", "grade"} <= set(reader.fieldnames):
+            raise ValueError("The grade sheet needs a header row with 'student_id' and 'grade' columns.")
+        for row in reader:
+            try:
+                grade = parse_grade(row["grade"] or "")
+                if grade is not None:
+                    grades[int(row["student_id"])] = grade
+            except (TypeError, ValueError) as e:
+                errors.append(f"line {reader.line_num}: {e}")
+    return grades, errors
+
+
+
+# Imports a CSV grade sheet (see `read_grade_sheet`) for a course taught by the given teacher.
+# - Only students enrolled in the course are graded; the others are reported in 'not_enrolled'.
+# - Returns {'graded', 'saved', 'not_enrolled', 'errors'}: 'graded' counts the enrolled students the sheet grades and
+#   'saved' the grades written. Nothing is saved if the course is not assigned to the teacher, if any row of the sheet
+#   is invalid or if the database rejects the sheet.
+def import_grade_sheet(db_manager, course_id, teacher_id, file_path):
+    grades, errors = read_grade_sheet(file_path)
+    enrolled = {student['student_id'] for student in course_students(db_manager, course_id, teacher_id)}
+    not_enrolled = sorted(student_id for student_id in grades if student_id not in enrolled)
+    grades = {student_id: grade for student_id, grade in grades.items() if student_id in enrolled}
+    if errors or not enrolled:
+        return {"graded": len(grades), "saved": 0, "not_enrolled": not_enrolled, "errors": errors}
+    return {"graded": len(grades), "saved": enter_grades(db_manager, course_id, grades),
+            "not_enrolled": not_enrolled, "errors": errors}
+
+
+
+# Returns a student's courses and grades; a missing grade is reported as "In Progress".
+def student_grades(db_manager, student_id):
+    grades = db_manager.fetch_grades(student_id) or []
+    return [
+        {
+            "course_id": course['course_id'],
+            "course_name": course['course_name'],
+            "grade": "In Progress" if course['grade'] is None else course['grade']
+        }
+        for course in grades
+    ]
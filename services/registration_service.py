@@ -0,0 +1,144 @@
+# Service functions for course registration, waitlists and children's progress.
+from classes.courses_enrollments import CourseEnrollment
+import time
+
+# Waitlists at least this long are reported as needing another course section.
+OVERSUBSCRIBED_THRESHOLD = 5
+
+
+
+# Registers a child to a course, or adds them to the waitlist when the course is full.
+# - Returns the outcome dictionary of `DatabaseManager.register_or_enqueue`
+#   ({'status', 'position', 'course_name'}), or None if the registration failed.
+def register_child(db_manager, child_id, course_id):
+    return db_manager.register_or_enqueue(child_id, course_id)
+
+
+
+# Returns a child's waitlist position and name for a course, or None if the child is not waiting for it.
+def waitlist_position(db_manager, child_id, course_id):
+    return db_manager.get_child_position_in_waitlist(child_id, course_id)
+
+
+
+# Returns the progress report of every child of a parent, or None if the parent has no children.
+# - See `build_student_progress` for the format of the report.
+def children_progress(db_manager, parent_id):
+    students = db_manager.get_students_by_parent_id(parent_id)
+    if not students:
+        return None
+    student_ids = [student['student_id'] for student in students]
+    enrollments = db_manager.get_course_enrollments(student_ids)
+    waitlists = db_manager.get_waitlist_status(student_ids)
+    return build_student_progress(students, enrollments, waitlists)
+
+
+
+# Combines student data with course enrollments and waitlist status to build a progress report.
+# - Groups the enrollments and waitlist entries by student ID in one pass each, then looks up every student's
+#   courses in the groups, so the work grows linearly with the number of students and rows.
+# - Adds course names and grades for enrolled courses, and marks the course as "Waitlist" if the student is in the waitlist.
+# - Compiles the student’s name along with their courses and status (enrolled or waitlisted) into a dictionary.
+# - Returns a list of dictionaries containing each student's progress data, in the order of `students`.
+def build_student_progress(students, enrollments, waitlists):
+    """Combine student data with course enrollments and waitlist status."""
+    courses_by_student = {}
+
+    # Add course enrollments
+    for enrollment in enrollments:
+        courses_by_student.setdefault(enrollment['student_id'], []).append({
+            "course_name": enrollment['course_name'],
+            "grade": enrollment.get('grade')
+        })
+
+    # Add waitlist courses
+    for waitlist in waitlists:
+        courses_by_student.setdefault(waitlist['student_id'], []).append({
+            "course_name": waitlist['course_name'],
+            "status": "Waitlist"
+        })
+
+    progress = []
+    for student in students:
+        progress.append({
+            "student_name": student['student_name'],
+            "courses": list(courses_by_student.get(student['student_id'], []))
+        })
+
+    return progress
+
+
+
+# Streams the progress report of every family, or of the given parents, as (parent_id, progress) pairs.
+# - All families are read with a single streaming query (see `DatabaseManager.iter_family_progress`), so a batch job
+#   can report on thousands of families while holding only one family in memory.
+# - Families without children are skipped; see `build_student_progress` for the format of the report.
+def families_progress(db_manager, parent_ids=None, batch_size=500):
+    for parent_id, students, enrollments, waitlists in db_manager.iter_family_progress(parent_ids, batch_size):
+        yield parent_id, build_student_progress(students, enrollments, waitlists)
+
+
+
+# Returns a course and its waitlist in registration order as (course, waitlist).
+# - `waitlist` is streamed from the server in batches of `batch_size`; iterate it before running other queries.
+# - `course` is None if the course does not exist; `waitlist` is then an empty list.
+def course_waitlist(db_manager, course_id, batch_size=500):
+    course = db_manager.get_course(course_id)
+    if not course:
+        return None, []
+    return course, db_manager.iter_waitlist(course_id, batch_size)
+
+
+
+# Moves the first student of a course's waitlist into the course.
+# - The enrollment and the removal from the waitlist are committed together (see `DatabaseManager.transaction`),
+#   so the student is never both enrolled and waiting, or neither.
+# - Returns the promoted waitlist entry, or None if the waitlist is empty; a database error is raised to the caller.
+def assign_first_from_waitlist(db_manager, course_id):
+    waitlist = db_manager.get_waitlist_page(course_id, page_size=1)
+    if not waitlist:
+        return None
+    student = waitlist[0]
+    course_enrollment = CourseEnrollment(
+        student_id = student['student_id'],
+        course_id = course_id
+    )
+    with db_manager.transaction():
+        db_manager.insert_child_to_course(course_enrollment)
+        db_manager.remove_student_from_waitlist(student['student_id'], course_id)
+    return student
+
+
+
+# Fills the free seats of every course (or only `course_ids`) from their waitlists in FIFO order, in one transaction.
+# - See `DatabaseManager.promote_waitlisted` for how the seats and students are chosen.
+# - Returns {'promoted', 'seconds', 'per_second'}: the promoted waitlist entries (None if the promotion failed
+#   and was rolled back), the time it took and the number of students moved per second.
+def promote_waitlists(db_manager, course_ids=None):
+    started = time.perf_counter()
+    promoted = db_manager.promote_waitlisted(course_ids)
+    seconds = time.perf_counter() - started
+    return {
+        "promoted": promoted,
+        "seconds": seconds,
+        "per_second": len(promoted) / seconds if promoted and seconds else 0.0
+    }
+
+
+
+# Removes the first student from a course's waitlist.
+# - Returns the removed waitlist entry, or None if the waitlist is empty.
+def remove_first_from_waitlist(db_manager, course_id):
+    waitlist = db_manager.get_waitlist_page(course_id, page_size=1)
+    if not waitlist:
+        return None
+    student = waitlist[0]
+    db_manager.remove_student_from_waitlist(student['student_id'], course_id)
+    return student
+
+
+
+# Streams the courses whose waitlist has at least `threshold` students, longest waitlist first.
+# - The threshold is applied by the database, so only the oversubscribed courses are transferred.
+def oversubscribed_courses(db_manager, threshold=OVERSUBSCRIBED_THRESHOLD):
+    return db_manager.iter_waitlist_course_status(threshold)
@@ -0,0 +1,54 @@
+# Service functions for maintenance tasks.
+from classes.task import Task
+
+TASK_STATUSES = ("Pending", "In Progress", "Completed")
+
+
+
+# Reports an issue in a class room as a new "Pending" task.
+# - Assigns the task to `employee_id` when one is given; the task and its assignment are committed together
+#   (see `DatabaseManager.transaction`), so a failed assignment leaves no unassigned task behind.
+# - Returns the ID of the new task; a database error is raised to the caller.
+def create_task(db_manager, description, class_room_id, employee_id=None):
+    new_issue = Task(
+        description = description,
+        status = "Pending",
+        class_room_id = class_room_id
+    )
+    with db_manager.transaction():
+        task_id = db_manager.create_task_issue(new_issue)
+        if employee_id:
+            db_manager.assign_task_to_employee(employee_id, task_id)
+    return task_id
+
+
+
+# Returns all tasks with the name of the assigned employee.
+def list_tasks(db_manager):
+    return db_manager.get_all_tasks() or []
+
+
+
+# Streams all tasks with the name of the assigned employee, in task ID order.
+# - Rows are read from the server in batches of `batch_size`, so long task lists are never held in memory.
+def iter_tasks(db_manager, batch_size=500):
+    return db_manager.iter_tasks(batch_size)
+
+
+
+# Returns the tasks assigned to an employee.
+def employee_tasks(db_manager, employee_id):
+    return db_manager.fetch_all_employee_tasks(employee_id) or []
+
+
+
+# Checks whether a task is assigned to the given employee.
+def is_task_assigned(db_manager, task_id, employee_id):
+    return bool(db_manager.check_task_assignee(task_id, employee_id))
+
+
+
+# Updates the status of a task.
+# - Returns True if the status was updated, otherwise False.
+def update_task_status(db_manager, task_id, status):
+    return bool(db_manager.update_task_status(task_id, status))
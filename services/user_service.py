@@ -0,0 +1,18 @@
+# Service functions for user accounts.
+
+
+
+# Saves a new user (an instance of User or one of its role subclasses) with its role-specific details.
+# - Returns the ID of the new user, or None if it could not be created.
+def add_user(db_manager, user):
+    return db_manager.create_user(user)
+
+
+
+# Changes a user's password after checking the old one.
+# - Returns True if the password was changed, or False if the old password does not match.
+def change_password(db_manager, user_id, current_password, old_password, new_password):
+    if old_password != current_password:
+        return False
+    db_manager.update_user_password(user_id, new_password)
+    return True
@@ -49,4 +49,7 @@ def studentMain(user):
         email=user.email,
         password=user.password
     )
-    student_menu(int(choice),current_student,db_manager)
\ No newline at end of file
+    try:
+        student_menu(int(choice),current_student,db_manager)
+    finally:
+        db_manager.close()
\ No newline at end of file
@@ -55,4 +55,7 @@ def teacherMain(user):
         email=user.email,
         password=user.password
     )
-    teacher_menu(int(choice),current_teacher,db_manager)
\ No newline at end of file
+    try:
+        teacher_menu(int(choice),current_teacher,db_manager)
+    finally:
+        db_manager.close()
\ No newline at end of file
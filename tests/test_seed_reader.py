@@ -0,0 +1,42 @@
+# Tests for initiation/seed_reader.py: the streamed seed file must parse exactly like json.load,
+# whatever the chunk boundaries are.
+# Usage: python -m pytest tests
+import json
+import os
+import sys
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_DIR)
+from initiation.seed_reader import iter_seed_tables
+
+SEED_FILE = os.path.join(PROJECT_DIR, "initiation", "dummy-data.json")
+
+
+
+# Reads a seed file with iter_seed_tables into {table: [records]}, like json.load does (non-arrays become one record).
+def read_streamed(file_path, chunk_size):
+    return {table_name: list(records) for table_name, records in iter_seed_tables(file_path, chunk_size)}
+
+
+
+def read_loaded(file_path):
+    with open(file_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return {table_name: value if isinstance(value, list) else [value] for table_name, value in data.items()}
+
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_seed_file_matches_json_load(chunk_size):
+    assert read_streamed(SEED_FILE, chunk_size) == read_loaded(SEED_FILE)
+
+
+
+# Numbers split by a chunk boundary ("62." + "98", "1" + "e5") must not be cut short.
+@pytest.mark.parametrize("chunk_size", range(1, 17))
+def test_numbers_across_chunks(tmp_path, chunk_size):
+    seed_file = tmp_path / "numbers.json"
+    seed_file.write_text('{"a": [62.98, 1e5, 1.5E-3, -7, 0.25, true, null, "x"], "b": 12.5e-1, "c": []}', encoding="utf-8")
+    assert read_streamed(seed_file, chunk_size) == read_loaded(seed_file)